@@ -0,0 +1,60 @@
+"""add stock_balance
+
+Revision ID: 3f1c2a9d7b10
+Revises: 65076f4f57da
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7b10'
+down_revision: Union[str, None] = '65076f4f57da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stock_balance',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('batch_id', sa.Integer(), nullable=True),
+    sa.Column('base_unit', sa.String(length=16), nullable=False),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['batch_id'], ['batch.id'], ),
+    sa.ForeignKeyConstraint(['item_id'], ['item.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_stock_balance_id'), 'stock_balance', ['id'], unique=False)
+    op.create_index(
+        'uq_stock_balance_key',
+        'stock_balance',
+        ['item_id', sa.text('coalesce(batch_id, 0)'), 'base_unit'],
+        unique=True,
+    )
+    # seed balances from the existing ledger
+    op.execute(
+        """
+        INSERT INTO stock_balance (item_id, batch_id, base_unit, quantity, updated_at)
+        SELECT item_id, batch_id, base_unit,
+               SUM(CASE WHEN txn_type = 'IN' THEN base_qty
+                        WHEN txn_type = 'OUT' THEN -base_qty
+                        ELSE 0 END),
+               now()
+        FROM inventory_txn
+        GROUP BY item_id, batch_id, base_unit
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_stock_balance_key', table_name='stock_balance')
+    op.drop_index(op.f('ix_stock_balance_id'), table_name='stock_balance')
+    op.drop_table('stock_balance')
@@ -0,0 +1,84 @@
+"""add sync_tombstone and (updated_at, id) indexes for delta sync
+
+Revision ID: 5d8f3b1e9a47
+Revises: e2a9c7d4b6f1
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8f3b1e9a47'
+down_revision: Union[str, None] = 'e2a9c7d4b6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns)
+INDEXES = [
+    ('ix_item_updated', 'item', ['updated_at', 'id']),
+    ('ix_batch_updated', 'batch', ['updated_at', 'id']),
+    ('ix_order_updated', 'order', ['updated_at', 'id']),
+    ('ix_dispatch_entry_updated', 'dispatch_entry', ['updated_at', 'id']),
+    ('ix_stockentry_updated', 'stockentry', ['updated_at', 'id']),
+]
+# superseded by the composite indexes above
+REPLACED = [
+    ('ix_dispatch_entry_updated_at', 'dispatch_entry', ['updated_at']),
+    ('ix_stockentry_updated_at', 'stockentry', ['updated_at']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sync_tombstone',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('table_name', sa.String(length=64), nullable=False),
+    sa.Column('record_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_sync_tombstone_deleted', 'sync_tombstone', ['deleted_at', 'id'], unique=False)
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in REPLACED:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.drop_index('ix_sync_tombstone_deleted', table_name='sync_tombstone')
+    op.drop_table('sync_tombstone')
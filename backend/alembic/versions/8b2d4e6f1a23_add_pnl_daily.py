@@ -0,0 +1,47 @@
+"""add pnl_daily and refresh_watermark
+
+Revision ID: 8b2d4e6f1a23
+Revises: 3f1c2a9d7b10
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2d4e6f1a23'
+down_revision: Union[str, None] = '3f1c2a9d7b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pnl_daily',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('mart_name', sa.String(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('total_sales', sa.Float(), nullable=False),
+    sa.Column('total_purchase', sa.Float(), nullable=False),
+    sa.Column('profit', sa.Float(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('date', 'mart_name', name='uq_pnl_daily_date_mart')
+    )
+    op.create_index(op.f('ix_pnl_daily_id'), 'pnl_daily', ['id'], unique=False)
+    op.create_table('refresh_watermark',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('watermark', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # the first refresh finds no watermark and rebuilds pnl_daily in full
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('refresh_watermark')
+    op.drop_index(op.f('ix_pnl_daily_id'), table_name='pnl_daily')
+    op.drop_table('pnl_daily')
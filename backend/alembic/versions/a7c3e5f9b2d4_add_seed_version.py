@@ -0,0 +1,34 @@
+"""add seed_version
+
+Revision ID: a7c3e5f9b2d4
+Revises: 5d8f3b1e9a47
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f9b2d4'
+down_revision: Union[str, None] = '5d8f3b1e9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('seed_version',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('applied_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # the next seed run finds no fingerprint and applies the seeds once
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('seed_version')
@@ -0,0 +1,77 @@
+"""add composite and partial indexes for service queries
+
+Revision ID: c4e7a1b9d2f5
+Revises: 8b2d4e6f1a23
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a1b9d2f5'
+down_revision: Union[str, None] = '8b2d4e6f1a23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial predicate, covered columns)
+INDEXES = [
+    ('ix_batch_item_received', 'batch', ['item_id', 'received_at'], None, None),
+    ('ix_batch_item_created', 'batch', ['item_id', 'created_at'], None, None),
+    ('ix_batch_in_stock', 'batch', ['item_id', 'created_at'], 'quantity > 0', None),
+    ('ix_dispatch_entry_item_mart_date', 'dispatch_entry', ['item_id', 'mart_name', 'dispatch_date'], None, None),
+    ('ix_dispatch_entry_date_mart', 'dispatch_entry', ['dispatch_date', 'mart_name'], None, None),
+    ('ix_dispatch_entry_created_at', 'dispatch_entry', ['created_at'], None, None),
+    ('ix_dispatch_entry_updated_at', 'dispatch_entry', ['updated_at'], None, None),
+    ('ix_order_open', 'order', ['item_id', 'mart_name'], "status <> 'Completed'", None),
+    ('ix_order_date_mart', 'order', ['order_date', 'mart_name'], None, None),
+    ('ix_inventory_txn_item_created', 'inventory_txn', ['item_id', 'created_at'], None, None),
+    ('ix_invoice_item_invoice_id', 'invoice_item', ['invoice_id'], None, None),
+    ('ix_invoice_item_store_date', 'invoice_item', ['store_name', 'invoice_date'], None, None),
+    ('ix_invoice_item_invoice_date', 'invoice_item', ['invoice_date'], None, None),
+    ('ix_invoice_item_updated_at', 'invoice_item', ['updated_at'], None, None),
+    ('ix_invoice_mart_date', 'invoice', ['mart_name', 'invoice_date'], None, None),
+    ('ix_invoice_invoice_date', 'invoice', ['invoice_date'], None, None),
+    ('ix_stockentry_batch_price', 'stockentry', ['batch_id'], None, ['price_per_unit', 'quantity']),
+    ('ix_stockentry_received_date', 'stockentry', ['received_date'], None, None),
+    ('ix_stockentry_updated_at', 'stockentry', ['updated_at'], None, None),
+    ('ix_rejection_entries_date', 'rejection_entries', ['rejection_date'], None, None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY on Postgres so live tables keep taking writes; it cannot
+    # run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, where, include in INDEXES:
+            predicate = sa.text(where) if where else None
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=predicate,
+                sqlite_where=predicate,
+                postgresql_include=include or [],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        if op.get_bind().dialect.name == 'postgresql':
+            for table in sorted({table for _, table, _, _, _ in INDEXES}):
+                op.execute(f'ANALYZE "{table}"')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
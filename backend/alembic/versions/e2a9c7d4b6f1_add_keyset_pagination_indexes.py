@@ -0,0 +1,69 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: e2a9c7d4b6f1
+Revises: c4e7a1b9d2f5
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a9c7d4b6f1'
+down_revision: Union[str, None] = 'c4e7a1b9d2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns)
+INDEXES = [
+    ('ix_batch_created', 'batch', ['created_at', 'id']),
+    ('ix_dispatch_entry_created', 'dispatch_entry', ['created_at', 'id']),
+    ('ix_stockentry_created', 'stockentry', ['created_at', 'id']),
+    ('ix_order_created', 'order', ['created_at', 'id']),
+    ('ix_rejection_entries_created', 'rejection_entries', ['created_at', 'id']),
+    ('ix_invoice_created', 'invoice', ['created_at', 'id']),
+    ('ix_audit_log_timestamp', 'audit_log', ['timestamp', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        # superseded by ix_dispatch_entry_created
+        op.drop_index(
+            'ix_dispatch_entry_created_at',
+            table_name='dispatch_entry',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_dispatch_entry_created_at',
+            'dispatch_entry',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -15,6 +15,8 @@ from app.api.reports import router as reports_router
 from app.api.item_alias import router as item_alias_router
 from app.api.uom import router as uom_router
 from app.api.inventory_txn import router as inventory_txn_router
+from app.api.sync import router as sync_router
+from app.api.database import router as database_router
 
 
 router = APIRouter(prefix="/v1")
@@ -35,3 +37,5 @@ router.include_router(reports_router)
 router.include_router(item_alias_router)
 router.include_router(uom_router)
 router.include_router(inventory_txn_router)
+router.include_router(sync_router)
+router.include_router(database_router)
@@ -4,28 +4,48 @@ Provides retrieval of audit log entries.
 """
 
 import logging
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.audit_log import AuditLogRead
 from app.services.audit_log import get_all_audit_logs
-from app.db.session import get_db
+from app.db.session import get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
 
 
 @router.get("/", response_model=List[AuditLogRead])
-def read_logs(db: Session = Depends(get_db)) -> List[AuditLogRead]:
+async def read_logs(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
+) -> List[AuditLogRead]:
     """
-    Retrieve all audit logs.
+    Retrieve a page of audit logs, newest first.
 
     Args:
-        db (Session): Database session dependency.
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all entries, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[AuditLogRead]: List of audit log entries.
     """
-    logger.info("Fetching all audit logs")
-    return get_all_audit_logs(db)
+    logger.info(f"Fetching audit logs cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db,
+        get_all_audit_logs,
+        cursor=cursor,
+        limit=limit,
+        count=count,
+        schema=AuditLogRead,
+    )
+    set_page_headers(response, page)
+    return page.items
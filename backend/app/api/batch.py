@@ -4,11 +4,13 @@ Provides CRUD operations for batches, including creation, retrieval, update, and
 """
 
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.exceptions import AppException
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.batch import BatchCreate, BatchRead, BatchUpdate
 from app.services.batch import (
     create_batch,
@@ -18,7 +20,7 @@ from app.services.batch import (
     update_batch,
     delete_batch,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 from app.core.auth import get_current_user
 from app.db.models.user import User
 
@@ -36,52 +38,68 @@ def create(
     Create a new batch entry.
     """
     logger.info(f"Creating new batch by {current_user.username}")
-    return create_batch(db=db, entry=entry, created_by=current_user.username)
+    return create_batch(db=db, batch=entry, created_by=current_user.username)
 
 
 @router.get("/", response_model=List[BatchRead])
-def read_all(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+async def read_all(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[BatchRead]:
     """
-    Get all batch entries.
+    Get a page of batch entries, newest first.
 
     Args:
-        skip (int): Number of records to skip.
-        limit (int): Maximum number of records to return.
-        db (Session): Database session dependency.
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all batches, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[BatchRead]: List of batch objects.
     """
-    logger.info(f"Fetching batches skip={skip}, limit={limit}")
-    return get_all_batches(db=db, skip=skip, limit=limit)
+    logger.info(f"Fetching batches cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db, get_all_batches, cursor=cursor, limit=limit, count=count, schema=BatchRead
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get("/by-item/{item_id}", response_model=List[BatchRead])
-def get_batches_by_item(item_id: int, db: Session = Depends(get_db)) -> List[BatchRead]:
+async def get_batches_by_item(
+    item_id: int, db: AsyncSession = Depends(get_async_db)
+) -> List[BatchRead]:
     """
     Get batches for a specific item with available quantity.
 
     Args:
         item_id (int): The ID of the item.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[BatchRead]: List of batch objects for the item.
     """
     logger.info(f"Fetching batches for item_id={item_id}")
-    return get_batches_by_item_with_quantity(db, item_id)
+    return await run_read(
+        db, get_batches_by_item_with_quantity, item_id, schema=BatchRead
+    )
 
 
 @router.get("/{batch_id}", response_model=BatchRead)
-def read_one(batch_id: int, db: Session = Depends(get_db)) -> BatchRead:
+async def read_one(
+    batch_id: int, db: AsyncSession = Depends(get_async_db)
+) -> BatchRead:
     """
     Get a batch by ID.
 
     Args:
         batch_id (int): The ID of the batch to retrieve.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         BatchRead: The batch object.
@@ -90,7 +108,7 @@ def read_one(batch_id: int, db: Session = Depends(get_db)) -> BatchRead:
         AppException: If the batch is not found (404).
     """
     logger.info(f"Fetching batch_id={batch_id}")
-    batch = get_batch(db=db, batch_id=batch_id)
+    batch = await run_read(db, get_batch, batch_id=batch_id, schema=BatchRead)
     if not batch:
         logger.error(f"Batch not found: batch_id={batch_id}")
         raise AppException("Batch not found", status_code=404)
@@ -0,0 +1,63 @@
+"""
+API endpoints for database monitoring: connection pool metrics and the
+repeated-statement (N+1) report.
+"""
+
+import logging
+import os
+from fastapi import APIRouter, Depends
+from typing import Dict, List
+
+from app.core.auth import get_current_admin
+from app.core.config import settings
+from app.core.instrumentation import repeated_statement_report
+from app.db.models.user import User
+from app.db.pool_metrics import get_pool_stats
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/db", tags=["Database"])
+
+
+@router.get("/pool", summary="Connection pool metrics")
+def pool_stats(admin: User = Depends(get_current_admin)) -> dict:
+    """
+    Report pool settings, current usage and checkout/lifetime histograms.
+
+    Numbers are per API worker process (see `pid`); multiply by the
+    uvicorn worker count when sizing against Postgres max_connections.
+
+    Args:
+        admin (User): Authenticated admin user.
+
+    Returns:
+        dict: Worker pid, pool settings and metrics per engine.
+    """
+    return {
+        "pid": os.getpid(),
+        "settings": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pre_ping": settings.DB_POOL_PRE_PING,
+        },
+        "engines": get_pool_stats(),
+    }
+
+
+@router.get("/repeated-statements", summary="N+1 query report")
+def repeated_statements(admin: User = Depends(get_current_admin)) -> List[Dict]:
+    """
+    Per route, the most statements and the most repeats of one statement
+    shape seen in a single request by this worker, worst first.
+
+    Collected only while N_PLUS_ONE_THRESHOLD is set (development and CI).
+
+    Args:
+        admin (User): Authenticated admin user.
+
+    Returns:
+        List[Dict]: method, route, requests, max_statements, max_repeats
+        and the repeated statement shape.
+    """
+    return repeated_statement_report()
@@ -5,13 +5,15 @@ Provides CRUD operations and batch dispatch creation from orders.
 
 import logging
 from datetime import date
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.auth import get_current_user
 from app.core.exceptions import AppException
 from app.db.models.user import User
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.dispatch_entry import (
     DispatchEntryCreate,
     DispatchEntryRead,
@@ -26,7 +28,7 @@ from app.services.dispatch_entry import (
     delete_dispatch_entry,
     create_dispatch_from_order,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/dispatch-entries", tags=["Dispatch Entries"])
@@ -84,44 +86,55 @@ def dispatch_from_order(
 
 
 @router.get("/", response_model=List[DispatchEntryRead])
-def read_all(
-    skip: int = 0,
-    limit: int = 100,
+async def read_all(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
     dispatch_date: Optional[date] = Query(None),
     mart_name: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[DispatchEntryRead]:
     """
-    Retrieve all dispatch entries with optional filters.
+    Retrieve a page of dispatch entries with optional filters, newest first.
 
     Args:
-        skip (int): Number of records to skip.
-        limit (int): Maximum number of records to return.
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all matches, exactly or estimated.
         dispatch_date (Optional[date]): Filter by dispatch date.
         mart_name (Optional[str]): Filter by mart name.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[DispatchEntryRead]: List of dispatch entries.
     """
-    logger.info(f"Fetching dispatch entries skip={skip}, limit={limit}")
-    return get_all_dispatch_entries(
-        db=db,
-        skip=skip,
+    logger.info(f"Fetching dispatch entries cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db,
+        get_all_dispatch_entries,
+        cursor=cursor,
         limit=limit,
         dispatch_date=dispatch_date,
         mart_name=mart_name,
+        count=count,
+        schema=DispatchEntryRead,
     )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get("/{id}", response_model=DispatchEntryRead)
-def read_one(id: int, db: Session = Depends(get_db)) -> DispatchEntryRead:
+async def read_one(
+    id: int, db: AsyncSession = Depends(get_async_db)
+) -> DispatchEntryRead:
     """
     Retrieve a single dispatch entry by ID.
 
     Args:
         id (int): Dispatch entry ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         DispatchEntryRead: The dispatch entry.
@@ -130,7 +143,7 @@ def read_one(id: int, db: Session = Depends(get_db)) -> DispatchEntryRead:
         AppException: If the entry is not found (404).
     """
     logger.info(f"Fetching dispatch entry id={id}")
-    entry = get_dispatch_entry(db, id)
+    entry = await run_read(db, get_dispatch_entry, id, schema=DispatchEntryRead)
     if not entry:
         logger.error(f"Dispatch entry not found: id={id}")
         raise AppException("Dispatch entry not found", status_code=404)
@@ -3,126 +3,230 @@ API endpoints for invoice management.
 Provides upload, retrieval, update, deletion, and download of invoices.
 """
 
+import asyncio
+import json
 import logging
-from operator import or_
 import os
 from fastapi import APIRouter, Depends, Query, UploadFile, File, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from fastapi.responses import FileResponse, JSONResponse
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from datetime import date
 
+from app.core.auth import get_current_admin
 from app.core.exceptions import AppException
 from app.services.invoice import (
-    save_and_process_invoice,
+    discard_spool,
+    process_spooled_invoice,
+    spool_upload,
     get_invoice_by_id,
     get_all_invoices,
     update_invoice,
     delete_invoice,
 )
+from app.db.pagination import CountMode
 from app.db.schemas.invoice import InvoiceRead, InvoiceUpdate
-from app.db.session import get_db
-from app.db.models.invoice import Invoice
+from app.db.session import SessionLocal, get_db, get_async_db, run_read
+from app.db.models.user import User
+from app.utils.invoice_parse_cache import get_parse_cache_stats, purge_parse_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/invoices", tags=["Invoices"])
 
+# files still processing after their client went away; the event loop
+# only keeps weak references to tasks
+_orphaned_uploads: Set[asyncio.Task] = set()
+
 
 @router.post(
     "/upload",
     status_code=status.HTTP_201_CREATED,
     summary="Upload invoice PDFs",
-    description="Uploads one or more invoice PDF files and processes them.",
+    description=(
+        "Uploads one or more invoice PDF files and processes them. Files are "
+        "parsed in parallel; with stream=true each result is sent as an NDJSON "
+        "line as soon as its file finishes."
+    ),
 )
 async def upload_invoices(
     files: List[UploadFile] = File(..., description="One or more PDF files"),
-    db: Session = Depends(get_db),
-) -> List[dict]:
+    stream: bool = Query(False, description="Stream per-file results as NDJSON"),
+):
     """
     Upload and process multiple invoice PDFs.
 
     Args:
         files (List[UploadFile]): List of PDF files to upload.
-        db (Session): Database session dependency.
+        stream (bool): Stream results as they complete instead of one list.
 
     Returns:
-        List[dict]: Processing results for each file.
+        List[dict] | StreamingResponse: Processing results for each file,
+        in completion order.
     """
     logger.info(f"Uploading {len(files)} invoice file(s)")
-    results = []
+    # spool everything to disk up front: form files are closed once this
+    # handler returns
+    uploads = []
     for file in files:
-        if not file.filename.endswith(".pdf"):
-            logger.warning(f"Skipped non-PDF file: {file.filename}")
-            results.append(
-                {"filename": file.filename, "success": False, "error": "Not a PDF"}
-            )
+        if file.filename.endswith(".pdf"):
+            uploads.append((file.filename, *await spool_upload(file)))
+        else:
+            uploads.append((file.filename, None, None))
+    if stream:
+
+        async def ndjson():
+            async for result in _process_uploads(uploads):
+                yield json.dumps(result, default=str) + "\n"
+
+        return StreamingResponse(
+            ndjson(),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/x-ndjson",
+        )
+    return [result async for result in _process_uploads(uploads)]
+
+
+async def _process_uploads(
+    uploads: List[Tuple[str, Optional[str], Optional[str]]]
+) -> AsyncIterator[dict]:
+    """
+    Process all uploaded files concurrently, yielding each result as it completes.
+
+    Files still processing when the client goes away are left to finish:
+    cancelling one would close its session on the event loop while a
+    threadpool worker is still using it.
+    """
+    tasks = []
+    for filename, spool_path, file_hash in uploads:
+        if spool_path is None:
+            logger.warning(f"Skipped non-PDF file: {filename}")
+            yield {"filename": filename, "success": False, "error": "Not a PDF"}
             continue
-        result = await save_and_process_invoice(file, db=db, created_by="system")
-        results.append(result)
-    return results
+        tasks.append(asyncio.create_task(_process_one(filename, spool_path, file_hash)))
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            if not task.done():
+                _orphaned_uploads.add(task)
+                task.add_done_callback(_orphaned_uploads.discard)
+
+
+async def _process_one(filename: str, spool_path: str, file_hash: str) -> dict:
+    # one session per file: the database work of concurrent files runs on
+    # separate threadpool workers
+    db = SessionLocal()
+    try:
+        return await process_spooled_invoice(
+            filename, spool_path, file_hash, db=db, created_by="system"
+        )
+    except AppException as e:
+        return {"filename": filename, "success": False, "error": e.message}
+    except Exception:
+        # one broken file (database, disk or parse pool error) must not
+        # abort the others
+        logger.exception(f"Failed to process invoice file '{filename}'")
+        return {"filename": filename, "success": False, "error": "Invoice processing failed"}
+    finally:
+        db.close()
+        # left behind when processing failed before the file was stored
+        discard_spool(spool_path)
+
+
+@router.get("/parse-cache", summary="Invoice parse cache statistics")
+def parse_cache_stats(admin: User = Depends(get_current_admin)) -> dict:
+    """
+    Report the size of the on-disk invoice parse cache.
+
+    Args:
+        admin (User): Authenticated admin user.
+
+    Returns:
+        dict: Entry count, total size and size limit in bytes.
+    """
+    return get_parse_cache_stats()
+
+
+@router.delete("/parse-cache", summary="Purge invoice parse cache")
+def purge_parse_cache_route(admin: User = Depends(get_current_admin)) -> dict:
+    """
+    Delete all cached invoice parse results.
+
+    Args:
+        admin (User): Authenticated admin user.
+
+    Returns:
+        dict: Number of entries removed.
+    """
+    logger.info(f"Purging invoice parse cache by {admin.username}")
+    return {"purged": purge_parse_cache()}
 
 
 @router.get(
     "/",
     summary="List invoices",
-    description="Retrieve invoices with optional date, mart, search, and pagination.",
+    description="Retrieve invoices with optional date, mart, search, and cursor pagination.",
 )
-def read_invoices(
+async def read_invoices(
     invoice_date: Optional[date] = Query(
         None, description="Filter by invoice date (YYYY-MM-DD)"
     ),
     mart_name: Optional[str] = Query(None, description="Filter by mart name"),
     search: Optional[str] = Query(None, description="Search term"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     page_size: int = Query(20, ge=1, le=100, description="Page size"),
-    db: Session = Depends(get_db),
+    count: Optional[CountMode] = Query(None, description="Include the total"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """
-    List invoices with optional filters and pagination.
+    List invoices with optional filters, newest first.
 
     Args:
         invoice_date (Optional[date]): Filter by invoice date.
         mart_name (Optional[str]): Filter by mart name.
         search (Optional[str]): Search term.
-        page (int): Page number.
+        cursor (Optional[str]): Cursor of the previous page.
         page_size (int): Page size.
-        db (Session): Database session dependency.
+        count (Optional[CountMode]): Count all matching invoices, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
-        JSONResponse: A response containing total, page, page_size, and results.
-    """
-    logger.info("Fetching invoices")
-    query = db.query(Invoice)
-    if invoice_date:
-        query = query.filter(Invoice.invoice_date == invoice_date)
-    if mart_name:
-        query = query.filter(Invoice.mart_name == mart_name)
-    if search:
-        query = query.filter(
-            or_(
-                Invoice.mart_name.ilike(f"%{search}%"),
-                Invoice.remarks.ilike(f"%{search}%"),
-            )
-        )
-    query = query.order_by(Invoice.invoice_date.desc(), Invoice.id.desc())
-    total = query.count()
-    invoices = query.offset((page - 1) * page_size).limit(page_size).all()
+        JSONResponse: A response containing next_cursor, page_size, total
+        (None unless counted) and results.
+    """
+    logger.info(f"Fetching invoices cursor={cursor}")
+    page = await run_read(
+        db,
+        get_all_invoices,
+        invoice_date=invoice_date,
+        mart_name=mart_name,
+        search=search,
+        cursor=cursor,
+        limit=page_size,
+        count=count,
+        schema=InvoiceRead,
+    )
     return {
-        "total": total,
-        "page": page,
+        "next_cursor": page.next_cursor,
         "page_size": page_size,
-        "results": [InvoiceRead.from_orm(inv) for inv in invoices],
+        "total": page.total,
+        "results": page.items,
     }
 
 
 @router.get("/{invoice_id}", response_model=InvoiceRead, summary="Get invoice by ID")
-def read_invoice(invoice_id: int, db: Session = Depends(get_db)) -> InvoiceRead:
+async def read_invoice(
+    invoice_id: int, db: AsyncSession = Depends(get_async_db)
+) -> InvoiceRead:
     """
     Retrieve a single invoice by ID.
 
     Args:
         invoice_id (int): Invoice ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         InvoiceRead: The invoice record.
@@ -131,7 +235,7 @@ def read_invoice(invoice_id: int, db: Session = Depends(get_db)) -> InvoiceRead:
         AppException: If the invoice is not found (404).
     """
     logger.info(f"Fetching invoice id={invoice_id}")
-    invoice = get_invoice_by_id(db, invoice_id)
+    invoice = await run_read(db, get_invoice_by_id, invoice_id, schema=InvoiceRead)
     if not invoice:
         logger.error(f"Invoice not found: id={invoice_id}")
         raise AppException("Invoice not found", status_code=404)
@@ -5,6 +5,7 @@ Provides retrieval, update, and deletion of invoice line items.
 
 import logging
 from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -16,7 +17,7 @@ from app.services.invoice_item import (
     delete_invoice_item,
     get_distinct_items_for_mart,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 from app.db.models.invoice_item import InvoiceItem
 
 logger = logging.getLogger(__name__)
@@ -24,9 +25,9 @@ router = APIRouter(prefix="/invoice-items", tags=["Invoice Items"])
 
 
 @router.get("/distinct-items", response_model=list[InvoiceItemSummary])
-def distinct_items_for_mart(
+async def distinct_items_for_mart(
     mart_name: str = Query(..., description="Mart name"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Retrieve distinct invoice items for a given mart.
@@ -34,31 +35,33 @@ def distinct_items_for_mart(
 
     Args:
         mart_name (str): Mart name.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[InvoiceItemRead]: List of distinct invoice items.
     """
     logger.info(f"API: Fetching distinct items for mart: {mart_name}")
-    return get_distinct_items_for_mart(db, mart_name)
+    return await run_read(db, get_distinct_items_for_mart, mart_name)
 
 
 @router.get(
     "/{invoice_id}", response_model=List[InvoiceItemRead], summary="List invoice items"
 )
-def read_items(invoice_id: int, db: Session = Depends(get_db)) -> List[InvoiceItemRead]:
+async def read_items(
+    invoice_id: int, db: AsyncSession = Depends(get_async_db)
+) -> List[InvoiceItemRead]:
     """
     Retrieve all items for a given invoice.
 
     Args:
         invoice_id (int): Invoice ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[InvoiceItemRead]: List of items.
     """
     logger.info(f"Fetching items for invoice_id={invoice_id}")
-    return get_items_by_invoice(db, invoice_id)
+    return await run_read(db, get_items_by_invoice, invoice_id, schema=InvoiceItemRead)
 
 
 @router.put("/{item_id}", response_model=InvoiceItemRead, summary="Update invoice item")
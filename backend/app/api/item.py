@@ -4,11 +4,13 @@ Provides CRUD operations for items and retrieval of items with available batches
 """
 
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.exceptions import AppException
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.item import ItemCreate, ItemRead, ItemUpdate
 from app.services.item import (
     create_item,
@@ -18,7 +20,7 @@ from app.services.item import (
     update_item,
     delete_item,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/item", tags=["Items"])
@@ -41,22 +43,32 @@ def create(entry: ItemCreate, db: Session = Depends(get_db)) -> ItemRead:
 
 
 @router.get("/", response_model=List[ItemRead], summary="List items")
-def read_all(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+async def read_all(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[ItemRead]:
     """
-    Retrieve all items.
+    Retrieve a page of items, newest first.
 
     Args:
-        skip (int): Number of records to skip.
-        limit (int): Maximum number of records to return.
-        db (Session): Database session dependency.
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all items, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[ItemRead]: List of item objects.
     """
-    logger.info(f"Fetching items skip={skip}, limit={limit}")
-    return get_all_items(db=db, skip=skip, limit=limit)
+    logger.info(f"Fetching items cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db, get_all_items, cursor=cursor, limit=limit, count=count, schema=ItemRead
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get(
@@ -64,28 +76,30 @@ def read_all(
     response_model=List[ItemRead],
     summary="List items with available batches",
 )
-def get_items_with_batches(db: Session = Depends(get_db)) -> List[ItemRead]:
+async def get_items_with_batches(
+    db: AsyncSession = Depends(get_async_db)
+) -> List[ItemRead]:
     """
     Retrieve items that have available batches.
 
     Args:
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[ItemRead]: List of items with stock.
     """
     logger.info("Fetching items with available batches")
-    return get_items_with_available_batches(db)
+    return await run_read(db, get_items_with_available_batches, schema=ItemRead)
 
 
 @router.get("/{item_id}", response_model=ItemRead, summary="Get item by ID")
-def read_one(item_id: int, db: Session = Depends(get_db)) -> ItemRead:
+async def read_one(item_id: int, db: AsyncSession = Depends(get_async_db)) -> ItemRead:
     """
     Retrieve a single item by ID.
 
     Args:
         item_id (int): Item ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         ItemRead: The item object.
@@ -94,7 +108,7 @@ def read_one(item_id: int, db: Session = Depends(get_db)) -> ItemRead:
         AppException: If the item is not found (404).
     """
     logger.info(f"Fetching item id={item_id}")
-    item = get_item(db=db, item_id=item_id)
+    item = await run_read(db, get_item, item_id=item_id, schema=ItemRead)
     if not item:
         logger.error(f"Item not found: id={item_id}")
         raise AppException("Item not found", status_code=404)
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from app.db.session import get_db
-from app.db.models.item_alias import ItemAlias
+from typing import List, Optional
+from app.db.pagination import CountMode, set_page_headers
+from app.db.session import get_db, get_async_db, run_read
 from app.db.schemas.item_alias import ItemAliasCreate, ItemAliasRead
-from app.services.item_alias import create_alias, get_all_aliases
+from app.services.item_alias import (
+    create_alias,
+    get_all_aliases,
+    list_distinct_aliases,
+)
 
 router = APIRouter(prefix="/item-alias", tags=["Item Alias"])
 
@@ -15,12 +20,26 @@ def create(entry: ItemAliasCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[ItemAliasRead])
-def read_all(db: Session = Depends(get_db)):
-    return get_all_aliases(db)
+async def read_all(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    page = await run_read(
+        db,
+        get_all_aliases,
+        cursor=cursor,
+        limit=limit,
+        count=count,
+        schema=ItemAliasRead,
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get("/distinct", response_model=List[ItemAliasRead])
-def get_distinct_aliases(db: Session = Depends(get_db)):
+async def get_distinct_aliases(db: AsyncSession = Depends(get_async_db)):
     # You can add more filtering if needed
-    aliases = db.query(ItemAlias).distinct(ItemAlias.alias_name).all()
-    return aliases
+    return await run_read(db, list_distinct_aliases, schema=ItemAliasRead)
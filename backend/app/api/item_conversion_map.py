@@ -4,11 +4,13 @@ Provides CRUD operations to manage unit/item conversion mappings.
 """
 
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.exceptions import AppException
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.item_conversion_map import (
     ItemConversionCreate,
     ItemConversionRead,
@@ -21,7 +23,7 @@ from app.services.item_conversion_map import (
     update_conversion,
     delete_conversion,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/conversions", tags=["Item Conversions"])
@@ -48,30 +50,51 @@ def create_conv(
 
 
 @router.get("/", response_model=List[ItemConversionRead], summary="List conversions")
-def list_convs(db: Session = Depends(get_db)) -> List[ItemConversionRead]:
+async def list_convs(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
+) -> List[ItemConversionRead]:
     """
-    Retrieve all item conversion mappings.
+    Retrieve a page of item conversion mappings, newest first.
 
     Args:
-        db (Session): Database session dependency.
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all mappings, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[ItemConversionRead]: List of conversion mappings.
     """
-    logger.info("Fetching all item conversion mappings")
-    return get_all_conversions(db)
+    logger.info(f"Fetching item conversion mappings cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db,
+        get_all_conversions,
+        cursor=cursor,
+        limit=limit,
+        count=count,
+        schema=ItemConversionRead,
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get(
     "/{conv_id}", response_model=ItemConversionRead, summary="Get conversion by ID"
 )
-def read_conv(conv_id: int, db: Session = Depends(get_db)) -> ItemConversionRead:
+async def read_conv(
+    conv_id: int, db: AsyncSession = Depends(get_async_db)
+) -> ItemConversionRead:
     """
     Retrieve a single conversion mapping by ID.
 
     Args:
         conv_id (int): Conversion mapping ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         ItemConversionRead: The conversion mapping.
@@ -80,7 +103,7 @@ def read_conv(conv_id: int, db: Session = Depends(get_db)) -> ItemConversionRead
         AppException: If mapping not found (404).
     """
     logger.info(f"Fetching conversion id={conv_id}")
-    conv = get_conversion(db, conv_id)
+    conv = await run_read(db, get_conversion, conv_id, schema=ItemConversionRead)
     if not conv:
         logger.error(f"Conversion not found: id={conv_id}")
         raise AppException("Conversion not found", status_code=404)
@@ -0,0 +1,24 @@
+"""
+Metrics endpoint in the Prometheus text exposition format.
+Served at the application root (not under /v1) for local scraping.
+"""
+
+import logging
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import CONTENT_TYPE, render_metrics
+
+logger = logging.getLogger(__name__)
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", summary="Prometheus metrics")
+def metrics() -> Response:
+    """
+    Request, SQL, invoice parse, inventory and pool metrics of this worker.
+
+    Returns:
+        Response: Metrics in the text exposition format.
+    """
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
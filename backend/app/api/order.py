@@ -4,12 +4,14 @@ Provides CRUD operations and retrieval of distinct mart names.
 """
 
 import logging
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 
 from app.core.exceptions import AppException
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.order import OrderCreate, OrderRead, OrderUpdate
 from app.services.order import (
     create_order,
@@ -19,7 +21,7 @@ from app.services.order import (
     delete_order,
     get_distinct_mart_names,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/orders", tags=["Orders"])
@@ -42,49 +44,70 @@ def create(entry: OrderCreate, db: Session = Depends(get_db)) -> OrderRead:
 
 
 @router.get("/", response_model=List[OrderRead], summary="List orders")
-def read_all(
+async def read_all(
+    response: Response,
     order_date: Optional[date] = Query(None, description="Filter by order date"),
     mart_name: Optional[str] = Query(None, description="Filter by mart name"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[OrderRead]:
     """
-    Retrieve orders with optional filters.
+    Retrieve a page of orders with optional filters, newest first.
 
     Args:
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
         order_date (Optional[date]): Filter by date.
         mart_name (Optional[str]): Filter by mart.
-        db (Session): Database session dependency.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all matching orders, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[OrderRead]: List of orders.
     """
-    logger.info(f"Fetching orders date={order_date}, mart={mart_name}")
-    return get_orders(db=db, order_date=order_date, mart_name=mart_name)
+    logger.info(f"Fetching orders date={order_date}, mart={mart_name}, cursor={cursor}")
+    page = await run_read(
+        db,
+        get_orders,
+        order_date=order_date,
+        mart_name=mart_name,
+        cursor=cursor,
+        limit=limit,
+        count=count,
+        schema=OrderRead,
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get("/mart-names", response_model=List[str], summary="List mart names")
-def get_mart_names(db: Session = Depends(get_db)) -> List[str]:
+async def get_mart_names(db: AsyncSession = Depends(get_async_db)) -> List[str]:
     """
     Retrieve distinct mart names from orders.
 
     Args:
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[str]: List of mart names.
     """
     logger.info("Fetching distinct mart names")
-    return get_distinct_mart_names(db)
+    return await run_read(db, get_distinct_mart_names)
 
 
 @router.get("/{order_id}", response_model=OrderRead, summary="Get order by ID")
-def read_one(order_id: int, db: Session = Depends(get_db)) -> OrderRead:
+async def read_one(
+    order_id: int, db: AsyncSession = Depends(get_async_db)
+) -> OrderRead:
     """
     Retrieve a single order by ID.
 
     Args:
         order_id (int): Order ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         OrderRead: The order.
@@ -93,7 +116,7 @@ def read_one(order_id: int, db: Session = Depends(get_db)) -> OrderRead:
         AppException: If order not found (404).
     """
     logger.info(f"Fetching order id={order_id}")
-    order = get_order(db=db, order_id=order_id)
+    order = await run_read(db, get_order, order_id=order_id, schema=OrderRead)
     if not order:
         logger.error(f"Order not found: id={order_id}")
         raise AppException("Order not found", status_code=404)
@@ -5,11 +5,13 @@ Provides creation and retrieval of rejection entries, with optional filtering.
 
 import logging
 from datetime import date
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.exceptions import AppException
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.rejection_entry import (
     RejectionEntryCreate,
     RejectionEntryRead,
@@ -19,7 +21,7 @@ from app.services.rejection_entry import (
     get_all_rejections,
     get_rejections_by_date_and_items,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/rejection-entries", tags=["Rejection Entries"])
@@ -46,27 +48,46 @@ def create_route(
 
 
 @router.get("/", response_model=List[RejectionEntryRead], summary="List rejections")
-def read_all(db: Session = Depends(get_db)) -> List[RejectionEntryRead]:
+async def read_all(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
+) -> List[RejectionEntryRead]:
     """
-    Retrieve all rejection entries.
+    Retrieve a page of rejection entries, newest first.
 
     Args:
-        db (Session): Database session dependency.
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all rejections, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[RejectionEntryRead]: List of rejections.
     """
-    logger.info("Fetching all rejection entries")
-    return get_all_rejections(db)
+    logger.info(f"Fetching rejection entries cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db,
+        get_all_rejections,
+        cursor=cursor,
+        limit=limit,
+        count=count,
+        schema=RejectionEntryRead,
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get(
     "/list", response_model=List[RejectionEntryRead], summary="Filter rejections"
 )
-def get_filtered_rejections(
+async def get_filtered_rejections(
     rejection_date: date = Query(..., description="Rejection date"),
     item_ids: Optional[List[int]] = Query(None, description="Filter by item IDs"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[RejectionEntryRead]:
     """
     Retrieve rejection entries filtered by date and item IDs.
@@ -74,12 +95,16 @@ def get_filtered_rejections(
     Args:
         rejection_date (date): Date to filter rejections.
         item_ids (Optional[List[int]]): List of item IDs to filter.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[RejectionEntryRead]: List of filtered rejections.
     """
     logger.info(f"Fetching rejections for date={rejection_date}, item_ids={item_ids}")
-    return get_rejections_by_date_and_items(
-        db=db, rejection_date=rejection_date, item_ids=item_ids
+    return await run_read(
+        db,
+        get_rejections_by_date_and_items,
+        rejection_date=rejection_date,
+        item_ids=item_ids,
+        schema=RejectionEntryRead,
     )
@@ -5,7 +5,7 @@ Provides inventory and P&L summary reports.
 
 import logging
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from app.db.schemas.inventory_summary import InventorySummaryRead
@@ -14,7 +14,7 @@ from app.services.reports import (
     get_inventory_report,
     get_pnl_report,
 )
-from app.db.session import get_db
+from app.db.session import get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/reports", tags=["Reports"])
@@ -23,29 +23,30 @@ router = APIRouter(prefix="/reports", tags=["Reports"])
 @router.get(
     "/inventory", response_model=List[InventorySummaryRead], summary="Inventory report"
 )
-def inventory(
+async def inventory(
     item_id: Optional[int] = Query(None, description="Filter by item ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[InventorySummaryRead]:
     """
     Retrieve inventory summary report.
 
     Args:
         item_id (Optional[int]): Filter by item ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[InventorySummaryRead]: Inventory summary data.
     """
     logger.info(f"Fetching inventory report for item_id={item_id}")
-    return get_inventory_report(db=db, item_id=item_id)
+    return await run_read(db, get_inventory_report, item_id=item_id)
 
 
 @router.get("/pnl", response_model=List[PnlSummaryRead], summary="P&L report")
-def pnl(
+async def pnl(
     start: Optional[str] = Query(None, description="Start date YYYY-MM-DD"),
     end: Optional[str] = Query(None, description="End date YYYY-MM-DD"),
-    db: Session = Depends(get_db),
+    fresh: bool = Query(False, description="Recompute the range before reading"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[PnlSummaryRead]:
     """
     Retrieve profit and loss summary report.
@@ -53,10 +54,11 @@ def pnl(
     Args:
         start (Optional[str]): Start date.
         end (Optional[str]): End date.
-        db (Session): Database session dependency.
+        fresh (bool): Recompute the range before reading.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[PnlSummaryRead]: P&L summary data.
     """
     logger.info(f"Fetching P&L report from {start} to {end}")
-    return get_pnl_report(db=db, start=start, end=end)
+    return await run_read(db, get_pnl_report, start=start, end=end, fresh=fresh)
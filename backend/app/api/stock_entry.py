@@ -5,24 +5,28 @@ Provides CRUD operations and listing of stock entries.
 
 import logging
 from datetime import date
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.exceptions import AppException
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.stock_entry import (
+    StockEntryBulkResult,
     StockEntryCreate,
     StockEntryRead,
     StockEntryUpdate,
 )
 from app.services.stock_entry import (
     create_stock_entry,
+    create_stock_entries_bulk,
     get_stock_entry,
     get_all_stock_entries,
     update_stock_entry,
     delete_stock_entry,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/stock-entry", tags=["Stock Entry"])
@@ -44,39 +48,82 @@ def create(entry: StockEntryCreate, db: Session = Depends(get_db)) -> StockEntry
     return create_stock_entry(db=db, entry=entry, created_by=1)
 
 
+@router.post(
+    "/bulk",
+    response_model=List[StockEntryBulkResult],
+    status_code=status.HTTP_201_CREATED,
+    summary="Receive many stock entries",
+)
+def create_bulk(
+    entries: List[StockEntryCreate], db: Session = Depends(get_db)
+) -> List[StockEntryBulkResult]:
+    """
+    Create many stock entries in one transaction, e.g. a morning goods receipt.
+
+    Args:
+        entries (List[StockEntryCreate]): Stock entries to receive.
+        db (Session): Database session dependency.
+
+    Returns:
+        List[StockEntryBulkResult]: Per-entry result, in request order; rejected
+        entries carry an error and are not saved.
+
+    Raises:
+        AppException: If too many entries are sent (400).
+    """
+    logger.info(f"Creating {len(entries)} stock entries in bulk")
+    return create_stock_entries_bulk(db=db, entries=entries, created_by=1)
+
+
 @router.get("/", response_model=List[StockEntryRead], summary="List stock entries")
-def read_all(
+async def read_all(
+    response: Response,
     date: Optional[date] = Query(None, description="Filter by date"),
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[StockEntryRead]:
     """
-    Retrieve all stock entries with optional date filter.
+    Retrieve a page of stock entries with optional date filter, newest first.
 
     Args:
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
         date (Optional[date]): Filter by entry date.
-        skip (int): Number of records to skip.
-        limit (int): Maximum number of records to return.
-        db (Session): Database session dependency.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all matches, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[StockEntryRead]: List of stock entries.
     """
-    logger.info(f"Fetching stock entries date={date}, skip={skip}, limit={limit}")
-    return get_all_stock_entries(db=db, date=date, skip=skip, limit=limit)
+    logger.info(f"Fetching stock entries date={date}, cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db,
+        get_all_stock_entries,
+        date=date,
+        cursor=cursor,
+        limit=limit,
+        count=count,
+        schema=StockEntryRead,
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get(
     "/{stock_entry_id}", response_model=StockEntryRead, summary="Get stock entry by ID"
 )
-def read_one(stock_entry_id: int, db: Session = Depends(get_db)) -> StockEntryRead:
+async def read_one(
+    stock_entry_id: int, db: AsyncSession = Depends(get_async_db)
+) -> StockEntryRead:
     """
     Retrieve a single stock entry by ID.
 
     Args:
         stock_entry_id (int): Stock entry ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         StockEntryRead: The stock entry.
@@ -85,7 +132,9 @@ def read_one(stock_entry_id: int, db: Session = Depends(get_db)) -> StockEntryRe
         AppException: If entry not found (404).
     """
     logger.info(f"Fetching stock entry id={stock_entry_id}")
-    entry = get_stock_entry(db=db, stock_entry_id=stock_entry_id)
+    entry = await run_read(
+        db, get_stock_entry, stock_entry_id=stock_entry_id, schema=StockEntryRead
+    )
     if not entry:
         logger.error(f"Stock entry not found: id={stock_entry_id}")
         raise AppException("Stock entry not found", status_code=404)
@@ -0,0 +1,41 @@
+"""
+API endpoint for the mobile delta sync.
+Returns rows of the core tables changed since a server-issued token.
+"""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.schemas.sync import SyncResponse
+from app.db.session import get_async_db, run_read
+from app.services.sync import get_changes
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@router.get("", response_model=SyncResponse, summary="Changes since a sync token")
+async def sync(
+    since: Optional[str] = Query(None, description="Token of the previous sync"),
+    limit: int = Query(500, ge=1, le=5000, description="Max rows per table"),
+    db: AsyncSession = Depends(get_async_db),
+) -> SyncResponse:
+    """
+    Retrieve items, batches, orders, dispatch entries and stock entries
+    created, updated or deleted since `since`.
+
+    Args:
+        since (Optional[str]): Token of the previous sync; omit for everything.
+        limit (int): Max rows per table per call.
+        db (AsyncSession): Async database session dependency.
+
+    Returns:
+        SyncResponse: Per-table changes, the next token and has_more.
+    """
+    logger.info(f"Sync requested since={'token' if since else 'start'}")
+    return await run_read(
+        db, get_changes, since=since, limit=limit, schema=SyncResponse
+    )
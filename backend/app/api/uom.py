@@ -1,11 +1,13 @@
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.uom import UOMCreate, UOMRead
 from app.services.uom import create_uom, list_uoms
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/uom", tags=["UOM"])
@@ -17,5 +19,15 @@ def create(entry: UOMCreate, db: Session = Depends(get_db)) -> UOMRead:
 
 
 @router.get("/", response_model=List[UOMRead], summary="List UOMs")
-def read_all(db: Session = Depends(get_db)) -> List[UOMRead]:
-    return list_uoms(db)
+async def read_all(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
+) -> List[UOMRead]:
+    page = await run_read(
+        db, list_uoms, cursor=cursor, limit=limit, count=count, schema=UOMRead
+    )
+    set_page_headers(response, page)
+    return page.items
@@ -4,11 +4,13 @@ Provides retrieval, update, and deletion of users.
 """
 
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.exceptions import AppException
+from app.db.pagination import CountMode, set_page_headers
 from app.db.schemas.user import UserRead, UserUpdate
 from app.services.user import (
     get_user,
@@ -16,39 +18,49 @@ from app.services.user import (
     update_user,
     delete_user,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/", response_model=List[UserRead], summary="List users")
-def read_users(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+async def read_users(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    count: Optional[CountMode] = Query(None, description="Send X-Total-Count"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[UserRead]:
     """
-    Retrieve all users with pagination.
+    Retrieve a page of users, newest first.
 
     Args:
-        skip (int): Number of records to skip.
-        limit (int): Maximum number of records to return.
-        db (Session): Database session dependency.
+        response (Response): Carries the X-Next-Cursor / X-Total-Count headers.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Page size.
+        count (Optional[CountMode]): Count all users, exactly or estimated.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         List[UserRead]: List of users.
     """
-    logger.info(f"Fetching users skip={skip}, limit={limit}")
-    return get_all_users(db=db, skip=skip, limit=limit)
+    logger.info(f"Fetching users cursor={cursor}, limit={limit}")
+    page = await run_read(
+        db, get_all_users, cursor=cursor, limit=limit, count=count, schema=UserRead
+    )
+    set_page_headers(response, page)
+    return page.items
 
 
 @router.get("/{user_id}", response_model=UserRead, summary="Get user by ID")
-def read_user(user_id: int, db: Session = Depends(get_db)) -> UserRead:
+async def read_user(user_id: int, db: AsyncSession = Depends(get_async_db)) -> UserRead:
     """
     Retrieve a single user by ID.
 
     Args:
         user_id (int): User ID.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         UserRead: The user.
@@ -57,7 +69,7 @@ def read_user(user_id: int, db: Session = Depends(get_db)) -> UserRead:
         AppException: If user not found (404).
     """
     logger.info(f"Fetching user id={user_id}")
-    user = get_user(db, user_id)
+    user = await run_read(db, get_user, user_id, schema=UserRead)
     if not user:
         logger.error(f"User not found: id={user_id}")
         raise AppException("User not found", status_code=404)
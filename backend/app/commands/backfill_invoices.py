@@ -0,0 +1,277 @@
+"""
+Back-fill historical invoices from a directory of PDFs.
+
+Walks the directory for PDFs and skips files whose hash is already
+stored (or repeated in the archive). The rest are parsed in a process
+pool and saved `--batch-size` invoices per transaction. Each committed
+batch is appended to a checkpoint file, so a re-run after a crash or
+Ctrl-C resumes with the files not yet handled. A batch the database
+rejects is saved one invoice at a time. Files that fail to parse or to
+save are recorded too and only retried with --retry-failed. PDFs stay
+where they are; invoices record their absolute path.
+
+Run from backend/:
+    python -m app.commands.backfill_invoices /data/invoices/2023
+    python -m app.commands.backfill_invoices /data/invoices --workers 4 --batch-size 100
+    python -m app.commands.backfill_invoices /data/invoices --retry-failed
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.logging_config import setup_logging
+from app.db.models.invoice import Invoice
+from app.db.session import SessionLocal
+from app.services.invoice import persist_parsed_invoices
+
+logger = logging.getLogger(__name__)
+
+CREATED_BY = "backfill"
+DEFAULT_CHECKPOINT = "invoice_backfill.checkpoint.jsonl"
+# file hashes per existence query
+HASH_QUERY_CHUNK = 1000
+
+
+def find_pdfs(directory: str) -> List[str]:
+    """
+    Absolute paths of the PDFs under `directory`, in a stable order.
+    """
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        paths += [
+            os.path.abspath(os.path.join(root, name))
+            for name in sorted(files)
+            if name.lower().endswith(".pdf")
+        ]
+    return paths
+
+
+def read_checkpoint(path: str, retry_failed: bool) -> Set[str]:
+    """
+    Files handled by earlier runs. A line torn by a crash is ignored.
+    """
+    handled: Set[str] = set()
+    if not os.path.exists(path):
+        return handled
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry["status"] == "failed" and retry_failed:
+                continue
+            handled.add(entry["path"])
+    return handled
+
+
+def append_checkpoint(path: str, entries: List[Dict]) -> None:
+    """
+    Record handled files once their batch is committed, synced to disk.
+    """
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def stored_hashes(db, hashes: List[str]) -> Set[str]:
+    stored: Set[str] = set()
+    for start in range(0, len(hashes), HASH_QUERY_CHUNK):
+        chunk = hashes[start : start + HASH_QUERY_CHUNK]
+        stored.update(db.scalars(select(Invoice.file_hash).where(Invoice.file_hash.in_(chunk))))
+    return stored
+
+
+def parse_file(path: str):
+    """
+    Parse one PDF; runs in a pool worker.
+    """
+    # the parser pulls in pandas and pdfplumber; workers import it on first use
+    from app.utils.invoice_parser import process_pdf
+
+    return process_pdf(path)
+
+
+def parse_all(
+    paths: List[str], workers: int
+) -> Iterator[Tuple[str, Optional[tuple], Optional[Exception]]]:
+    """
+    Parse `paths` in a process pool, yielding (path, result, error) as
+    parses finish. At most two files per worker are queued, so finished
+    results do not pile up while the caller writes.
+    """
+    pool = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    queue = iter(paths)
+    pending = {pool.submit(parse_file, p): p for p in islice(queue, workers * 2)}
+    try:
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                path = pending.pop(future)
+                for following in islice(queue, 1):
+                    pending[pool.submit(parse_file, following)] = following
+                try:
+                    yield path, future.result(), None
+                except Exception as e:
+                    yield path, None, e
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _persist(db, batch: List[Dict]) -> List[Optional[int]]:
+    """
+    Save a batch, retrying once when a concurrent upload stored one of its
+    files first; the retry skips that file as a duplicate.
+    """
+    try:
+        return persist_parsed_invoices(db, batch, created_by=CREATED_BY)
+    except IntegrityError:
+        logger.warning("Batch raced with an upload of the same file, retrying")
+        return persist_parsed_invoices(db, batch, created_by=CREATED_BY)
+
+
+def save_batch(db, batch: List[Dict]) -> List[Tuple[Optional[int], Optional[Exception]]]:
+    """
+    Save a batch, returning (invoice id, error) per entry; the id is None
+    for duplicates and failures. When the batch insert fails, its invoices
+    are saved one at a time so a single bad invoice cannot block the rest.
+    """
+    try:
+        return [(invoice_id, None) for invoice_id in _persist(db, batch)]
+    except Exception as e:
+        db.rollback()
+        if len(batch) == 1:
+            logger.warning(f"Failed to save {batch[0]['file_path']}: {e}")
+            return [(None, e)]
+        logger.warning(f"Batch of {len(batch)} failed ({e}), saving one invoice at a time")
+
+    results = []
+    for parsed in batch:
+        results += save_batch(db, [parsed])
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=50, help="invoices per transaction")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument(
+        "--retry-failed", action="store_true", help="parse files that failed before again"
+    )
+    args = parser.parse_args()
+    setup_logging()
+    # per-invoice logs would drown the progress lines
+    logging.getLogger("app.services").setLevel(logging.WARNING)
+
+    paths = find_pdfs(args.directory)
+    handled = read_checkpoint(args.checkpoint, args.retry_failed)
+    todo = [p for p in paths if p not in handled]
+    print(f"{len(paths)} PDFs in {args.directory}, {len(paths) - len(todo)} done by earlier runs")
+
+    hashes = {p: file_hash(p) for p in todo}
+    db = SessionLocal()
+    try:
+        stored = stored_hashes(db, list(set(hashes.values())))
+        skipped, to_parse, seen = [], [], set(stored)
+        for p in todo:
+            if hashes[p] in seen:
+                skipped.append({"path": p, "status": "duplicate"})
+            else:
+                seen.add(hashes[p])
+                to_parse.append(p)
+        append_checkpoint(args.checkpoint, skipped)
+        print(f"{len(skipped)} already stored, parsing {len(to_parse)} with {args.workers} workers")
+
+        totals = {"saved": 0, "duplicate": len(skipped), "failed": 0, "rows": 0}
+        start = time.perf_counter()
+        batch: List[Dict] = []
+        failed: List[Dict] = []
+
+        def flush() -> None:
+            entries = list(failed)
+            if batch:
+                for parsed, (invoice_id, error) in zip(batch, save_batch(db, batch)):
+                    if error is not None:
+                        totals["failed"] += 1
+                        entries.append(
+                            {"path": parsed["file_path"], "status": "failed", "error": str(error)}
+                        )
+                        continue
+                    status = "saved" if invoice_id else "duplicate"
+                    totals[status] += 1
+                    if invoice_id:
+                        totals["rows"] += len(parsed["df"])
+                    entries.append({"path": parsed["file_path"], "status": status})
+            append_checkpoint(args.checkpoint, entries)
+            batch.clear()
+            failed.clear()
+            elapsed = time.perf_counter() - start
+            done = totals["saved"] + totals["failed"]
+            print(
+                f"  {done}/{len(to_parse)} files  {done / elapsed:7.1f} files/s  "
+                f"{totals['rows'] / elapsed:9.0f} rows/s  "
+                f"({totals['failed']} failed)"
+            )
+
+        for path, result, error in parse_all(to_parse, args.workers):
+            if error is not None:
+                logger.warning(f"Failed to parse {path}: {error}")
+                totals["failed"] += 1
+                failed.append({"path": path, "status": "failed", "error": str(error)})
+            else:
+                df, invoice_date, mart_name = result
+                batch.append(
+                    {
+                        "df": df,
+                        "invoice_date": invoice_date,
+                        "mart_name": mart_name,
+                        "file_path": path,
+                        "file_hash": hashes[path],
+                    }
+                )
+            if len(batch) >= args.batch_size:
+                flush()
+        if batch or failed:
+            flush()
+
+        elapsed = time.perf_counter() - start
+        print(
+            f"Saved {totals['saved']} invoices with {totals['rows']} items in "
+            f"{elapsed:.1f} s ({totals['saved'] / elapsed if elapsed else 0:.1f} files/s, "
+            f"{totals['rows'] / elapsed if elapsed else 0:.0f} rows/s); "
+            f"{totals['duplicate']} duplicates, {totals['failed']} failed"
+        )
+        return 1 if totals["failed"] else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Migrate the database to the latest revision and apply the seed data.
+
+Run once per deploy, before starting the API workers (docker-compose does
+this); the workers themselves no longer migrate or seed on startup.
+Concurrent runs on Postgres wait for each other. Seeds are skipped when
+unchanged since the last run (see `app.db.seed.seed_all`).
+
+Run from backend/:
+    python -m app.commands.migrate
+    python -m app.commands.migrate --skip-seed
+    python -m app.commands.migrate --force-seed
+"""
+
+import argparse
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging
+from app.db.seed.seed_all import seed_all
+from app.db.session import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+# pg_advisory_lock key serializing migrate runs ("agro" in ASCII)
+MIGRATE_LOCK_KEY = 0x6167726F
+LOCK_POLL_SECONDS = 1.0
+
+
+@contextmanager
+def migrate_lock() -> Iterator[None]:
+    """
+    Hold a Postgres session advisory lock so replicas deployed together
+    migrate and seed one at a time. No-op on other databases.
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    # Autocommit and polling instead of a blocking pg_advisory_lock: a
+    # session waiting inside a statement (or a transaction) holds a
+    # snapshot, and CREATE INDEX CONCURRENTLY in the running migration
+    # would wait for it forever.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        while not conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATE_LOCK_KEY}
+        ).scalar():
+            logger.info("Another migrate run holds the lock, waiting")
+            time.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATE_LOCK_KEY}
+            )
+
+
+def upgrade_schema() -> None:
+    """
+    `alembic upgrade head` in this process. alembic/env.py reads
+    DATABASE_URL; no ini file is passed, so it leaves logging alone.
+    """
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    command.upgrade(config, "head")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--skip-seed", action="store_true", help="only migrate")
+    parser.add_argument(
+        "--force-seed", action="store_true", help="seed even if the seed data is unchanged"
+    )
+    args = parser.parse_args()
+    setup_logging()
+
+    with migrate_lock():
+        start = time.perf_counter()
+        upgrade_schema()
+        print(f"Migrated to head in {time.perf_counter() - start:.2f} s")
+
+        if args.skip_seed or not settings.SEED_INITIAL_DATA:
+            return 0
+        start = time.perf_counter()
+        db = SessionLocal()
+        try:
+            inserted = seed_all(db, created_by="admin@startup", force=args.force_seed)
+        finally:
+            db.close()
+        elapsed = time.perf_counter() - start
+        if inserted is None:
+            print(f"Seed data unchanged, skipped in {elapsed:.2f} s")
+        else:
+            print(f"Seeded {inserted} in {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
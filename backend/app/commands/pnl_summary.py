@@ -0,0 +1,35 @@
+"""
+Refresh the materialized pnl_daily table.
+
+Run from backend/ (e.g. from cron when PNL_REFRESH_INTERVAL_SECONDS=0):
+    python -m app.commands.pnl_summary refresh
+    python -m app.commands.pnl_summary refresh --full
+"""
+
+import argparse
+import sys
+
+from app.core.logging_config import setup_logging
+from app.db.session import SessionLocal
+from app.services.pnl_summary import refresh_pnl_summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("action", choices=["refresh"])
+    parser.add_argument(
+        "--full", action="store_true", help="recompute every row, not only touched keys"
+    )
+    args = parser.parse_args()
+    setup_logging()
+
+    db = SessionLocal()
+    try:
+        print(f"Wrote {refresh_pnl_summary(db, full=args.full)} pnl_daily rows")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
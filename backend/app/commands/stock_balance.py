@@ -0,0 +1,41 @@
+"""
+Rebuild or verify the stock_balance table against the inventory_txn ledger.
+
+Run from backend/:
+    python -m app.commands.stock_balance verify
+    python -m app.commands.stock_balance rebuild
+"""
+
+import argparse
+import sys
+
+from app.core.logging_config import setup_logging
+from app.db.session import SessionLocal
+from app.services.stock_balance import rebuild_stock_balance, verify_stock_balance
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("action", choices=["verify", "rebuild"])
+    args = parser.parse_args()
+    setup_logging()
+
+    db = SessionLocal()
+    try:
+        if args.action == "rebuild":
+            print(f"Rebuilt {rebuild_stock_balance(db)} stock_balance rows")
+            return 0
+        drift = verify_stock_balance(db)
+        for d in drift:
+            print(
+                f"item={d['item_id']} batch={d['batch_id']} unit={d['base_unit']}: "
+                f"ledger={d['ledger']} stock_balance={d['stock_balance']}"
+            )
+        print("stock_balance matches the ledger" if not drift else f"{len(drift)} keys drifted")
+        return 1 if drift else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+Prune sync tombstones past SYNC_TOMBSTONE_RETENTION_DAYS.
+
+Run from backend/ (e.g. daily from cron):
+    python -m app.commands.sync_tombstones prune
+"""
+
+import argparse
+import sys
+
+from app.core.logging_config import setup_logging
+from app.db.session import SessionLocal
+from app.services.sync import prune_tombstones
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("action", choices=["prune"])
+    parser.parse_args()
+    setup_logging()
+
+    db = SessionLocal()
+    try:
+        print(f"Pruned {prune_tombstones(db)} sync tombstones")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,25 @@ load_dotenv()
 
 class Settings:
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    # asyncio driver URL for the async read routes; derived from DATABASE_URL
+    # (postgresql -> postgresql+asyncpg, sqlite -> sqlite+aiosqlite) when unset
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL")
+    # Connection pool of each engine, per API worker process: a worker can
+    # hold up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections per engine, so
+    # keep workers * that (times two engines) under Postgres max_connections.
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # seconds to wait for a free connection before failing the request
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    # replace connections older than this; -1 keeps them until they fail
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "-1"))
+    # test each connection with a round trip on checkout; with a recycle time
+    # below the server/proxy idle timeout this can be turned off
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY")
     POSTGRES_USER = os.getenv("POSTGRES_USER")
     POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD")
@@ -13,7 +32,51 @@ class Settings:
     POSTGRES_PORT = os.getenv("POSTGRES_PORT")
     POSTGRES_HOST = os.getenv("POSTGRES_HOST")
     INVOICE_UPLOAD_DIR: str = "invoices"
-    SEED_INITIAL_DATA: bool = True
+    # Process pool used to parse uploaded invoice PDFs off the event loop.
+    # 0 workers parses in the default thread pool instead of subprocesses.
+    INVOICE_PARSE_WORKERS: int = int(os.getenv("INVOICE_PARSE_WORKERS", "2"))
+    # Max parse jobs queued or running per API worker before uploads wait.
+    INVOICE_PARSE_QUEUE_DEPTH: int = int(os.getenv("INVOICE_PARSE_QUEUE_DEPTH", "8"))
+    # On-disk cache of parsed invoice tables keyed by file hash; 0 MB disables it.
+    INVOICE_PARSE_CACHE_DIR: str = os.getenv("INVOICE_PARSE_CACHE_DIR", "parse_cache")
+    INVOICE_PARSE_CACHE_MAX_MB: int = int(os.getenv("INVOICE_PARSE_CACHE_MAX_MB", "256"))
+    # Uploads of at least this many MB are parsed page by page in the parse
+    # pool and their items saved in chunks, bounding worker memory; 0 streams
+    # every upload.
+    INVOICE_STREAM_MIN_MB: float = float(os.getenv("INVOICE_STREAM_MIN_MB", "2"))
+    # Seconds before the in-memory item/alias index reloads from the database
+    # to pick up changes made by other workers; 0 never reloads.
+    ITEM_INDEX_TTL_SECONDS: int = int(os.getenv("ITEM_INDEX_TTL_SECONDS", "300"))
+    # Same, for the in-memory per-item unit conversion graph.
+    CONVERSION_GRAPH_TTL_SECONDS: int = int(
+        os.getenv("CONVERSION_GRAPH_TTL_SECONDS", "300")
+    )
+    # P&L reports catch up on changes when the last refresh is older than
+    # this many seconds; 0 leaves refreshing to `app.commands.pnl_summary`.
+    PNL_REFRESH_INTERVAL_SECONDS: int = int(
+        os.getenv("PNL_REFRESH_INTERVAL_SECONDS", "60")
+    )
+    # deletions stay visible to /sync this long; older sync tokens must
+    # resync from scratch
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = int(
+        os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30")
+    )
+    # N+1 detection for development and CI: warn when one request runs the
+    # same statement shape more than this many times (0 disables it), and
+    # fail the request instead when N_PLUS_ONE_RAISE is set
+    N_PLUS_ONE_THRESHOLD: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", "0"))
+    N_PLUS_ONE_RAISE: bool = os.getenv("N_PLUS_ONE_RAISE", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # `app.commands.migrate` seeds UOMs, items, aliases and conversions
+    # after migrating, skipping seeds unchanged since the last run
+    SEED_INITIAL_DATA: bool = os.getenv("SEED_INITIAL_DATA", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
 
     class Config:
         env_file = ".env"
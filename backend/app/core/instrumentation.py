@@ -0,0 +1,273 @@
+"""
+Application metrics and the hooks that record them.
+Request latency per route template, SQL statements per request and their
+durations, invoice parse stage timings and inventory ledger writes, all
+registered in `app.core.metrics` and served at `GET /metrics`. With
+N_PLUS_ONE_THRESHOLD set, requests repeating one statement shape more
+often than that are reported as likely N+1 queries.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.core.metrics import counter, histogram
+
+logger = logging.getLogger(__name__)
+
+HTTP_REQUESTS = counter(
+    "http_requests_total",
+    "HTTP requests by route template and status",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_SECONDS = histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route"),
+)
+HTTP_REQUEST_SQL_STATEMENTS = histogram(
+    "http_request_sql_statements",
+    "SQL statements executed per HTTP request",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500),
+)
+HTTP_REQUEST_SQL_SECONDS = histogram(
+    "http_request_sql_duration_seconds",
+    "Time spent in SQL per HTTP request",
+    ("method", "route"),
+)
+SQL_STATEMENT_SECONDS = histogram(
+    "sql_statement_duration_seconds",
+    "SQL statement execution time by operation",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0),
+)
+INVOICE_PARSE_STAGE_SECONDS = histogram(
+    "invoice_parse_stage_duration_seconds",
+    "Invoice processing time by stage (detect, extract, normalize, clean, persist)",
+    ("stage",),
+)
+INVENTORY_TXNS = counter(
+    "inventory_txns_written_total",
+    "Inventory ledger rows written, by transaction type",
+    ("txn_type",),
+)
+N_PLUS_ONE_REQUESTS = counter(
+    "http_requests_n_plus_one_total",
+    "Requests that repeated a statement shape more than N_PLUS_ONE_THRESHOLD times",
+    ("method", "route"),
+)
+
+# routes that did not match are grouped to keep label values bounded
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestStats:
+    __slots__ = ("statements", "sql_seconds", "shapes")
+
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+        # statement shape -> executions, only while N+1 detection is on
+        self.shapes: Optional[Counter] = (
+            Counter() if settings.N_PLUS_ONE_THRESHOLD > 0 else None
+        )
+
+
+# SQL stats of the request being served; threadpool and run_sync calls
+# copy the context, so they update the same object
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status and SQL work per route
+    template (e.g. /v1/batch/{batch_id}), so label values stay bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            route = scope.get("route")
+            template = getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, template, status).inc()
+            HTTP_REQUEST_SECONDS.labels(method, template).observe(elapsed)
+            HTTP_REQUEST_SQL_STATEMENTS.labels(method, template).observe(stats.statements)
+            HTTP_REQUEST_SQL_SECONDS.labels(method, template).observe(stats.sql_seconds)
+            if stats.shapes is not None:
+                _check_repeats(method, template, stats)
+
+
+def _operation(statement: str) -> str:
+    words = statement.split(None, 1)
+    word = words[0].upper() if words else ""
+    return word if word in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    Time every statement run by `engine` (an async engine's `sync_engine`
+    for asyncio drivers) and add it to the current request's stats.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        SQL_STATEMENT_SECONDS.labels(_operation(statement)).observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.sql_seconds += elapsed
+            if stats.shapes is not None:
+                _count_shape(stats.shapes, statement)
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        conn = context.connection
+        starts = conn.info.get("query_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+
+_PARAM = r"(?:\?|%s|%\(\w+\)s|\$\d+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})*\s*\)")
+_PARAM_RE = re.compile(_PARAM)
+_SPACE = re.compile(r"\s+")
+
+# (method, route) -> worst request seen while N+1 detection is on
+_repeats: Dict[Tuple[str, str], Dict] = {}
+_repeats_lock = threading.Lock()
+
+
+def statement_shape(statement: str) -> str:
+    """
+    A statement with its parameters and IN lists collapsed, so that the
+    lazy load of row 1 and of row 2 have the same shape.
+    """
+    shape = _PARAM_LIST.sub("(?)", statement)
+    return _SPACE.sub(" ", _PARAM_RE.sub("?", shape)).strip()
+
+
+def _count_shape(shapes: Counter, statement: str) -> None:
+    shape = statement_shape(statement)
+    shapes[shape] += 1
+    if settings.N_PLUS_ONE_RAISE and shapes[shape] > settings.N_PLUS_ONE_THRESHOLD:
+        raise AppException(
+            f"N+1 query: statement ran more than {settings.N_PLUS_ONE_THRESHOLD} "
+            f"times in one request: {shape[:200]}",
+            status_code=500,
+        )
+
+
+def _check_repeats(method: str, route: str, stats: RequestStats) -> None:
+    shape, repeats = stats.shapes.most_common(1)[0] if stats.shapes else ("", 0)
+    with _repeats_lock:
+        entry = _repeats.setdefault(
+            (method, route),
+            {"requests": 0, "max_statements": 0, "max_repeats": 0, "shape": ""},
+        )
+        entry["requests"] += 1
+        entry["max_statements"] = max(entry["max_statements"], stats.statements)
+        if repeats > entry["max_repeats"]:
+            entry["max_repeats"], entry["shape"] = repeats, shape
+    if repeats > settings.N_PLUS_ONE_THRESHOLD:
+        N_PLUS_ONE_REQUESTS.labels(method, route).inc()
+        logger.warning(
+            f"N+1 query on {method} {route}: {repeats} of {stats.statements} "
+            f"statements were {shape[:200]}"
+        )
+
+
+def repeated_statement_report() -> List[Dict]:
+    """
+    Per route, the most statements and the most repeats of one statement
+    shape seen in a single request, worst first. Empty unless
+    N_PLUS_ONE_THRESHOLD is set.
+    """
+    with _repeats_lock:
+        rows = [
+            {"method": method, "route": route, **entry}
+            for (method, route), entry in _repeats.items()
+        ]
+    return sorted(rows, key=lambda r: (-r["max_repeats"], r["route"]))
+
+
+# stage timings of a parse running in a pool worker, sent back with its result
+_stage_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "stage_timings", default=None
+)
+
+
+@contextmanager
+def parse_stage(stage: str) -> Iterator[None]:
+    """
+    Time one invoice processing stage. Inside `collect_parse_stages` the
+    timing is kept for the caller, otherwise it is recorded directly.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        collected = _stage_timings.get()
+        if collected is not None:
+            collected.append((stage, elapsed))
+        else:
+            INVOICE_PARSE_STAGE_SECONDS.labels(stage).observe(elapsed)
+
+
+@contextmanager
+def collect_parse_stages() -> Iterator[List[Tuple[str, float]]]:
+    """
+    Collect `parse_stage` timings instead of recording them, for parses
+    running in another process whose metrics would otherwise be lost.
+    """
+    collected: List[Tuple[str, float]] = []
+    token = _stage_timings.set(collected)
+    try:
+        yield collected
+    finally:
+        _stage_timings.reset(token)
+
+
+def record_parse_stages(timings: List[Tuple[str, float]]) -> None:
+    for stage, elapsed in timings:
+        INVOICE_PARSE_STAGE_SECONDS.labels(stage).observe(elapsed)
@@ -0,0 +1,199 @@
+"""
+In-process metrics registry.
+Counters and histograms with labels, rendered in the Prometheus text
+exposition format for `GET /metrics`. Every API worker process keeps its
+own values; scrape each worker (or run one) to see all of them.
+"""
+
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Counter:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Histogram:
+    """
+    Thread-safe histogram with fixed upper bounds, reported cumulatively
+    (each bucket counts observations <= its bound).
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(buckets)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.bounds, value)] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, buckets = 0, {}
+        for bound, count in zip(list(self.bounds) + ["+Inf"], counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"buckets": buckets, "count": cumulative, "sum": round(total, 6)}
+
+
+class Metric:
+    """
+    A named metric with one child (Counter or Histogram) per label values.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Sequence[str],
+        factory: Callable[[], Any],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._factory())
+        return child
+
+    def expose(self) -> List[str]:
+        series = [
+            (dict(zip(self.labelnames, key)), child)
+            for key, child in sorted(self._children.items())
+        ]
+        return expose(self.name, self.documentation, self.kind, series)
+
+
+REGISTRY: Dict[str, Metric] = {}
+# callables returning extra exposition lines, e.g. pool gauges
+COLLECTORS: List[Callable[[], List[str]]] = []
+
+
+def _register(metric: Metric) -> Metric:
+    if metric.name in REGISTRY:
+        raise ValueError(f"Metric {metric.name} already registered")
+    REGISTRY[metric.name] = metric
+    return metric
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Metric:
+    return _register(Metric(name, documentation, "counter", labelnames, Counter))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = LATENCY_BUCKETS,
+) -> Metric:
+    return _register(
+        Metric(name, documentation, "histogram", labelnames, lambda: Histogram(buckets))
+    )
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def expose(
+    name: str, documentation: str, kind: str, series: Iterable[Tuple[Dict, Any]]
+) -> List[str]:
+    """
+    Exposition lines of one metric.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        kind (str): "counter", "gauge" or "histogram".
+        series (Iterable[Tuple[Dict, Any]]): (labels, value) pairs; values
+            are numbers, Counters or Histograms.
+
+    Returns:
+        List[str]: HELP, TYPE and sample lines.
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, value in series:
+        if isinstance(value, Histogram):
+            snap = value.snapshot()
+            for bound, count in snap["buckets"].items():
+                le = _format_labels({**labels, "le": bound})
+                lines.append(f"{name}_bucket{le} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {snap['sum']!r}")
+            lines.append(f"{name}_count{_format_labels(labels)} {snap['count']}")
+        else:
+            number = value.value if isinstance(value, Counter) else value
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(number)}")
+    return lines
+
+
+def render_metrics() -> str:
+    """
+    Every registered metric and collector in the text exposition format.
+    """
+    lines: List[str] = []
+    for metric in REGISTRY.values():
+        lines.extend(metric.expose())
+    for collect in COLLECTORS:
+        try:
+            lines.extend(collect())
+        except Exception:
+            logger.exception("Metrics collector failed")
+    return "\n".join(lines) + "\n"
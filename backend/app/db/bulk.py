@@ -0,0 +1,193 @@
+"""
+Bulk inserts that bypass the ORM unit of work.
+On PostgreSQL (psycopg2) rows are streamed into the table with
+`COPY ... FROM STDIN` on the session's connection, inside its open
+transaction; when ids are wanted they are drawn from the table's sequence
+first. Other backends get one executemany INSERT, with RETURNING when ids
+are wanted.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# COPY data handed to the driver per read, in bytes (roughly)
+COPY_CHUNK_SIZE = 64 * 1024
+
+# backslash first, or the escapes of the others would be doubled
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value: Any) -> str:
+    """
+    One field in COPY text format.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _copy_number(value: Any) -> str:
+    return "\\N" if value is None else str(value)
+
+
+def _copy_integer(value: Any) -> str:
+    # COPY rejects "10.0" for an integer column where an INSERT would cast
+    # the float; round it the same way (half to even)
+    return "\\N" if value is None else str(round(value))
+
+
+def _copy_formatter(column) -> Callable[[Any], str]:
+    """
+    Numbers need no escaping and make up most fields of the wide tables;
+    everything else goes through `_copy_value`.
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return _copy_value
+    if python_type is int:
+        return _copy_integer
+    return _copy_number if python_type is float else _copy_value
+
+
+class _CopyStream:
+    """
+    File-like reader over COPY lines for `cursor.copy_expert`, so rows are
+    formatted as the driver sends them instead of all up front. Yields
+    UTF-8 bytes whatever the connection's client encoding.
+    """
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+
+    def read(self, size: int = COPY_CHUNK_SIZE) -> bytes:
+        chunk, length = [], 0
+        for line in self._lines:
+            chunk.append(line)
+            length += len(line)
+            if length >= size:
+                break
+        return "".join(chunk).encode("utf-8")
+
+
+def _python_defaults(model, given: Sequence[str]) -> Dict[str, Any]:
+    """
+    Values of the Python-side column defaults (created_at and the like)
+    for columns missing from the rows; COPY never sees them. Evaluated
+    once, so every row of a call gets the same timestamp.
+    """
+    defaults = {}
+    for column in model.__table__.columns:
+        default = column.default
+        if column.key in given or default is None or column.primary_key:
+            continue
+        if default.is_scalar:
+            defaults[column.key] = default.arg
+        elif default.is_callable:
+            defaults[column.key] = default.arg(None)
+    return defaults
+
+
+def bulk_insert(
+    db: Session,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    returning: bool = False,
+    match_on: Sequence[str] = (),
+) -> Optional[List[int]]:
+    """
+    Insert `rows` into `model`'s table in the session's transaction,
+    without committing.
+
+    Args:
+        db (Session): Database session.
+        model: Mapped class; rows hold its column keys.
+        rows (Sequence[Dict[str, Any]]): Rows to insert; all need the same keys.
+        returning (bool): Return the new ids, in row order.
+        match_on (Sequence[str]): Columns identifying a row, used to match
+            RETURNING rows back to `rows` on backends that do not return
+            them in order (SQLite); rows equal on them must be
+            interchangeable. Without it those backends insert one row at a
+            time to keep the order.
+
+    Returns:
+        Optional[List[int]]: Ids of the inserted rows when `returning`.
+    """
+    if not rows:
+        return [] if returning else None
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2":
+        return _copy_rows(db, model, rows, returning)
+
+    # a Core insert: the ORM's bulk insert splits rows into one statement
+    # per run of rows with the same None columns
+    table = model.__table__
+    if not returning:
+        db.execute(insert(table), list(rows))
+        return None
+    if not match_on:
+        return list(
+            db.scalars(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True),
+                list(rows),
+            )
+        )
+    positions: Dict[tuple, List[int]] = defaultdict(list)
+    for n, row in enumerate(rows):
+        positions[tuple(row[key] for key in match_on)].append(n)
+    ids = [0] * len(rows)
+    columns = [table.c[key] for key in match_on]
+    for inserted in db.execute(insert(table).returning(table.c.id, *columns), list(rows)):
+        ids[positions[tuple(inserted[1:])].pop()] = inserted[0]
+    return ids
+
+
+def _copy_rows(
+    db: Session, model, rows: Sequence[Dict[str, Any]], returning: bool
+) -> Optional[List[int]]:
+    table = model.__table__
+    keys = list(rows[0])
+    defaults = _python_defaults(model, keys)
+    columns = list(keys) + list(defaults)
+    ids = None
+    if returning:
+        # COPY cannot return ids; take them from the sequence up front
+        ids = list(
+            db.scalars(
+                text(
+                    "SELECT nextval(pg_get_serial_sequence(:table, 'id')) "
+                    "FROM generate_series(1, :count)"
+                ),
+                {"table": table.name, "count": len(rows)},
+            )
+        )
+        columns.insert(0, "id")
+    formatters = [(key, _copy_formatter(table.columns[key])) for key in keys]
+    # the same for every row, so formatted once
+    suffix = "".join("\t" + _copy_value(value) for value in defaults.values()) + "\n"
+
+    preparer = db.get_bind().dialect.identifier_preparer
+    statement = "COPY {} ({}) FROM STDIN (ENCODING 'UTF8')".format(
+        preparer.format_table(table),
+        ", ".join(preparer.quote(table.columns[key].name) for key in columns),
+    )
+    lines = (
+        "\t".join([fmt(row[key]) for key, fmt in formatters]) + suffix for row in rows
+    )
+    if ids is not None:
+        lines = (f"{i}\t{line}" for i, line in zip(ids, lines))
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(statement, _CopyStream(lines), size=COPY_CHUNK_SIZE)
+    logger.debug(f"Copied {len(rows)} rows into {table.name}")
+    return ids
@@ -11,4 +11,9 @@ from .item_conversion_map import ItemConversionMap
 from .audit_log import AuditLog
 from .item_alias import ItemAlias
 from .inventory_txn import InventoryTxn
+from .stock_balance import StockBalance
+from .pnl_daily import PnlDaily
+from .refresh_watermark import RefreshWatermark
+from .seed_version import SeedVersion
+from .sync_tombstone import SyncTombstone
 from .uom import UOM
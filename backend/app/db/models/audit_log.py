@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Index, Text
 from datetime import datetime
 from .base_class import Base
 
 
 class AuditLog(Base):
     __tablename__ = "audit_log"
+    __table_args__ = (Index("ix_audit_log_timestamp", "timestamp", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)
@@ -1,9 +1,23 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, Date
+from sqlalchemy import Column, Integer, ForeignKey, String, Date, Index, text
 from sqlalchemy.orm import relationship
 from .base_class import Base
 from .mixins import AuditMixin
 
 class Batch(Base, AuditMixin):
+    __table_args__ = (
+        Index("ix_batch_item_received", "item_id", "received_at"),
+        Index("ix_batch_item_created", "item_id", "created_at"),
+        Index("ix_batch_created", "created_at", "id"),
+        Index("ix_batch_updated", "updated_at", "id"),
+        # most batches end up dispatched to zero; keep the live ones apart
+        Index(
+            "ix_batch_in_stock",
+            "item_id",
+            "created_at",
+            postgresql_where=text("quantity > 0"),
+            sqlite_where=text("quantity > 0"),
+        ),
+    )
     id = Column(Integer, primary_key=True, index=True)
     item_id = Column(Integer, ForeignKey("item.id"), nullable=False)
     quantity = Column(Integer, nullable=False)
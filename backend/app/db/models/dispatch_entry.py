@@ -3,6 +3,7 @@ from sqlalchemy import (
     Integer,
     ForeignKey,
     Date,
+    Index,
     Float,
     String,
     UniqueConstraint,
@@ -18,6 +19,10 @@ class DispatchEntry(Base, AuditMixin):
         UniqueConstraint(
             "batch_id", "dispatch_date", "mart_name", name="uq_dispatch_entry"
         ),
+        Index("ix_dispatch_entry_item_mart_date", "item_id", "mart_name", "dispatch_date"),
+        Index("ix_dispatch_entry_date_mart", "dispatch_date", "mart_name"),
+        Index("ix_dispatch_entry_created", "created_at", "id"),
+        Index("ix_dispatch_entry_updated", "updated_at", "id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
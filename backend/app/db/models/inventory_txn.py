@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .base_class import Base
 from datetime import datetime
@@ -6,6 +6,7 @@ from datetime import datetime
 
 class InventoryTxn(Base):
     __tablename__ = "inventory_txn"
+    __table_args__ = (Index("ix_inventory_txn_item_created", "item_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     item_id = Column(Integer, ForeignKey("item.id"), nullable=False)
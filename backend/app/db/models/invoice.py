@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, Float
+from sqlalchemy import Column, Integer, String, Date, Boolean, Float, Index
 from .base_class import Base
 from .mixins import AuditMixin
 from sqlalchemy.orm import relationship
@@ -6,6 +6,11 @@ from sqlalchemy.orm import relationship
 
 class Invoice(Base, AuditMixin):
     __tablename__ = "invoice"
+    __table_args__ = (
+        Index("ix_invoice_mart_date", "mart_name", "invoice_date"),
+        Index("ix_invoice_invoice_date", "invoice_date"),
+        Index("ix_invoice_created", "created_at", "id"),
+    )
      
     id = Column(Integer, primary_key=True, index=True)
     mart_name = Column(String, nullable=False)
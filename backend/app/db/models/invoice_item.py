@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .base_class import Base
 from .mixins import AuditMixin
 
 class InvoiceItem(Base, AuditMixin):
     __tablename__ = "invoice_item"
+    __table_args__ = (
+        Index("ix_invoice_item_invoice_id", "invoice_id"),
+        Index("ix_invoice_item_store_date", "store_name", "invoice_date"),
+        Index("ix_invoice_item_invoice_date", "invoice_date"),
+        Index("ix_invoice_item_updated_at", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     invoice_id = Column(Integer, ForeignKey("invoice.id"), nullable=False)
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from .base_class import Base
 from .mixins import AuditMixin
 from sqlalchemy.orm import relationship
 
 
 class Item(Base, AuditMixin):
+    __table_args__ = (Index("ix_item_updated", "updated_at", "id"),)
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True, nullable=False)
     item_code = Column(String, unique=False, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Float, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Float, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from .base_class import Base
 from .mixins import AuditMixin
@@ -7,6 +7,17 @@ class Order(Base, AuditMixin):
     __tablename__ = "order"
     __table_args__ = (
             UniqueConstraint("item_id", "order_date", "mart_name", name="uq_order_unique_combination"),
+            # the open order per item and mart, looked up on every dispatch
+            Index(
+                "ix_order_open",
+                "item_id",
+                "mart_name",
+                postgresql_where=text("status <> 'Completed'"),
+                sqlite_where=text("status <> 'Completed'"),
+            ),
+            Index("ix_order_date_mart", "order_date", "mart_name"),
+            Index("ix_order_created", "created_at", "id"),
+            Index("ix_order_updated", "updated_at", "id"),
         )
     id = Column(Integer, primary_key=True, index=True)
     item_id = Column(Integer, ForeignKey("item.id"), nullable=False)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Date, Float, DateTime, UniqueConstraint
+from .base_class import Base
+from datetime import datetime
+
+
+class PnlDaily(Base):
+    """
+    Materialized P&L per mart and day, refreshed from invoice items,
+    dispatches and stock entries by app.services.pnl_summary.
+    """
+
+    __tablename__ = "pnl_daily"
+    __table_args__ = (
+        UniqueConstraint("date", "mart_name", name="uq_pnl_daily_date_mart"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    mart_name = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
+    total_sales = Column(Float, nullable=False, default=0.0)
+    total_purchase = Column(Float, nullable=False, default=0.0)
+    profit = Column(Float, nullable=False, default=0.0)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime
+from .base_class import Base
+
+
+class RefreshWatermark(Base):
+    """
+    High-water mark of the last incremental refresh of a derived table.
+    """
+
+    __tablename__ = "refresh_watermark"
+
+    name = Column(String(64), primary_key=True)
+    watermark = Column(DateTime, nullable=False)
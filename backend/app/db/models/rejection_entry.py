@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Index, Text
 from sqlalchemy.orm import relationship
 from .base_class import Base
 from .mixins import AuditMixin
 
 class RejectionEntry(Base, AuditMixin):
     __tablename__ = "rejection_entries"
+    __table_args__ = (
+        Index("ix_rejection_entries_date", "rejection_date"),
+        Index("ix_rejection_entries_created", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     item_id = Column(Integer, ForeignKey("item.id"), nullable=False)
     batch_id = Column(Integer, ForeignKey("batch.id"), nullable=True)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, String
+from .base_class import Base
+
+
+class SeedVersion(Base):
+    """
+    Fingerprint of the seed data last applied, so unchanged seeds are skipped.
+    """
+
+    __tablename__ = "seed_version"
+
+    name = Column(String(64), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    applied_at = Column(DateTime, nullable=False)
@@ -0,0 +1,44 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    ForeignKey,
+    Index,
+    func,
+    literal_column,
+)
+from sqlalchemy.orm import relationship
+from .base_class import Base
+from datetime import datetime
+
+
+class StockBalance(Base):
+    """
+    Running stock per (item, batch, base unit), maintained alongside
+    every inventory_txn insert.
+    """
+
+    __tablename__ = "stock_balance"
+
+    id = Column(Integer, primary_key=True, index=True)
+    item_id = Column(Integer, ForeignKey("item.id"), nullable=False)
+    batch_id = Column(Integer, ForeignKey("batch.id"), nullable=True)
+    base_unit = Column(String(16), nullable=False)
+    quantity = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    item = relationship("Item")
+    batch = relationship("Batch")
+
+
+# batch_id is nullable like inventory_txn.batch_id; coalesce it so batchless
+# movements share one row per item and unit (literal 0 so ON CONFLICT
+# targets match the index expression)
+STOCK_BALANCE_KEY = (
+    StockBalance.item_id,
+    func.coalesce(StockBalance.batch_id, literal_column("0")),
+    StockBalance.base_unit,
+)
+Index("uq_stock_balance_key", *STOCK_BALANCE_KEY, unique=True)
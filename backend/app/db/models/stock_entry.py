@@ -1,9 +1,20 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, String, Float
+from sqlalchemy import Column, Integer, ForeignKey, Date, String, Float, Index
 from sqlalchemy.orm import relationship
 from .base_class import Base
 from .mixins import AuditMixin
 
 class StockEntry(Base, AuditMixin):
+    __table_args__ = (
+        # covers the per-batch price lookup of the P&L refresh
+        Index(
+            "ix_stockentry_batch_price",
+            "batch_id",
+            postgresql_include=["price_per_unit", "quantity"],
+        ),
+        Index("ix_stockentry_received_date", "received_date"),
+        Index("ix_stockentry_updated", "updated_at", "id"),
+        Index("ix_stockentry_created", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     item_id = Column(Integer, ForeignKey("item.id"), nullable=False) 
     batch_id = Column(Integer, ForeignKey("batch.id"), nullable=False)
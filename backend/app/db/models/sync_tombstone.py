@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String
+from .base_class import Base
+
+
+class SyncTombstone(Base):
+    """
+    Record of a deleted row, served to clients by the delta sync.
+    """
+
+    __tablename__ = "sync_tombstone"
+    __table_args__ = (Index("ix_sync_tombstone_deleted", "deleted_at", "id"),)
+
+    id = Column(Integer, primary_key=True)
+    table_name = Column(String(64), nullable=False)
+    record_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
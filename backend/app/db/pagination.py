@@ -0,0 +1,140 @@
+"""
+Keyset pagination for list endpoints.
+Pages are ordered newest first on (created_at, id) and continue from an
+opaque cursor holding the last row's key, so a deep page costs the same
+as the first one instead of reading and discarding OFFSET rows.
+created_at is nullable; rows without one sort first, as Postgres orders
+NULLs in a descending index scan, and their cursors carry a null.
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, List, Literal, NamedTuple, Optional, Tuple
+
+from fastapi import Response
+from sqlalchemy import or_, tuple_
+from sqlalchemy.orm import Query
+
+from app.core.exceptions import AppException
+
+logger = logging.getLogger(__name__)
+
+CountMode = Literal["exact", "estimate"]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+PAGE_HEADERS = [NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER]
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+    total: Optional[int]
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    raw = json.dumps([created_at and created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        AppException: If the cursor is malformed (400).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        if created_at is not None:
+            created_at = datetime.fromisoformat(created_at)
+        return created_at, int(row_id)
+    except (ValueError, TypeError):
+        logger.error(f"Invalid pagination cursor {cursor!r}")
+        raise AppException("Invalid cursor", status_code=400)
+
+
+def count_rows(query: Query, mode: CountMode) -> int:
+    """
+    Row count of a list query, exact or estimated.
+
+    The estimate is the planner's row estimate on Postgres, which costs no
+    table scan; other databases fall back to an exact count.
+
+    Args:
+        query (Query): The filtered list query.
+        mode (CountMode): "exact" or "estimate".
+
+    Returns:
+        int: Number of rows.
+    """
+    query = query.order_by(None)
+    connection = query.session.connection()
+    if mode == "estimate" and connection.dialect.name == "postgresql":
+        compiled = query.statement.compile(
+            dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+        )
+        params = compiled.params
+        if compiled.positional:
+            # asyncpg binds by position ($1, $2, ...)
+            params = tuple(params[name] for name in compiled.positiontup)
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", params
+        ).scalar()
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return query.count()
+
+
+def paginate(
+    query: Query,
+    key: Tuple[Any, Any],
+    cursor: Optional[str],
+    limit: int,
+    count: Optional[CountMode] = None,
+) -> Page:
+    """
+    Fetch one page of a list query, newest first.
+
+    Args:
+        query (Query): Filtered query without ordering or limits.
+        key (Tuple[Any, Any]): (timestamp column, id column) to page on.
+        cursor (Optional[str]): Cursor from the previous page, or None.
+        limit (int): Maximum rows per page.
+        count (Optional[CountMode]): Also count all matching rows.
+
+    Returns:
+        Page: Rows, the cursor of the next page (None on the last page)
+        and the total when requested.
+    """
+    created, row_id = key
+    total = count_rows(query, count) if count else None
+    if cursor:
+        after_created, after_id = decode_cursor(cursor)
+        if after_created is None:
+            # still among the rows without a timestamp; all dated rows follow
+            query = query.filter(or_(created.is_not(None), row_id < after_id))
+        else:
+            # the tuple comparison is NULL, so undated rows (already served) drop out
+            query = query.filter(tuple_(created, row_id) < tuple_(after_created, after_id))
+    rows = (
+        query.order_by(created.desc().nulls_first(), row_id.desc()).limit(limit + 1).all()
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, created.key), getattr(last, row_id.key))
+    return Page(rows, next_cursor, total)
+
+
+def set_page_headers(response: Response, page: Page) -> None:
+    """
+    Expose the next cursor and total of a plain list response as headers.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(page.total)
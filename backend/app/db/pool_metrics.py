@@ -0,0 +1,183 @@
+"""
+Connection pool metrics.
+Counts checkouts, overflow connections and timeouts, and keeps histograms
+of checkout wait time, how long connections are held and how long they
+live, so pool size and overflow can be set from measurements instead of
+guessed. Each API worker process has its own pools and its own numbers;
+they are served by `GET /v1/db/pool` and `GET /metrics`.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.core.metrics import COLLECTORS, Histogram, expose
+
+logger = logging.getLogger(__name__)
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+HOLD_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 300.0)
+LIFETIME_BUCKETS = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0, 86400.0)
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self.engine: Optional[Engine] = None
+        self.wait = Histogram(WAIT_BUCKETS)
+        self.hold = Histogram(HOLD_BUCKETS)
+        self.lifetime = Histogram(LIFETIME_BUCKETS)
+        self.counters = dict.fromkeys(
+            ("connects", "checkouts", "overflows", "timeouts", "invalidations"), 0
+        )
+        self.peak_checked_out = 0
+        self._lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def observe_checked_out(self, checked_out: int) -> None:
+        with self._lock:
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def snapshot(self) -> Dict:
+        pool = self.engine.pool
+        data: Dict = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                timeout=pool.timeout(),
+            )
+        with self._lock:
+            data.update(self.counters, peak_checked_out=self.peak_checked_out)
+        data.update(
+            wait_seconds=self.wait.snapshot(),
+            hold_seconds=self.hold.snapshot(),
+            lifetime_seconds=self.lifetime.snapshot(),
+        )
+        return data
+
+
+# metrics per engine name ("sync", "async")
+POOL_METRICS: Dict[str, PoolMetrics] = {}
+
+
+def timed_pool_class(base: Type[QueuePool], metrics: PoolMetrics) -> Type[QueuePool]:
+    """
+    Subclass of a queue pool that records checkout wait time, timeouts and
+    overflow connections in `metrics`. Pool events fire only once a
+    connection is handed out, so these are measured inside the pool.
+    """
+
+    class TimedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                metrics.count("timeouts")
+                raise
+            finally:
+                metrics.wait.observe(time.perf_counter() - start)
+
+        def _inc_overflow(self):
+            if not super()._inc_overflow():
+                return False
+            # the first pool_size connections count up from -pool_size
+            if self.overflow() > 0:
+                metrics.count("overflows")
+            return True
+
+    TimedPool.__name__ = TimedPool.__qualname__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+def instrument_pool(engine: Engine, metrics: PoolMetrics) -> None:
+    """
+    Attach pool event listeners feeding `metrics` and register it.
+
+    Args:
+        engine (Engine): Sync engine, or an async engine's `sync_engine`.
+        metrics (PoolMetrics): Metrics to update.
+    """
+    metrics.engine = engine
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, record) -> None:
+        record.info["connected_at"] = time.monotonic()
+        metrics.count("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, record, proxy) -> None:
+        record.info["checked_out_at"] = time.monotonic()
+        metrics.count("checkouts")
+        if isinstance(engine.pool, QueuePool):
+            metrics.observe_checked_out(engine.pool.checkedout())
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, record) -> None:
+        started = record.info.pop("checked_out_at", None)
+        if started is not None:
+            metrics.hold.observe(time.monotonic() - started)
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, record, exception) -> None:
+        metrics.count("invalidations")
+
+    @event.listens_for(engine, "close")
+    def on_close(dbapi_connection, record) -> None:
+        connected = record.info.pop("connected_at", None)
+        if connected is not None:
+            metrics.lifetime.observe(time.monotonic() - connected)
+
+    POOL_METRICS[metrics.name] = metrics
+
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """
+    Current pool state and metrics of every instrumented engine.
+    """
+    return {name: m.snapshot() for name, m in POOL_METRICS.items()}
+
+
+# gauge/counter fields of a snapshot, exposed as db_pool_<field>
+_POOL_GAUGES = ("size", "checked_out", "checked_in", "overflow", "peak_checked_out")
+_POOL_COUNTERS = ("connects", "checkouts", "overflows", "timeouts", "invalidations")
+_POOL_HISTOGRAMS = {
+    "wait": "Seconds waited for a connection at checkout",
+    "hold": "Seconds a connection stayed checked out",
+    "lifetime": "Seconds a connection lived before it was closed",
+}
+
+
+def collect_pool_metrics() -> List[str]:
+    snapshots = {name: m.snapshot() for name, m in POOL_METRICS.items()}
+    lines: List[str] = []
+    for field in _POOL_GAUGES:
+        series = [
+            ({"engine": name}, snap[field])
+            for name, snap in snapshots.items()
+            if field in snap
+        ]
+        lines += expose(f"db_pool_{field}", f"Pool {field}", "gauge", series)
+    for field in _POOL_COUNTERS:
+        series = [({"engine": name}, snap[field]) for name, snap in snapshots.items()]
+        lines += expose(f"db_pool_{field}_total", f"Pool {field}", "counter", series)
+    for field, documentation in _POOL_HISTOGRAMS.items():
+        series = [
+            ({"engine": name}, getattr(m, field)) for name, m in POOL_METRICS.items()
+        ]
+        lines += expose(f"db_pool_{field}_seconds", documentation, "histogram", series)
+    return lines
+
+
+COLLECTORS.append(collect_pool_metrics)
@@ -13,7 +13,7 @@ class DispatchEntryBase(BaseModel):
 
 
 class DispatchEntryCreate(DispatchEntryBase):
-    pass
+    remarks: Optional[str] = None
 
 class DispatchEntryUpdate(BaseModel):
     mart_name: Optional[str] = None
@@ -1,8 +1,10 @@
 from datetime import date
+from typing import Optional
 from pydantic import BaseModel
 
 
 class PnlSummaryRead(BaseModel):
+    mart_name: Optional[str] = None
     date: date
     total_purchase: float
     total_sales: float
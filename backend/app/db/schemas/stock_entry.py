@@ -35,4 +35,14 @@ class StockEntryUpdate(BaseModel):
     total_cost: Optional[float] = None
     source: Optional[str] = None
     quantity: Optional[float] = None
-    unit: Optional[str] = None
\ No newline at end of file
+    unit: Optional[str] = None
+
+
+class StockEntryBulkResult(BaseModel):
+    # position of the receipt in the request body
+    index: int
+    stock_entry_id: Optional[int] = None
+    batch_id: Optional[int] = None
+    new_batch: bool = False
+    # set when the receipt was rejected; the others are still saved
+    error: Optional[str] = None
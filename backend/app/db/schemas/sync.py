@@ -0,0 +1,27 @@
+from typing import Generic, List, TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.db.schemas.batch import BatchRead
+from app.db.schemas.dispatch_entry import DispatchEntryRead
+from app.db.schemas.item import ItemRead
+from app.db.schemas.order import OrderRead
+from app.db.schemas.stock_entry import StockEntryRead
+
+RowT = TypeVar("RowT")
+
+
+class TableChanges(BaseModel, Generic[RowT]):
+    created: List[RowT] = []
+    updated: List[RowT] = []
+    deleted: List[int] = Field([], description="IDs of deleted rows")
+
+
+class SyncResponse(BaseModel):
+    token: str = Field(..., description="Pass as ?since= on the next sync")
+    has_more: bool = Field(..., description="Sync again right away for the rest")
+    items: TableChanges[ItemRead]
+    batches: TableChanges[BatchRead]
+    orders: TableChanges[OrderRead]
+    dispatch_entries: TableChanges[DispatchEntryRead]
+    stock_entries: TableChanges[StockEntryRead]
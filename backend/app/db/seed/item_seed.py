@@ -1,134 +1,137 @@
 # app/db/seed/item_seed.py
 
-from sqlalchemy import func
+from datetime import datetime
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+
 from app.db.models.item import Item
 from app.db.models.uom import UOM
-from datetime import datetime
+from app.db.seed.upsert import insert_missing, normalize
 
+ITEMS = [
+    {"name": "APPLE AMBRI ", "item_code": "", "default_uom": "KG"},
+    {"name": "APPLE FUJI", "item_code": "", "default_uom": "KG"},
+    {"name": "APPLE GRANNY SMITH ", "item_code": "", "default_uom": "KG"},
+    {"name": "APPLE JAMMU KASHMIR VALUE", "item_code": "", "default_uom": "KG"},
+    {"name": "APPLE PINK LADY", "item_code": "", "default_uom": "KG"},
+    {"name": "APPLE RED DELICIOUS ", "item_code": "", "default_uom": "KG"},
+    {"name": "APPLE ROYAL GALA ", "item_code": "", "default_uom": "KG"},
+    {"name": "APPLE SHIMLA", "item_code": "", "default_uom": "KG"},
+    {"name": "AVACADO", "item_code": "", "default_uom": "EA"},
+    {"name": "BABY CORN PEELED 200 GM", "item_code": "", "default_uom": "EA"},
+    {"name": "BANANA KARPURAVALLI ", "item_code": "", "default_uom": "KG"},
+    {"name": "BANANA RAW ", "item_code": "", "default_uom": "KG"},
+    {"name": "BANANA ROBUSTA", "item_code": "", "default_uom": "KG"},
+    {"name": "BEET ROOT ", "item_code": "", "default_uom": "KG"},
+    {
+        "name": "DRAGON FRUIT (WHITE FLESH)",
+        "item_code": "",
+        "default_uom": "EA",
+    },
+    {"name": "BITTER GOURD ", "item_code": "", "default_uom": "KG"},
+    {"name": "BLUE BERRY", "item_code": "", "default_uom": "KG"},
+    {"name": "BOTTLE GOURD ", "item_code": "", "default_uom": "KG"},
+    {"name": "BRINJAL BLACK BIG ", "item_code": "", "default_uom": "KG"},
+    {"name": "BRINJAL LONG GREEN", "item_code": "", "default_uom": "KG"},
+    {"name": "BRINJAL LONG PURPLE ", "item_code": "", "default_uom": "KG"},
+    {"name": "BRINJAL NAGPURE", "item_code": "", "default_uom": "KG"},
+    {"name": "BUTTON MUSHROOM 200GM TP", "item_code": "", "default_uom": "EA"},
+    {"name": "CABBAGE REGULAR ", "item_code": "", "default_uom": "KG"},
+    {"name": "CAPSICUM GREEN", "item_code": "", "default_uom": "KG"},
+    {"name": "CAPSICUM RED ", "item_code": "", "default_uom": "KG"},
+    {"name": "CAPSICUM YELLOW ", "item_code": "", "default_uom": "KG"},
+    {"name": "CARROT DELHI", "item_code": "", "default_uom": "KG"},
+    {"name": "CARROT REGULAR ", "item_code": "", "default_uom": "KG"},
+    {"name": "CHILLI GREEN ", "item_code": "", "default_uom": "KG"},
+    {"name": "COCONUT TENDER", "item_code": "", "default_uom": "EA"},
+    {"name": "COCONUT", "item_code": "", "default_uom": "EA"},
+    {"name": "COCCINIEA", "item_code": "", "default_uom": "KG"},
+    {"name": "CORRIANDER S", "item_code": "", "default_uom": "KG"},
+    {"name": "CUCUMBER KEERA ", "item_code": "", "default_uom": "KG"},
+    {"name": "FRENCH BEANS ", "item_code": "", "default_uom": "KG"},
+    {"name": "GARLIC INDIAN ", "item_code": "", "default_uom": "KG"},
+    {"name": "GINGER ", "item_code": "", "default_uom": "KG"},
+    {"name": "GOOSEBERRY AMLA BIG ", "item_code": "", "default_uom": "KG"},
+    {"name": "GRAPES IMP RED GLOBE CHINA ", "item_code": "", "default_uom": "KG"},
+    {"name": "GRAPES SONAKA PACK", "item_code": "", "default_uom": "EA"},
+    {"name": "GUAVA WHITE", "item_code": "", "default_uom": "KG"},
+    {"name": "KIWI", "item_code": "", "default_uom": "EA"},
+    {"name": "LEMON", "item_code": "", "default_uom": "EA"},
+    {"name": "LITCHI", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO ALPHANSO", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO BANGANAPALLI", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO DUSSHERI", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO GULABKHAS ", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO HIMSAGAR", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO JARDALU", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO KESAR", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO LANGDA ", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO NEELAM", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO RASPURI ", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO SINDURI", "item_code": "", "default_uom": "KG"},
+    {"name": "MANGO TOTAPURI", "item_code": "", "default_uom": "KG"},
+    {"name": "MINT LEAVES BUNCH", "item_code": "", "default_uom": "EA"},
+    {"name": "MOSAMBI SMALL", "item_code": "", "default_uom": "KG"},
+    {"name": "MUSK MELON ", "item_code": "", "default_uom": "KG"},
+    {"name": "OKRA", "item_code": "", "default_uom": "KG"},
+    {"name": "ONION", "item_code": "", "default_uom": "KG"},
+    {"name": "ORANGE IMPORTED EGYPT ", "item_code": "", "default_uom": "KG"},
+    {"name": "ORANGE SMALL ", "item_code": "", "default_uom": "KG"},
+    {"name": "P GARLIC", "item_code": "", "default_uom": "KG"},
+    {"name": "PAPAYA DISCO", "item_code": "", "default_uom": "KG"},
+    {"name": "PEARS BABUGOSHA ", "item_code": "", "default_uom": "KG"},
+    {"name": "PEARS IMP PACKHAM RSA ", "item_code": "", "default_uom": "KG"},
+    {"name": "PINEAPPLE", "item_code": "", "default_uom": "EA"},
+    {"name": "PLUM IMPORTED CHINA ", "item_code": "", "default_uom": "KG"},
+    {"name": "POINTED GOURD", "item_code": "", "default_uom": "KG"},
+    {"name": "POMEGRANATE KESAR ", "item_code": "", "default_uom": "KG"},
+    {"name": "POTATO", "item_code": "", "default_uom": "KG"},
+    {"name": "PUMPKIN DISCO ", "item_code": "", "default_uom": "KG"},
+    {"name": "RAW MANGO ", "item_code": "", "default_uom": "KG"},
+    {"name": "SPONGE GOURD ", "item_code": "", "default_uom": "KG"},
+    {"name": "SUGAR BABY MELON", "item_code": "", "default_uom": "KG"},
+    {"name": "SUN MELON ", "item_code": "", "default_uom": "KG"},
+    {"name": "SWEET CORN SHELLED 200 GMS", "item_code": "", "default_uom": "EA"},
+    {"name": "SWEET POTATO ", "item_code": "", "default_uom": "KG"},
+    {"name": "SWEET TAMARIND", "item_code": "", "default_uom": "EA"},
+    {"name": "TENDER JACKFRUIT", "item_code": "", "default_uom": "KG"},
+    {"name": "TOMATO", "item_code": "", "default_uom": "KG"},
+    {"name": "WATER MELON NAMDHARI", "item_code": "", "default_uom": "KG"},
+    {"name": "WATERMELON", "item_code": "", "default_uom": "KG"},
+    {"name": "WATERMELON KIRAN", "item_code": "", "default_uom": "KG"},
+    {"name": "WATERMELON SARASWATI ", "item_code": "", "default_uom": "KG"},
+    {"name": "WOOD APPLE", "item_code": "", "default_uom": "KG"},
+]
 
-def seed_items(db: Session, created_by: str = "system") -> None:
-    item_data = [
-        {"name": "APPLE AMBRI ", "item_code": "", "default_uom": "KG"},
-        {"name": "APPLE FUJI", "item_code": "", "default_uom": "KG"},
-        {"name": "APPLE GRANNY SMITH ", "item_code": "", "default_uom": "KG"},
-        {"name": "APPLE JAMMU KASHMIR VALUE", "item_code": "", "default_uom": "KG"},
-        {"name": "APPLE PINK LADY", "item_code": "", "default_uom": "KG"},
-        {"name": "APPLE RED DELICIOUS ", "item_code": "", "default_uom": "KG"},
-        {"name": "APPLE ROYAL GALA ", "item_code": "", "default_uom": "KG"},
-        {"name": "APPLE SHIMLA", "item_code": "", "default_uom": "KG"},
-        {"name": "AVACADO", "item_code": "", "default_uom": "EA"},
-        {"name": "BABY CORN PEELED 200 GM", "item_code": "", "default_uom": "EA"},
-        {"name": "BANANA KARPURAVALLI ", "item_code": "", "default_uom": "KG"},
-        {"name": "BANANA RAW ", "item_code": "", "default_uom": "KG"},
-        {"name": "BANANA ROBUSTA", "item_code": "", "default_uom": "KG"},
-        {"name": "BEET ROOT ", "item_code": "", "default_uom": "KG"},
-        {
-            "name": "DRAGON FRUIT (WHITE FLESH)",
-            "item_code": "",
-            "default_uom": "EA",
-        },
-        {"name": "BITTER GOURD ", "item_code": "", "default_uom": "KG"},
-        {"name": "BLUE BERRY", "item_code": "", "default_uom": "KG"},
-        {"name": "BOTTLE GOURD ", "item_code": "", "default_uom": "KG"},
-        {"name": "BRINJAL BLACK BIG ", "item_code": "", "default_uom": "KG"},
-        {"name": "BRINJAL LONG GREEN", "item_code": "", "default_uom": "KG"},
-        {"name": "BRINJAL LONG PURPLE ", "item_code": "", "default_uom": "KG"},
-        {"name": "BRINJAL NAGPURE", "item_code": "", "default_uom": "KG"},
-        {"name": "BUTTON MUSHROOM 200GM TP", "item_code": "", "default_uom": "EA"},
-        {"name": "CABBAGE REGULAR ", "item_code": "", "default_uom": "KG"},
-        {"name": "CAPSICUM GREEN", "item_code": "", "default_uom": "KG"},
-        {"name": "CAPSICUM RED ", "item_code": "", "default_uom": "KG"},
-        {"name": "CAPSICUM YELLOW ", "item_code": "", "default_uom": "KG"},
-        {"name": "CARROT DELHI", "item_code": "", "default_uom": "KG"},
-        {"name": "CARROT REGULAR ", "item_code": "", "default_uom": "KG"},
-        {"name": "CHILLI GREEN ", "item_code": "", "default_uom": "KG"},
-        {"name": "COCONUT TENDER", "item_code": "", "default_uom": "EA"},
-        {"name": "COCONUT", "item_code": "", "default_uom": "EA"},
-        {"name": "COCCINIEA", "item_code": "", "default_uom": "KG"},
-        {"name": "CORRIANDER S", "item_code": "", "default_uom": "KG"},
-        {"name": "CUCUMBER KEERA ", "item_code": "", "default_uom": "KG"},
-        {"name": "FRENCH BEANS ", "item_code": "", "default_uom": "KG"},
-        {"name": "GARLIC INDIAN ", "item_code": "", "default_uom": "KG"},
-        {"name": "GINGER ", "item_code": "", "default_uom": "KG"},
-        {"name": "GOOSEBERRY AMLA BIG ", "item_code": "", "default_uom": "KG"},
-        {"name": "GRAPES IMP RED GLOBE CHINA ", "item_code": "", "default_uom": "KG"},
-        {"name": "GRAPES SONAKA PACK", "item_code": "", "default_uom": "EA"},
-        {"name": "GUAVA WHITE", "item_code": "", "default_uom": "KG"},
-        {"name": "KIWI", "item_code": "", "default_uom": "EA"},
-        {"name": "LEMON", "item_code": "", "default_uom": "EA"},
-        {"name": "LITCHI", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO ALPHANSO", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO BANGANAPALLI", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO DUSSHERI", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO GULABKHAS ", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO HIMSAGAR", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO JARDALU", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO KESAR", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO LANGDA ", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO NEELAM", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO RASPURI ", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO SINDURI", "item_code": "", "default_uom": "KG"},
-        {"name": "MANGO TOTAPURI", "item_code": "", "default_uom": "KG"},
-        {"name": "MINT LEAVES BUNCH", "item_code": "", "default_uom": "EA"},
-        {"name": "MOSAMBI SMALL", "item_code": "", "default_uom": "KG"},
-        {"name": "MUSK MELON ", "item_code": "", "default_uom": "KG"},
-        {"name": "OKRA", "item_code": "", "default_uom": "KG"},
-        {"name": "ONION", "item_code": "", "default_uom": "KG"},
-        {"name": "ORANGE IMPORTED EGYPT ", "item_code": "", "default_uom": "KG"},
-        {"name": "ORANGE SMALL ", "item_code": "", "default_uom": "KG"},
-        {"name": "P GARLIC", "item_code": "", "default_uom": "KG"},
-        {"name": "PAPAYA DISCO", "item_code": "", "default_uom": "KG"},
-        {"name": "PEARS BABUGOSHA ", "item_code": "", "default_uom": "KG"},
-        {"name": "PEARS IMP PACKHAM RSA ", "item_code": "", "default_uom": "KG"},
-        {"name": "PINEAPPLE", "item_code": "", "default_uom": "EA"},
-        {"name": "PLUM IMPORTED CHINA ", "item_code": "", "default_uom": "KG"},
-        {"name": "POINTED GOURD", "item_code": "", "default_uom": "KG"},
-        {"name": "POMEGRANATE KESAR ", "item_code": "", "default_uom": "KG"},
-        {"name": "POTATO", "item_code": "", "default_uom": "KG"},
-        {"name": "PUMPKIN DISCO ", "item_code": "", "default_uom": "KG"},
-        {"name": "RAW MANGO ", "item_code": "", "default_uom": "KG"},
-        {"name": "SPONGE GOURD ", "item_code": "", "default_uom": "KG"},
-        {"name": "SUGAR BABY MELON", "item_code": "", "default_uom": "KG"},
-        {"name": "SUN MELON ", "item_code": "", "default_uom": "KG"},
-        {"name": "SWEET CORN SHELLED 200 GMS", "item_code": "", "default_uom": "EA"},
-        {"name": "SWEET POTATO ", "item_code": "", "default_uom": "KG"},
-        {"name": "SWEET TAMARIND", "item_code": "", "default_uom": "EA"},
-        {"name": "TENDER JACKFRUIT", "item_code": "", "default_uom": "KG"},
-        {"name": "TOMATO", "item_code": "", "default_uom": "KG"},
-        {"name": "WATER MELON NAMDHARI", "item_code": "", "default_uom": "KG"},
-        {"name": "WATERMELON", "item_code": "", "default_uom": "KG"},
-        {"name": "WATERMELON KIRAN", "item_code": "", "default_uom": "KG"},
-        {"name": "WATERMELON SARASWATI ", "item_code": "", "default_uom": "KG"},
-        {"name": "WOOD APPLE", "item_code": "", "default_uom": "KG"},
-    ]
 
-    for item in item_data:
-        uom = (
-            db.query(UOM)
-            .filter(
-                func.lower(func.trim(UOM.code)) == item["default_uom"].strip().lower()
-            )
-            .first()
-        )
-        if not uom:
+def seed_items(db: Session, created_by: str = "system") -> int:
+    """
+    Insert the items not present yet (names compared trimmed,
+    case-insensitive). Items whose default UOM is missing are skipped.
+
+    Returns:
+        int: Rows inserted.
+    """
+    uoms = dict(db.execute(select(func.lower(func.trim(UOM.code)), UOM.id)).all())
+    existing = set(db.scalars(select(func.lower(func.trim(Item.name)))))
+    now = datetime.utcnow()
+    rows = {}
+    for item in ITEMS:
+        key = normalize(item["name"])
+        uom_id = uoms.get(normalize(item["default_uom"]))
+        if uom_id is None or key in existing:
             continue
-        exists = (
-            db.query(Item)
-            .filter(func.lower(func.trim(Item.name)) == item["name"].strip().lower())
-            .first()
+        rows.setdefault(
+            key,
+            {
+                "name": item["name"],
+                "default_uom_id": uom_id,
+                "item_code": item["item_code"].strip(),
+                "created_by": created_by,
+                "updated_by": created_by,
+                "created_at": now,
+                "updated_at": now,
+            },
         )
-
-        if not exists:
-            db.add(
-                Item(
-                    name=item["name"],
-                    default_uom_id=uom.id,
-                    item_code=item["item_code"].strip(),
-                    created_by=created_by,
-                    updated_by=created_by,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-            )
-    db.commit()
+    return insert_missing(db, Item, list(rows.values()))
@@ -1,14 +1,74 @@
 # app/db/seed/seed_all.py
 
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
 from sqlalchemy.orm import Session
-from app.db.seed.uom_seed import seed_uoms
-from app.db.seed.item_seed import seed_items
-from app.db.seed.alias_seed import seed_aliases
-from app.db.seed.conversion_seed import seed_conversions
 
+from app.db.models.seed_version import SeedVersion
+from app.db.seed.alias_seed import ALIASES, seed_aliases
+from app.db.seed.conversion_seed import CONVERSIONS, seed_conversions
+from app.db.seed.item_seed import ITEMS, seed_items
+from app.db.seed.uom_seed import UOMS, seed_uoms
+
+logger = logging.getLogger(__name__)
+
+SEED_NAME = "initial_data"
+
+# bump when a seed function changes what it writes for the same data
+SEED_LOGIC_VERSION = 1
+
+
+def seed_fingerprint() -> str:
+    """
+    SHA-256 of the seed data and SEED_LOGIC_VERSION.
+    """
+    payload = json.dumps(
+        [SEED_LOGIC_VERSION, UOMS, ITEMS, ALIASES, CONVERSIONS], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def seed_all(
+    db: Session, created_by: str = "system", force: bool = False
+) -> Optional[Dict[str, int]]:
+    """
+    Insert missing seed rows and record the seed fingerprint, in one
+    transaction. Skipped when the recorded fingerprint matches the current
+    seed data, so seeds run once per change rather than on every start.
+
+    Args:
+        db (Session): Database session.
+        created_by (str): Audit name of the inserted rows.
+        force (bool): Seed even when the fingerprint is unchanged.
+
+    Returns:
+        Optional[Dict[str, int]]: Rows inserted per seed, or None if skipped.
+    """
+    fingerprint = seed_fingerprint()
+    applied = db.get(SeedVersion, SEED_NAME)
+    if applied is not None and applied.fingerprint == fingerprint and not force:
+        logger.info(f"Seed data unchanged ({fingerprint[:12]}), skipping")
+        return None
 
-def seed_all(db: Session, created_by: str = "system") -> None:
-    seed_uoms(db, created_by=created_by)
-    seed_items(db, created_by=created_by)
-    seed_aliases(db, created_by=created_by)
-    seed_conversions(db, created_by=created_by)
+    try:
+        inserted = {
+            "uom": seed_uoms(db, created_by=created_by),
+            "item": seed_items(db, created_by=created_by),
+            "item_alias": seed_aliases(db, created_by=created_by),
+            "item_conversion_map": seed_conversions(db, created_by=created_by),
+        }
+        if applied is None:
+            applied = SeedVersion(name=SEED_NAME)
+            db.add(applied)
+        applied.fingerprint = fingerprint
+        applied.applied_at = datetime.utcnow()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    logger.info(f"Seed data {fingerprint[:12]} applied: {inserted}")
+    return inserted
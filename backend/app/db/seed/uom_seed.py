@@ -1,33 +1,41 @@
 # app/db/seed/uom_seed.py
 
-from sqlalchemy import func
+from datetime import datetime
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+
 from app.db.models.uom import UOM
-from datetime import datetime
+from app.db.seed.upsert import insert_missing, normalize
 
+UOMS = [
+    {"code": "KG", "description": "Kilogram"},
+    {"code": "EA", "description": "Each"},
+]
 
-def seed_uoms(db: Session, created_by: str = "system") -> None:
-    uoms = [
-        {"code": "KG", "description": "Kilogram"},
-        {"code": "EA", "description": "Each"},
-    ]
 
-    for uom_data in uoms:
-        exists = (
-            db.query(UOM)
-            .filter(func.lower(func.trim(UOM.code)) == uom_data["code"].strip().lower())
-            .first()
-        )
+def seed_uoms(db: Session, created_by: str = "system") -> int:
+    """
+    Insert the UOMs not present yet (codes compared trimmed, case-insensitive).
 
-        if not exists:
-            db.add(
-                UOM(
-                    code=uom_data["code"].strip(),
-                    description=uom_data["description"].strip(),
-                    created_by=created_by,
-                    updated_by=created_by,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
+    Returns:
+        int: Rows inserted.
+    """
+    existing = set(db.scalars(select(func.lower(func.trim(UOM.code)))))
+    now = datetime.utcnow()
+    rows = {}
+    for uom in UOMS:
+        key = normalize(uom["code"])
+        if key not in existing:
+            rows.setdefault(
+                key,
+                {
+                    "code": uom["code"].strip(),
+                    "description": uom["description"].strip(),
+                    "created_by": created_by,
+                    "updated_by": created_by,
+                    "created_at": now,
+                    "updated_at": now,
+                },
             )
-    db.commit()
+    return insert_missing(db, UOM, list(rows.values()))
@@ -0,0 +1,29 @@
+# app/db/seed/upsert.py
+
+from typing import Dict, List, Type
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def normalize(value: str) -> str:
+    """
+    Seed matching key: trimmed and lower-cased, like `lower(trim(col))`.
+    """
+    return value.strip().lower()
+
+
+def insert_missing(db: Session, model: Type, rows: List[Dict]) -> int:
+    """
+    Insert seed rows in one multi-row INSERT ... ON CONFLICT DO NOTHING,
+    without committing. Callers leave out rows that already exist; the
+    conflict clause covers rows a concurrent run inserted meanwhile.
+
+    Returns:
+        int: Rows inserted.
+    """
+    if not rows:
+        return 0
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(model).values(rows).on_conflict_do_nothing()
+    return db.execute(stmt).rowcount
@@ -1,14 +1,108 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
-from typing import Generator
+from app.core.instrumentation import instrument_queries
+from app.db.pagination import Page
+from app.db.pool_metrics import PoolMetrics, instrument_pool, timed_pool_class
+from typing import Any, AsyncGenerator, Callable, Dict, Generator
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """
+    The same database addressed through its asyncio driver.
+    """
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def pool_options(url: str, metrics: PoolMetrics, base: type) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for the configured connection pool. SQLite
+    keeps its default pool, which takes no sizing options.
+    """
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=timed_pool_class(base, metrics),
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        )
+    return options
+
+
+sync_pool_metrics = PoolMetrics("sync")
+engine = create_engine(
+    settings.DATABASE_URL,
+    **pool_options(settings.DATABASE_URL, sync_pool_metrics, QueuePool),
+)
+instrument_pool(engine, sync_pool_metrics)
+instrument_queries(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+async_pool_metrics = PoolMetrics("async")
+async_engine = create_async_engine(
+    async_url, **pool_options(async_url, async_pool_metrics, AsyncAdaptedQueuePool)
+)
+instrument_pool(async_engine.sync_engine, async_pool_metrics)
+instrument_queries(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _to_schema(result: Any, schema: Any) -> Any:
+    if isinstance(result, Page):
+        return result._replace(items=_to_schema(result.items, schema))
+    if isinstance(result, list):
+        return [schema.model_validate(row, from_attributes=True) for row in result]
+    if result is None:
+        return None
+    return schema.model_validate(result, from_attributes=True)
+
+
+async def run_read(
+    db: AsyncSession, fn: Callable, *args: Any, schema: Any = None, **kwargs: Any
+) -> Any:
+    """
+    Run a sync service function on an AsyncSession without blocking a thread.
+
+    The function gets a regular Session whose I/O awaits the async driver.
+    Rows are converted to `schema` inside the call, while lazy loads still
+    work; a Page keeps its cursor with converted items.
+
+    Args:
+        db (AsyncSession): Async database session.
+        fn (Callable): Service function taking a Session first.
+        schema: Pydantic read schema for the returned rows, or None to
+            return the result as is (plain values only).
+
+    Returns:
+        Any: The converted result.
+    """
+
+    def call(sync_db: Session) -> Any:
+        result = fn(sync_db, *args, **kwargs)
+        return _to_schema(result, schema) if schema else result
+
+    return await db.run_sync(call)
@@ -1,18 +1,21 @@
 """
 Application entrypoint for the AGRO FastAPI service.
-Configures logging, exception handlers, CORS, and database migrations on startup.
+Configures logging, exception handlers, CORS and metrics. Migrations and
+seed data are applied once per deploy by `python -m app.commands.migrate`,
+not by each worker on startup.
 """
 
 import logging
-import subprocess
-from app.db.session import SessionLocal
-from app.db.seed.seed_all import seed_all
+from app.db.pagination import PAGE_HEADERS
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.logging_config import setup_logging
 from app.core.exceptions import register_exception_handlers
 from app.api import router as api_router
+from app.api.metrics import router as metrics_router
+from app.core.instrumentation import MetricsMiddleware
+from app.utils.invoice_parse_pool import shutdown_parse_pool
 
 # Initialize logging early
 setup_logging()
@@ -31,48 +34,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=PAGE_HEADERS,
 )
 
+# Record per-route latency and SQL work for /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(api_router)
+app.include_router(metrics_router)
 
 
-@app.on_event("startup")
-def startup() -> None:
+@app.on_event("shutdown")
+def shutdown() -> None:
     """
-    Startup event handler.
-    Runs database migrations automatically.
+    Shutdown event handler.
+    Stops the invoice parse pool workers.
     """
-    # Generate new migration file (if needed)
-    try:
-        logger.info("🔄 Autogenerating migration...")
-        # Uncomment the line below to enable auto-migration generation
-        # subprocess.run(["alembic", "revision", "--autogenerate", "-m", "Auto migration"], check=True)
-        logger.debug("Auto-migration generation step completed (skipped comment)")
-    except subprocess.CalledProcessError as e:
-        logger.warning(
-            f"No migration changes detected or error during auto-generation: {e}"
-        )
-
-    # Apply migrations
-    try:
-        logger.info("⬆️  Applying migrations...")
-        subprocess.run(["alembic", "upgrade", "head"], check=True)
-        logger.info("Database migrations applied successfully")
-    except subprocess.CalledProcessError as e:
-        logger.exception(f"Error applying migrations: {e}")
-        # Depending on your needs, you might want to stop the app if migrations fail:
-        # raise
-
-    # 2. Seed fallback data (only if enabled in settings)
-    from app.core.config import settings
-
-    if getattr(settings, "SEED_INITIAL_DATA", True):
-        try:
-            logger.info("Seeding fallback data...")
-            db = SessionLocal()
-            seed_all(db, created_by="admin@startup")
-            db.close()
-            logger.info("✅ Initial data seeded")
-        except Exception as e:
-            logger.exception("❌ Seeding initial data failed")
+    shutdown_parse_pool()
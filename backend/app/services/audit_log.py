@@ -4,30 +4,43 @@ Handles retrieval of audit log entries from the database.
 """
 
 import logging
-from typing import List
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import AppException
 from app.db.models.audit_log import AuditLog
+from app.db.pagination import CountMode, Page, paginate
 
 logger = logging.getLogger(__name__)
 
 
-def get_all_audit_logs(db: Session) -> List[AuditLog]:
+def get_all_audit_logs(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Fetch all audit log entries, ordered by timestamp descending.
+    Fetch a page of audit log entries, newest first.
 
     Args:
         db (Session): Database session.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all entries.
 
     Returns:
-        List[AuditLog]: List of audit log records.
+        Page: Audit log records and the next cursor.
     """
-    logger.info("Retrieving all audit logs")
+    logger.info(f"Retrieving audit logs cursor={cursor}, limit={limit}")
     try:
-        logs = db.query(AuditLog).order_by(AuditLog.timestamp.desc()).all()
-        logger.debug(f"Retrieved {len(logs)} audit logs")
-        return logs
+        page = paginate(
+            db.query(AuditLog), (AuditLog.timestamp, AuditLog.id), cursor, limit, count
+        )
+        logger.debug(f"Retrieved {len(page.items)} audit logs")
+        return page
+    except AppException:
+        raise
     except Exception as e:
         logger.exception("Failed to fetch audit logs")
         raise AppException("Could not fetch audit logs", status_code=500)
@@ -11,7 +11,10 @@ from sqlalchemy.orm import Session
 
 from app.core.exceptions import AppException
 from app.db.models import Batch
-from app.db.schemas.batch import BatchCreate, BatchUpdate
+from app.db.pagination import CountMode, Page, paginate
+from app.db.schemas.batch import BatchCreate, BatchRead, BatchUpdate
+from app.services.loaders import loaders_for
+from app.services.sync import record_deletion
 
 logger = logging.getLogger(__name__)
 
@@ -87,20 +90,27 @@ def get_batch(db: Session, batch_id: int) -> Optional[Batch]:
     return db.query(Batch).filter(Batch.id == batch_id).first()
 
 
-def get_all_batches(db: Session, skip: int = 0, limit: int = 100) -> List[Batch]:
+def get_all_batches(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve all batches with pagination.
+    Retrieve a page of batches, newest first.
 
     Args:
         db (Session): Database session.
-        skip (int): Records to skip.
+        cursor (Optional[str]): Cursor of the previous page.
         limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all batches.
 
     Returns:
-        List[Batch]: List of batches.
+        Page: Batches and the next cursor.
     """
-    logger.debug(f"Fetching all batches skip={skip}, limit={limit}")
-    return db.query(Batch).offset(skip).limit(limit).all()
+    logger.debug(f"Fetching batches cursor={cursor}, limit={limit}")
+    query = db.query(Batch).options(*loaders_for(BatchRead))
+    return paginate(query, (Batch.created_at, Batch.id), cursor, limit, count)
 
 
 def update_batch(
@@ -152,6 +162,7 @@ def delete_batch(db: Session, batch_id: int) -> bool:
         logger.error(f"Batch not found id={batch_id}")
         return False
     db.delete(batch)
+    record_deletion(db, Batch, batch_id)
     db.commit()
     logger.debug(f"Batch id={batch_id} deleted")
     return True
@@ -173,5 +184,6 @@ def get_batches_by_item_with_quantity(db: Session, item_id: int) -> List[Batch]:
         select(Batch)
         .where(Batch.item_id == item_id, Batch.quantity > 0)
         .order_by(Batch.created_at)
+        .options(*loaders_for(BatchRead))
     )
     return db.scalars(stmt).all()
@@ -0,0 +1,161 @@
+"""
+In-process graph of unit conversions per item.
+Each item's conversions form a graph whose edges are the configured
+factors and their reciprocals. Factors between every reachable pair of
+units are precomputed along the path with the fewest hops, so stock,
+dispatch and rejection code resolves conversions such as KG -> BOX via
+EA without touching the database. Every worker and process holds its own
+graph, so each session compares it once against the table's version and
+reloads it when another process changed the conversions.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.item_conversion_map import ItemConversionMap
+
+logger = logging.getLogger(__name__)
+
+Edge = Tuple[str, str, float]
+
+# Session.info key marking that the session has checked the graph's version
+VERSION_CHECKED = "conversion_graph_checked"
+
+
+def build_closure(edges: Iterable[Edge]) -> Dict[str, Dict[str, float]]:
+    """
+    Factors between every pair of connected units.
+
+    Configured edges take precedence over reciprocals of the opposite edge,
+    and among paths the one with the fewest hops wins.
+
+    Args:
+        edges (Iterable[Edge]): (source_unit, target_unit, factor) triples.
+
+    Returns:
+        Dict[str, Dict[str, float]]: closure[source][target] = factor.
+    """
+    edges = list(edges)
+    adjacency: Dict[str, Dict[str, float]] = defaultdict(dict)
+    for source, target, factor in edges:
+        adjacency[source][target] = factor
+    for source, target, factor in edges:
+        if factor:
+            adjacency[target].setdefault(source, 1.0 / factor)
+
+    closure: Dict[str, Dict[str, float]] = {}
+    for start in adjacency:
+        reached = {start: 1.0}
+        queue = deque([start])
+        while queue:
+            unit = queue.popleft()
+            for neighbour, factor in adjacency[unit].items():
+                if neighbour not in reached:
+                    reached[neighbour] = reached[unit] * factor
+                    queue.append(neighbour)
+        del reached[start]
+        closure[start] = reached
+    return closure
+
+
+class ConversionGraph:
+    """
+    Per-item conversion closures, loaded once and rebuilt per item on change.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._version: Optional[tuple] = None
+        self._closures: Dict[int, Dict[str, Dict[str, float]]] = {}
+
+    def ensure_loaded(self, db: Session) -> "ConversionGraph":
+        """
+        Load every item's conversions if the graph is empty or stale, or,
+        on the session's first lookup, if the table changed since loading.
+        """
+        check = not db.info.get(VERSION_CHECKED)
+        with self._lock:
+            ttl = settings.CONVERSION_GRAPH_TTL_SECONDS
+            if (
+                self._loaded_at is None
+                or (check and self._table_version(db) != self._version)
+                or (ttl > 0 and time.monotonic() - self._loaded_at > ttl)
+            ):
+                self._load(db)
+        db.info[VERSION_CHECKED] = True
+        return self
+
+    @staticmethod
+    def _table_version(db: Session) -> tuple:
+        # row count and newest id catch inserts and deletes, the newest
+        # updated_at catches edited factors
+        return tuple(
+            db.query(
+                func.count(ItemConversionMap.id),
+                func.max(ItemConversionMap.id),
+                func.max(ItemConversionMap.updated_at),
+            ).one()
+        )
+
+    def _load(self, db: Session) -> None:
+        self._version = self._table_version(db)
+        edges: Dict[int, list] = defaultdict(list)
+        for row in db.query(
+            ItemConversionMap.item_id,
+            ItemConversionMap.source_unit,
+            ItemConversionMap.target_unit,
+            ItemConversionMap.conversion_factor,
+        ):
+            edges[row.item_id].append(
+                (row.source_unit, row.target_unit, row.conversion_factor)
+            )
+        self._closures = {item_id: build_closure(e) for item_id, e in edges.items()}
+        self._loaded_at = time.monotonic()
+        logger.info(f"Loaded unit conversions for {len(self._closures)} items")
+
+    def refresh_item(self, db: Session, item_id: int) -> None:
+        """
+        Rebuild one item's closure after its conversions changed.
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            rows = (
+                db.query(
+                    ItemConversionMap.source_unit,
+                    ItemConversionMap.target_unit,
+                    ItemConversionMap.conversion_factor,
+                )
+                .filter(ItemConversionMap.item_id == item_id)
+                .all()
+            )
+            self._closures[item_id] = build_closure(
+                (r.source_unit, r.target_unit, r.conversion_factor) for r in rows
+            )
+            logger.debug(f"Rebuilt unit conversions for item_id={item_id}")
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def factor(self, item_id: int, from_unit: str, to_unit: str) -> Optional[float]:
+        """
+        Factor converting `from_unit` to `to_unit` for an item, or None.
+        """
+        if from_unit == to_unit:
+            return 1.0
+        closure = self._closures.get(item_id)
+        if not closure:
+            return None
+        return closure.get(from_unit, {}).get(to_unit)
+
+
+conversion_graph = ConversionGraph()
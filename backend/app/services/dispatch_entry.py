@@ -4,23 +4,30 @@ Handles creation from single entries or orders, and CRUD operations.
 """
 
 import logging
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from datetime import datetime, date
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.core.exceptions import AppException
 from app.db.models.batch import Batch
 from app.db.models.dispatch_entry import DispatchEntry
 from app.db.models.order import Order
+from app.db.pagination import CountMode, Page, paginate
 from app.db.schemas.dispatch_entry import (
     DispatchEntryCreate,
     DispatchEntryMultiCreate,
+    DispatchEntryRead,
     DispatchEntryUpdate,
 )
-from app.services.inventory_txn import create_inventory_txn
+from app.services.inventory_txn import create_inventory_txn, create_inventory_txns
+from app.services.pnl_summary import refresh_pnl_keys
 from app.db.schemas.inventory_txn import InventoryTxnCreate
 from app.services.item_conversion_map import get_conversion_factor
+from app.services.loaders import loaders_for
+from app.services.sync import record_deletion
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,10 @@ def create_dispatch_entry(
     """
     Create a single dispatch entry, decrementing batch stock and updating order status.
 
+    The batch decrement is a conditional UPDATE (quantity >= requested), the
+    order row is locked, and the dispatch, order and inventory txn are
+    written in one commit, so concurrent dispatches cannot over-sell a batch.
+
     Args:
         db (Session): Database session.
         entry (DispatchEntryCreate): Dispatch data.
@@ -49,13 +60,9 @@ def create_dispatch_entry(
     if not batch:
         logger.error("Invalid batch_id provided")
         raise AppException("Invalid batch_id provided", status_code=400)
-    if batch.quantity < entry.quantity:
-        msg = f"Not enough stock. Available: {batch.quantity}, requested: {entry.quantity}"
-        logger.error(msg)
-        raise AppException(msg, status_code=400)
 
     exists = (
-        db.query(DispatchEntry)
+        db.query(DispatchEntry.id)
         .filter(
             DispatchEntry.item_id == entry.item_id,
             DispatchEntry.mart_name == entry.mart_name,
@@ -67,57 +74,93 @@ def create_dispatch_entry(
         logger.error("Dispatch entry already exists for this item/date/mart")
         raise AppException("Dispatch entry already exists", status_code=400)
 
-    dispatch = DispatchEntry(
-        batch_id=entry.batch_id,
-        mart_name=entry.mart_name,
-        dispatch_date=entry.dispatch_date,
-        quantity=entry.quantity,
-        unit=entry.unit,
-        remarks=entry.remarks,
-        created_by=created_by,
-        updated_by=created_by,
-    )
-    db.add(dispatch)
-    batch.quantity -= entry.quantity
-    batch.updated_at = datetime.utcnow()
-    _update_order_after_dispatch(db, entry.item_id, entry.mart_name, entry.quantity)
-    db.flush()
-    db.refresh(dispatch)
-    db.commit()
-    logger.debug(f"Created dispatch id={dispatch.id}")
-
     try:
         factor = get_conversion_factor(db, entry.item_id, entry.unit, batch.unit)
     except AppException as e:
         logger.error(f"Conversion lookup failed: {e}")
         raise
 
-    base_qty = entry.quantity * factor
-
-    create_inventory_txn(
-        db,
-        InventoryTxnCreate(
-            item_id=entry.item_id,
+    try:
+        _decrement_batch(db, batch, entry.quantity)
+        dispatch = DispatchEntry(
             batch_id=entry.batch_id,
-            txn_type="OUT",
-            raw_qty=entry.quantity,
-            raw_unit=entry.unit,
-            base_qty=base_qty,
-            base_unit=entry.unit,
-            ref_type="dispatch_entry",
-            ref_id=dispatch.id,
-            remarks="Stock dispatched",
-        ),
-    )
+            item_id=entry.item_id,
+            mart_name=entry.mart_name,
+            dispatch_date=entry.dispatch_date,
+            quantity=entry.quantity,
+            unit=entry.unit,
+            remarks=entry.remarks,
+            created_by=created_by,
+            updated_by=created_by,
+        )
+        db.add(dispatch)
+        _update_order_after_dispatch(db, entry.item_id, entry.mart_name, entry.quantity)
+        db.flush()
+
+        create_inventory_txn(
+            db,
+            InventoryTxnCreate(
+                item_id=entry.item_id,
+                batch_id=entry.batch_id,
+                txn_type="OUT",
+                raw_qty=entry.quantity,
+                raw_unit=entry.unit,
+                base_qty=entry.quantity * factor,
+                base_unit=entry.unit,
+                ref_type="dispatch_entry",
+                ref_id=dispatch.id,
+                remarks="Stock dispatched",
+            ),
+            commit=False,
+        )
+        db.commit()
+    except IntegrityError:
+        # a concurrent request dispatched the same batch/date/mart first
+        db.rollback()
+        logger.error("Dispatch entry already exists for this batch/date/mart")
+        raise AppException("Dispatch entry already exists", status_code=400)
+    except Exception:
+        db.rollback()
+        raise
+
+    db.refresh(dispatch)
+    logger.debug(f"Created dispatch id={dispatch.id}")
     return dispatch
 
 
+def _decrement_batch(db: Session, batch: Batch, quantity: float) -> None:
+    """
+    Atomically take `quantity` out of a batch, failing if it has too little.
+
+    Uses a conditional UPDATE so the check and the decrement happen in one
+    statement; the row stays locked until the caller commits or rolls back.
+
+    Raises:
+        AppException: If the batch holds less than `quantity`.
+    """
+    result = db.execute(
+        update(Batch)
+        .where(Batch.id == batch.id, Batch.quantity >= quantity)
+        .values(quantity=Batch.quantity - quantity, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        msg = f"Not enough stock. Available: {batch.quantity}, requested: {quantity}"
+        logger.error(msg)
+        raise AppException(msg, status_code=400)
+    db.expire(batch, ["quantity", "updated_at"])
+
+
 def create_dispatch_from_order(
     db: Session, entry: DispatchEntryMultiCreate, created_by: Optional[str] = None
 ) -> List[DispatchEntry]:
     """
     Create dispatch entries from an order allocation across batches.
 
+    All requested batches are locked and loaded in one query, existing
+    dispatches for the same mart/date in another, and one inventory txn per
+    batch is bulk inserted, all in a single commit.
+
     Args:
         db (Session): Database session.
         entry (DispatchEntryMultiCreate): Multi-batch dispatch data.
@@ -131,7 +174,7 @@ def create_dispatch_from_order(
     """
     logger.info(f"Creating dispatches from order for item_id={entry.item_id}")
     order = db.scalar(
-        select(Order).where(
+        select(Order.id).where(
             Order.item_id == entry.item_id,
             Order.mart_name == entry.mart_name,
             Order.status != "Completed",
@@ -142,84 +185,111 @@ def create_dispatch_from_order(
         logger.error(msg)
         raise AppException(msg, status_code=400)
 
-    total_req = sum(b.quantity for b in entry.batches)
-    results: List[DispatchEntry] = []
+    # the same batch may be listed more than once
+    requested: Dict[int, float] = defaultdict(float)
     for b in entry.batches:
-        batch = db.scalar(
-            select(Batch).where(Batch.id == b.batch_id, Batch.item_id == entry.item_id)
-        )
-        if not batch:
-            logger.error(f"Batch {b.batch_id} not found")
-            raise AppException(f"Batch {b.batch_id} not found", status_code=404)
-        if batch.quantity < b.quantity:
-            msg = (
-                f"Batch {b.batch_id} has only {batch.quantity}, requested {b.quantity}"
-            )
-            logger.error(msg)
-            raise AppException(msg, status_code=400)
+        requested[b.batch_id] += b.quantity
+    now = datetime.utcnow()
 
-        existing = db.scalar(
-            select(DispatchEntry).where(
-                DispatchEntry.batch_id == batch.id,
-                DispatchEntry.mart_name == entry.mart_name,
-                DispatchEntry.dispatch_date == entry.dispatch_date,
+    try:
+        batches = {
+            batch.id: batch
+            for batch in db.scalars(
+                select(Batch)
+                .where(Batch.id.in_(requested), Batch.item_id == entry.item_id)
+                .order_by(Batch.id)
+                .with_for_update()
             )
-        )
-        if existing:
-            existing.quantity += b.quantity
-            existing.remarks = entry.remarks or existing.remarks
-            existing.updated_by = created_by
-            existing.updated_at = datetime.utcnow()
-            db.add(existing)
-            results.append(existing)
-        else:
-            disp = DispatchEntry(
-                item_id=entry.item_id,
-                batch_id=batch.id,
-                mart_name=entry.mart_name,
-                dispatch_date=entry.dispatch_date,
-                quantity=b.quantity,
-                unit=entry.unit,
-                remarks=entry.remarks,
-                created_by=created_by,
-                updated_by=created_by,
+        }
+        for batch_id, quantity in requested.items():
+            batch = batches.get(batch_id)
+            if not batch:
+                logger.error(f"Batch {batch_id} not found")
+                raise AppException(f"Batch {batch_id} not found", status_code=404)
+            if batch.quantity < quantity:
+                msg = f"Batch {batch_id} has only {batch.quantity}, requested {quantity}"
+                logger.error(msg)
+                raise AppException(msg, status_code=400)
+        factors = {
+            batch_id: get_conversion_factor(
+                db, entry.item_id, entry.unit, batches[batch_id].unit
             )
-            db.add(disp)
+            for batch_id in requested
+        }
+
+        existing = {
+            d.batch_id: d
+            for d in db.scalars(
+                select(DispatchEntry).where(
+                    DispatchEntry.batch_id.in_(requested),
+                    DispatchEntry.mart_name == entry.mart_name,
+                    DispatchEntry.dispatch_date == entry.dispatch_date,
+                )
+            )
+        }
+        results: List[DispatchEntry] = []
+        for batch_id, quantity in requested.items():
+            disp = existing.get(batch_id)
+            if disp:
+                disp.quantity += quantity
+                disp.remarks = entry.remarks or disp.remarks
+                disp.updated_by = created_by
+                disp.updated_at = now
+            else:
+                disp = DispatchEntry(
+                    item_id=entry.item_id,
+                    batch_id=batch_id,
+                    mart_name=entry.mart_name,
+                    dispatch_date=entry.dispatch_date,
+                    quantity=quantity,
+                    unit=entry.unit,
+                    remarks=entry.remarks,
+                    created_by=created_by,
+                    updated_by=created_by,
+                )
+                db.add(disp)
             results.append(disp)
+            batches[batch_id].quantity -= quantity
+            batches[batch_id].updated_at = now
 
-        batch.quantity -= b.quantity
-        batch.updated_at = datetime.utcnow()
-
-    _update_order_after_dispatch(db, entry.item_id, entry.mart_name, total_req)
-    db.flush()
-    for d in results:
-        db.refresh(d)
-    db.commit()
-    logger.debug(f"Created/updated {len(results)} dispatch entries")
-
-    try:
-        factor = get_conversion_factor(db, entry.item_id, entry.unit, batch.unit)
-    except AppException as e:
-        logger.error(f"Conversion lookup failed: {e}")
+        _update_order_after_dispatch(
+            db, entry.item_id, entry.mart_name, sum(requested.values())
+        )
+        db.flush()
+        ids = [disp.id for disp in results]
+
+        ledger = [
+            {
+                "item_id": entry.item_id,
+                "batch_id": disp.batch_id,
+                "txn_type": "OUT",
+                "raw_qty": requested[disp.batch_id],
+                "raw_unit": entry.unit,
+                "base_qty": requested[disp.batch_id] * factors[disp.batch_id],
+                "base_unit": entry.unit,
+                "ref_type": "dispatch_entry",
+                "ref_id": disp.id,
+                "remarks": "Stock dispatched",
+                "created_at": now,
+            }
+            for disp in results
+        ]
+        create_inventory_txns(db, ledger)
+        db.commit()
+    except Exception:
+        db.rollback()
         raise
-    base_qty = b.quantity * factor
+    logger.debug(f"Created/updated {len(results)} dispatch entries")
 
-    create_inventory_txn(
-        db,
-        InventoryTxnCreate(
-            item_id=entry.item_id,
-            batch_id=batch.id,
-            txn_type="OUT",
-            raw_qty=b.quantity,
-            raw_unit=entry.unit,
-            base_qty=base_qty,
-            base_unit=entry.unit,
-            ref_type="dispatch_entry",
-            ref_id=disp.id if "disp" in locals() else existing.id,
-            remarks="Stock dispatched",
-        ),
-    )
-    return results
+    loaded = {
+        d.id: d
+        for d in db.scalars(
+            select(DispatchEntry)
+            .where(DispatchEntry.id.in_(ids))
+            .options(*loaders_for(DispatchEntryRead))
+        )
+    }
+    return [loaded[i] for i in ids]
 
 
 def _update_order_after_dispatch(
@@ -227,6 +297,7 @@ def _update_order_after_dispatch(
 ) -> None:
     """
     Update the corresponding order’s dispatched quantity and status.
+    The order row is locked and left uncommitted for the caller's transaction.
 
     Args:
         db (Session): Database session.
@@ -235,11 +306,13 @@ def _update_order_after_dispatch(
         dispatched_quantity (float): Quantity dispatched in this operation.
     """
     order = db.scalar(
-        select(Order).where(
+        select(Order)
+        .where(
             Order.item_id == item_id,
             Order.mart_name == mart_name,
             Order.status != "Completed",
         )
+        .with_for_update()
     )
     if not order:
         return
@@ -251,7 +324,6 @@ def _update_order_after_dispatch(
     )
     order.updated_at = datetime.utcnow()
     db.add(order)
-    db.commit()
 
 
 def get_dispatch_entry(db: Session, dispatch_id: int) -> Optional[DispatchEntry]:
@@ -271,34 +343,36 @@ def get_dispatch_entry(db: Session, dispatch_id: int) -> Optional[DispatchEntry]
 
 def get_all_dispatch_entries(
     db: Session,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     dispatch_date: Optional[date] = None,
     mart_name: Optional[str] = None,
-) -> List[DispatchEntry]:
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve dispatch entries with optional filters and pagination.
+    Retrieve a page of dispatch entries with optional filters, newest first.
 
     Args:
         db (Session): Database session.
-        skip (int): Records to skip.
+        cursor (Optional[str]): Cursor of the previous page.
         limit (int): Max records to return.
         dispatch_date (Optional[date]): Filter by date.
         mart_name (Optional[str]): Filter by mart name.
+        count (Optional[CountMode]): Also count all matching entries.
 
     Returns:
-        List[DispatchEntry]: List of dispatch entries.
+        Page: Dispatch entries and the next cursor.
     """
     logger.debug(
-        f"Fetching dispatches skip={skip}, limit={limit}, date={dispatch_date}, mart={mart_name}"
+        f"Fetching dispatches cursor={cursor}, limit={limit}, date={dispatch_date}, mart={mart_name}"
     )
-    query = db.query(DispatchEntry)
+    query = db.query(DispatchEntry).options(*loaders_for(DispatchEntryRead))
     if dispatch_date:
         query = query.filter(DispatchEntry.dispatch_date == dispatch_date)
     if mart_name:
         query = query.filter(DispatchEntry.mart_name == mart_name)
-    return (
-        query.order_by(DispatchEntry.created_at.desc()).offset(skip).limit(limit).all()
+    return paginate(
+        query, (DispatchEntry.created_at, DispatchEntry.id), cursor, limit, count
     )
 
 
@@ -346,6 +420,7 @@ def update_dispatch_entry(
         batch.updated_at = datetime.utcnow()
         _update_order_after_dispatch(db, dispatch.item_id, dispatch.mart_name, diff)
 
+    old_key = (dispatch.mart_name, dispatch.dispatch_date)
     for field, val in entry_update.dict(exclude_unset=True).items():
         setattr(dispatch, field, val)
     dispatch.updated_by = updated_by
@@ -355,6 +430,8 @@ def update_dispatch_entry(
     db.flush()
     db.refresh(dispatch)
     db.commit()
+    if old_key != (dispatch.mart_name, dispatch.dispatch_date):
+        refresh_pnl_keys(db, [old_key])
     logger.debug(f"Dispatch id={dispatch_id} updated")
 
     if diff != 0:
@@ -419,8 +496,10 @@ def delete_dispatch_entry(db: Session, dispatch_id: int) -> bool:
     )
 
     db.delete(dispatch)
+    record_deletion(db, DispatchEntry, dispatch_id)
     db.flush()
     db.commit()
+    refresh_pnl_keys(db, [(dispatch.mart_name, dispatch.dispatch_date)])
     logger.debug(f"Dispatch id={dispatch_id} deleted")
 
     try:
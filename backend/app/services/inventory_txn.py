@@ -1,22 +1,50 @@
 import logging
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from app.db.bulk import bulk_insert
 from app.db.models.inventory_txn import InventoryTxn
 from app.db.schemas.inventory_txn import InventoryTxnCreate
+from app.services.stock_balance import apply_stock_movements
 
 logger = logging.getLogger(__name__)
 
 
-def create_inventory_txn(db: Session, data: InventoryTxnCreate) -> InventoryTxn:
+def create_inventory_txn(
+    db: Session, data: InventoryTxnCreate, commit: bool = True
+) -> InventoryTxn:
+    """
+    Record an inventory movement.
+
+    The matching stock_balance row is updated in the same transaction.
+    With commit=False the row is only flushed, so it lands in the caller's
+    transaction together with the stock change it records.
+    """
     txn = InventoryTxn(**data.dict())
     db.add(txn)
-    db.commit()
-    db.refresh(txn)
+    apply_stock_movements(db, [data.dict()])
+    if commit:
+        db.commit()
+        db.refresh(txn)
+    else:
+        db.flush()
     logger.info(f"InventoryTxn created: {txn}")
     return txn
 
 
+def create_inventory_txns(db: Session, txns: List[Dict]) -> None:
+    """
+    Record many inventory movements, e.g. for a bulk receipt or a ledger
+    back-fill, without committing.
+
+    Rows are written with `bulk_insert` (COPY on PostgreSQL) and the
+    stock_balance rows they touch are updated in the same transaction.
+    """
+    bulk_insert(db, InventoryTxn, txns)
+    apply_stock_movements(db, txns)
+    logger.info(f"{len(txns)} inventory txns created")
+
+
 def get_inventory_txns(
     db: Session,
     item_id: int,
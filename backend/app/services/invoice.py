@@ -6,24 +6,40 @@ Handles saving, parsing, and CRUD operations for invoices.
 import logging
 import os
 import hashlib
-from typing import List, Optional, Dict, Union
+import tempfile
+from contextlib import closing
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional, Dict, Sequence, Tuple, Union
 from fastapi import UploadFile
-from sqlalchemy import func, or_
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 import aiofiles
 
 from app.core.config import settings
 from app.core.exceptions import AppException
+from app.core.instrumentation import parse_stage
+from app.db.bulk import bulk_insert
 from app.db.models.invoice import Invoice
 from app.db.models.invoice_item import InvoiceItem
-from app.db.models.item import Item
-from app.utils.invoice_parser import process_pdf
+from app.db.pagination import CountMode, Page, paginate
+from app.utils.invoice_parse_pool import parse_invoice_pdf, run_in_parse_pool
+from app.utils.invoice_parse_cache import load_parse_result, store_parse_result
 from app.db.schemas.invoice import InvoiceUpdate
-from app.services.item_alias import get_alias_by_code_or_name
-from app.db.models.uom import UOM
+from app.services.item_alias import resolve_invoice_items
+from app.services.pnl_summary import invoice_pnl_keys, refresh_pnl_keys
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# bytes read from an upload per write to its spool file
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# line items per insert when saving a streamed invoice
+STREAM_CHUNK_ROWS = 500
+
 
 async def save_and_process_invoice(
     file: UploadFile, db: Session, created_by: str = "system"
@@ -39,28 +55,154 @@ async def save_and_process_invoice(
     Returns:
         dict: Result {filename, success, invoice_id/error}.
     """
-    filename = file.filename
-    logger.info(f"Processing invoice file '{filename}'")
-    file_bytes = await file.read()
-    file_hash = hashlib.sha256(file_bytes).hexdigest()
+    spool_path, file_hash = await spool_upload(file)
+    return await process_spooled_invoice(file.filename, spool_path, file_hash, db, created_by)
 
-    existing = db.query(Invoice).filter_by(file_hash=file_hash).first()
-    if existing:
-        logger.warning("Duplicate invoice detected")
-        return {
-            "filename": filename,
-            "success": False,
-            "error": "Duplicate invoice detected",
-        }
 
-    upload_path = os.path.join(settings.INVOICE_UPLOAD_DIR, filename)
+async def spool_upload(file: UploadFile) -> Tuple[str, str]:
+    """
+    Copy an upload into the invoice directory in chunks, hashing it on the
+    way, so the PDF is never held in memory whole.
+
+    Args:
+        file (UploadFile): Uploaded PDF.
+
+    Returns:
+        Tuple[str, str]: (spool_path, file_hash); `process_spooled_invoice`
+        moves or removes the spooled file.
+    """
     os.makedirs(settings.INVOICE_UPLOAD_DIR, exist_ok=True)
-    async with aiofiles.open(upload_path, "wb") as f:
-        await f.write(file_bytes)
+    fd, spool_path = tempfile.mkstemp(suffix=".part", dir=settings.INVOICE_UPLOAD_DIR)
+    os.close(fd)
+    digest = hashlib.sha256()
+    try:
+        async with aiofiles.open(spool_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        discard_spool(spool_path)
+        raise
+    return spool_path, digest.hexdigest()
+
+
+def discard_spool(spool_path: str) -> None:
+    """
+    Remove a spooled upload that was not processed; a no-op once it was.
+    """
+    try:
+        os.remove(spool_path)
+    except FileNotFoundError:
+        pass
+
+
+async def process_spooled_invoice(
+    filename: str,
+    spool_path: str,
+    file_hash: str,
+    db: Session,
+    created_by: str = "system",
+) -> Dict[str, Optional[Union[int, str, bool]]]:
+    """
+    Store a spooled PDF under its hash and upload name, parse it, insert
+    invoice and items.
+
+    Parsing runs in the invoice parse pool and database work in the
+    threadpool, so several uploads can be processed concurrently without
+    blocking the event loop. Concurrent calls need their own sessions.
+    Files of INVOICE_STREAM_MIN_MB or more are parsed and saved page by
+    page in the pool instead (`stream_invoice_file`).
+
+    Args:
+        filename (str): Original upload filename.
+        spool_path (str): Spooled copy from `spool_upload`.
+        file_hash (str): SHA-256 of the PDF bytes.
+        db (Session): Database session.
+        created_by (str): Creator identifier.
+
+    Returns:
+        dict: Result {filename, success, invoice_id/error}.
+    """
+    logger.info(f"Processing invoice file '{filename}'")
+    if await run_in_threadpool(_is_duplicate, db, file_hash):
+        logger.warning("Duplicate invoice detected")
+        discard_spool(spool_path)
+        return _duplicate_result(filename)
+
+    # a directory per file hash: concurrent uploads often share a name
+    # ("document.pdf") and must not overwrite each other mid-parse
+    upload_dir = os.path.join(settings.INVOICE_UPLOAD_DIR, file_hash)
+    os.makedirs(upload_dir, exist_ok=True)
+    upload_path = os.path.join(upload_dir, os.path.basename(filename))
+    os.replace(spool_path, upload_path)
     logger.debug(f"Saved file to {upload_path}")
 
+    size = os.path.getsize(upload_path)
+    if size >= settings.INVOICE_STREAM_MIN_MB * 1024 * 1024:
+        logger.info(f"Streaming '{filename}' ({size / 1024 / 1024:.1f} MB) page by page")
+        return await run_in_parse_pool(
+            stream_invoice_file, upload_path, filename, file_hash, created_by
+        )
+
+    # parquet I/O and the cache eviction scan would block the event loop
+    cached = await run_in_threadpool(load_parse_result, file_hash)
+    if cached:
+        logger.info(f"Using cached parse result for '{filename}'")
+        df, invoice_date, mart_name = cached
+    else:
+        try:
+            df, invoice_date, mart_name = await parse_invoice_pdf(upload_path)
+        except Exception:
+            logger.exception("Failed to parse invoice")
+            raise AppException("Invoice processing failed", status_code=500)
+        await run_in_threadpool(store_parse_result, file_hash, df, invoice_date, mart_name)
+
+    with parse_stage("persist"):
+        return await run_in_threadpool(
+            persist_parsed_invoice,
+            db,
+            df,
+            invoice_date,
+            mart_name,
+            filename=filename,
+            upload_path=upload_path,
+            file_hash=file_hash,
+            created_by=created_by,
+        )
+
+
+def persist_parsed_invoice(
+    db: Session,
+    df: "pd.DataFrame",
+    invoice_date: datetime,
+    mart_name: str,
+    filename: str,
+    upload_path: str,
+    file_hash: str,
+    created_by: str = "system",
+) -> Dict[str, Optional[Union[int, str, bool]]]:
+    """
+    Insert an invoice and its line items from a parsed invoice table.
+
+    Args:
+        db (Session): Database session.
+        df (pd.DataFrame): Cleaned invoice table from `process_pdf`.
+        invoice_date (datetime): Invoice date.
+        mart_name (str): Store name.
+        filename (str): Original upload filename.
+        upload_path (str): Where the PDF was saved.
+        file_hash (str): SHA-256 of the PDF bytes.
+        created_by (str): Creator identifier.
+
+    Returns:
+        dict: Result {filename, success, invoice_id/error}.
+    """
+    # another upload of the same file may have finished while this one parsed
+    if _is_duplicate(db, file_hash):
+        logger.warning("Duplicate invoice detected")
+        return _duplicate_result(filename)
+
     try:
-        df, invoice_date, mart_name = process_pdf(upload_path)
         total_amount = float(df["Total"].sum())
 
         inv = Invoice(
@@ -75,95 +217,21 @@ async def save_and_process_invoice(
             remarks="Uploaded from mobile",
         )
         db.add(inv)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            # lost the race on file_hash to a concurrent upload of the same file
+            db.rollback()
+            logger.warning("Duplicate invoice detected")
+            return _duplicate_result(filename)
         db.refresh(inv)
         logger.debug(f"Created invoice id={inv.id}")
 
-        items = []
-        unmapped_items = []
-        for _, row in df.iterrows():
-            name = row["Item"]
-            existing_item = (
-                db.query(Item).filter(func.lower(Item.name) == name.lower()).first()
-            )
-            uom_id = (
-                db.query(UOM).filter(func.lower(UOM.code) == row["UOM"].lower()).first()
-            )
-            # if not existing_item:
-            #     new_item = Item(
-            #         name=name,
-            #         item_code=row["ITEM_CODE"],
-            #         default_uom_id=uom_id.id if uom_id else None,
-            #         created_by=created_by,
-            #         updated_by=created_by,
-            #     )
-            #     db.add(new_item)
-            #     db.flush()
-            #     item_id = new_item.id
-            #     logger.debug(f"Created item id={item_id} for invoice")
-            # else:
-            #     item_id = existing_item.id
-            item_code = row["ITEM_CODE"]
-            item_name = row["Item"]
-            item_uom = row["UOM"]
-
-            alias = get_alias_by_code_or_name(db, code=item_code, name=item_name)
-
-            if alias:
-                item_id = alias.master_item_id
-            else:
-                item_id = None  # Will stay unmapped, flagged later in UI
-
-            if item_id is None:
-                # Example: suggest items with similar names or codes
-                suggestions = (
-                    db.query(Item)
-                    .filter(
-                        or_(
-                            Item.name.ilike(f"%{item_name}%"),
-                            Item.item_code.ilike(f"%{item_code}%"),
-                        )
-                    )
-                    .limit(10)
-                    .all()
-                )
-                uoms = {u.id: u.code for u in db.query(UOM).all()}
-                suggested_items = [
-                    {
-                        "id": s.id,
-                        "name": s.name,
-                        "item_code": s.item_code,
-                        "uom": uoms.get(s.default_uom_id),
-                    }
-                    for s in suggestions
-                ]
-                unmapped_items.append(
-                    {
-                        "item_code": item_code,
-                        "item_name": item_name,
-                        "uom": item_uom,
-                        "suggested_items": suggested_items,
-                    }
-                )
-
-            items.append(
-                InvoiceItem(
-                    invoice_id=inv.id,
-                    item_id=item_id,
-                    hsn_code=row["HSN_CODE"],
-                    item_code=row["ITEM_CODE"],
-                    item_name=item_name,
-                    quantity=row["Quantity"],
-                    uom=row["UOM"],
-                    price=row["Price"],
-                    total=row["Total"],
-                    invoice_date=invoice_date,
-                    store_name=mart_name,
-                    created_by=created_by,
-                    updated_by=created_by,
-                )
-            )
-        db.bulk_save_objects(items)
+        item_ids, unmapped_items = resolve_invoice_items(
+            db, list(zip(df["ITEM_CODE"], df["Item"], df["UOM"]))
+        )
+        items = _item_rows(inv.id, item_ids, df, invoice_date, mart_name, created_by)
+        bulk_insert(db, InvoiceItem, items)
         db.commit()
         logger.info(f"Invoice {inv.id} and {len(items)} items saved")
         return {
@@ -174,9 +242,257 @@ async def save_and_process_invoice(
         }
 
     except Exception as e:
+        db.rollback()
+        logger.exception("Failed to process invoice")
+        raise AppException("Invoice processing failed", status_code=500)
+
+
+def stream_invoice_file(
+    upload_path: str, filename: str, file_hash: str, created_by: str = "system"
+) -> Dict[str, Optional[Union[int, str, bool]]]:
+    """
+    `persist_streamed_invoice` with a session of its own, for the parse pool.
+    """
+    # imported here so this module loads without a configured database
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return persist_streamed_invoice(db, upload_path, filename, file_hash, created_by)
+    finally:
+        db.close()
+
+
+def persist_streamed_invoice(
+    db: Session,
+    upload_path: str,
+    filename: str,
+    file_hash: str,
+    created_by: str = "system",
+) -> Dict[str, Optional[Union[int, str, bool]]]:
+    """
+    Parse a saved PDF page by page with `stream_pdf` and insert the invoice
+    and its line items, STREAM_CHUNK_ROWS items per insert. Only one page
+    and one chunk of rows are held at a time. Everything is written in one
+    transaction, so a parse error part-way leaves nothing behind.
+
+    Args:
+        db (Session): Database session.
+        upload_path (str): Where the PDF was saved.
+        filename (str): Original upload filename.
+        file_hash (str): SHA-256 of the PDF bytes.
+        created_by (str): Creator identifier.
+
+    Returns:
+        dict: Result {filename, success, invoice_id/error}.
+    """
+    # the parser pulls in pandas and pdfplumber; import it on first use
+    from app.utils.invoice_parser import stream_pdf
+
+    if _is_duplicate(db, file_hash):
+        logger.warning("Duplicate invoice detected")
+        return _duplicate_result(filename)
+
+    inv = None
+    rows: List[Dict] = []
+    unmapped_items: List[Dict] = []
+    total_amount, item_count = 0.0, 0
+    try:
+        with parse_stage("stream"), closing(stream_pdf(upload_path)) as pages:
+            for df, invoice_date, mart_name in pages:
+                if inv is None:
+                    inv = Invoice(
+                        invoice_date=invoice_date,
+                        mart_name=mart_name,
+                        total_amount=0,
+                        file_path=upload_path,
+                        file_hash=file_hash,
+                        created_by=created_by,
+                        updated_by=created_by,
+                        is_verified=False,
+                        remarks="Uploaded from mobile",
+                    )
+                    db.add(inv)
+                    try:
+                        db.flush()
+                    except IntegrityError:
+                        # lost the race on file_hash to a concurrent upload
+                        db.rollback()
+                        logger.warning("Duplicate invoice detected")
+                        return _duplicate_result(filename)
+                    logger.debug(f"Created invoice id={inv.id}")
+
+                item_ids, unmapped = resolve_invoice_items(
+                    db, list(zip(df["ITEM_CODE"], df["Item"], df["UOM"]))
+                )
+                unmapped_items += unmapped
+                rows += _item_rows(inv.id, item_ids, df, invoice_date, mart_name, created_by)
+                total_amount += float(df["Total"].sum())
+                if len(rows) >= STREAM_CHUNK_ROWS:
+                    bulk_insert(db, InvoiceItem, rows)
+                    item_count += len(rows)
+                    rows = []
+
+        if inv is None:
+            raise AppException("No invoice items found", status_code=500)
+        bulk_insert(db, InvoiceItem, rows)
+        item_count += len(rows)
+        inv.total_amount = total_amount
+        invoice_id = inv.id
+        db.commit()
+    except Exception:
+        db.rollback()
         logger.exception("Failed to process invoice")
         raise AppException("Invoice processing failed", status_code=500)
 
+    logger.info(f"Invoice {invoice_id} and {item_count} items saved")
+    return {
+        "filename": filename,
+        "success": True,
+        "invoice_id": invoice_id,
+        "unmapped_items": unmapped_items,
+    }
+
+
+def persist_parsed_invoices(
+    db: Session, parsed: Sequence[Dict], created_by: str = "system"
+) -> List[Optional[int]]:
+    """
+    Insert a batch of parsed invoices and their line items in one
+    transaction, for back-fills; uploads go through `persist_parsed_invoice`.
+
+    Invoices whose file hash is already stored, or repeated within the
+    batch, are skipped. Rows are written with `bulk_insert`.
+
+    Args:
+        db (Session): Database session.
+        parsed (Sequence[Dict]): One dict per invoice with df, invoice_date,
+            mart_name, file_path and file_hash.
+        created_by (str): Creator identifier.
+
+    Returns:
+        List[Optional[int]]: Invoice id per entry, None for skipped duplicates.
+
+    Raises:
+        IntegrityError: A concurrent upload stored one of the files first;
+            the transaction is rolled back and the batch can be retried.
+    """
+    hashes = [p["file_hash"] for p in parsed]
+    seen = set(
+        db.scalars(select(Invoice.file_hash).where(Invoice.file_hash.in_(hashes)))
+    )
+    result: List[Optional[int]] = [None] * len(parsed)
+    positions, new = [], []
+    for n, p in enumerate(parsed):
+        if p["file_hash"] not in seen:
+            seen.add(p["file_hash"])
+            positions.append(n)
+            new.append(p)
+    if not new:
+        return result
+
+    try:
+        invoice_ids = bulk_insert(
+            db,
+            Invoice,
+            [
+                {
+                    "invoice_date": p["invoice_date"],
+                    "mart_name": p["mart_name"],
+                    "total_amount": float(p["df"]["Total"].sum()),
+                    "file_path": p["file_path"],
+                    "file_hash": p["file_hash"],
+                    "created_by": created_by,
+                    "updated_by": created_by,
+                    "is_verified": False,
+                    "remarks": "Back-filled from archive",
+                }
+                for p in new
+            ],
+            returning=True,
+            match_on=("file_hash",),
+        )
+        # one index pass for every line of the batch
+        item_ids, _ = resolve_invoice_items(
+            db,
+            [
+                line
+                for p in new
+                for line in zip(p["df"]["ITEM_CODE"], p["df"]["Item"], p["df"]["UOM"])
+            ],
+            suggest=False,
+        )
+        rows, offset = [], 0
+        for p, invoice_id in zip(new, invoice_ids):
+            count = len(p["df"])
+            rows += _item_rows(
+                invoice_id,
+                item_ids[offset : offset + count],
+                p["df"],
+                p["invoice_date"],
+                p["mart_name"],
+                created_by,
+            )
+            offset += count
+        bulk_insert(db, InvoiceItem, rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    logger.info(f"Saved {len(new)} invoices with {len(rows)} items")
+
+    for n, invoice_id in zip(positions, invoice_ids):
+        result[n] = invoice_id
+    return result
+
+
+def _item_rows(
+    invoice_id: int,
+    item_ids: Sequence[Optional[int]],
+    df: "pd.DataFrame",
+    invoice_date: datetime,
+    mart_name: str,
+    created_by: str,
+) -> List[Dict]:
+    # whole columns as Python lists, zipped into rows; far cheaper than
+    # materialising a dict (or Series) per DataFrame row
+    columns = [
+        df[col].tolist()
+        for col in ("HSN_CODE", "ITEM_CODE", "Item", "Quantity", "UOM", "Price", "Total")
+    ]
+    return [
+        {
+            "invoice_id": invoice_id,
+            "item_id": item_id,
+            "hsn_code": hsn_code,
+            "item_code": item_code,
+            "item_name": item_name,
+            "quantity": quantity,
+            "uom": uom,
+            "price": price,
+            "total": total,
+            "invoice_date": invoice_date,
+            "store_name": mart_name,
+            "created_by": created_by,
+            "updated_by": created_by,
+        }
+        for item_id, hsn_code, item_code, item_name, quantity, uom, price, total in zip(
+            item_ids, *columns
+        )
+    ]
+
+
+def _is_duplicate(db: Session, file_hash: str) -> bool:
+    return db.query(Invoice.id).filter_by(file_hash=file_hash).first() is not None
+
+
+def _duplicate_result(filename: str) -> Dict[str, Optional[Union[int, str, bool]]]:
+    return {
+        "filename": filename,
+        "success": False,
+        "error": "Duplicate invoice detected",
+    }
+
 
 def get_invoice_by_id(db: Session, invoice_id: int) -> Optional[Invoice]:
     """
@@ -198,18 +514,24 @@ def get_all_invoices(
     invoice_date: Optional[str] = None,
     mart_name: Optional[str] = None,
     search: Optional[str] = None,
-) -> List[Invoice]:
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve all invoices with optional filters.
+    Retrieve a page of invoices with optional filters, newest first.
 
     Args:
         db (Session): Database session.
         invoice_date (Optional[str]): Filter by date.
         mart_name (Optional[str]): Filter by mart name.
-        search (Optional[str]): Search term.
+        search (Optional[str]): Search term for mart name or remarks.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all matching invoices.
 
     Returns:
-        List[Invoice]: List of invoices.
+        Page: Invoices and the next cursor.
     """
     logger.debug("Fetching invoices with filters")
     query = db.query(Invoice)
@@ -219,8 +541,10 @@ def get_all_invoices(
         query = query.filter(Invoice.mart_name == mart_name)
     if search:
         term = f"%{search}%"
-        query = query.filter(or_(Invoice.mart_name.ilike(term)))
-    return query.order_by(Invoice.invoice_date.desc()).all()
+        query = query.filter(
+            or_(Invoice.mart_name.ilike(term), Invoice.remarks.ilike(term))
+        )
+    return paginate(query, (Invoice.created_at, Invoice.id), cursor, limit, count)
 
 
 def update_invoice(
@@ -266,7 +590,9 @@ def delete_invoice(db: Session, invoice_id: int) -> bool:
     if not inv:
         logger.error(f"Invoice not found id={invoice_id}")
         return False
+    pnl_keys = invoice_pnl_keys(db, invoice_id)
     db.delete(inv)
     db.commit()
+    refresh_pnl_keys(db, pnl_keys)
     logger.debug(f"Invoice id={invoice_id} deleted")
     return True
@@ -14,6 +14,7 @@ from app.db.models.invoice_item import InvoiceItem
 from app.db.models.invoice import Invoice
 from app.db.models.audit_log import AuditLog
 from app.db.schemas.invoice_item import InvoiceItemUpdate
+from app.services.pnl_summary import refresh_pnl_keys
 
 logger = logging.getLogger(__name__)
 
@@ -77,10 +78,14 @@ def update_invoice_item(
         logger.error(f"Invoice item not found: id={item_id}")
         raise AppException("Item not found", status_code=404)
 
+    old_key = (item.store_name, item.invoice_date)
     for field, value in update_data.dict(exclude_unset=True).items():
         setattr(item, field, value)
     db.commit()
     db.refresh(item)
+    # the new key is picked up by the watermark refresh; the old one is not
+    if old_key != (item.store_name, item.invoice_date):
+        refresh_pnl_keys(db, [old_key])
     logger.debug(f"Item id={item_id} updated, recalculating invoice total")
     recalculate_invoice_total(db, item.invoice_id)
     return item
@@ -107,8 +112,10 @@ def delete_invoice_item(db: Session, item_id: int) -> bool:
         raise AppException("Item not found", status_code=404)
 
     invoice_id = item.invoice_id
+    pnl_key = (item.store_name, item.invoice_date)
     db.delete(item)
     db.commit()
+    refresh_pnl_keys(db, [pnl_key])
     logger.debug(f"Item id={item_id} deleted, recalculating invoice total")
     recalculate_invoice_total(db, invoice_id)
     return True
@@ -12,8 +12,11 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import AppException
 from app.db.models import Item
 from app.db.models.batch import Batch
+from app.db.pagination import CountMode, Page, paginate
 from app.db.schemas.item import ItemCreate, ItemRead, ItemUpdate
 from app.db.models.uom import UOM
+from app.services.item_index import item_index
+from app.services.sync import record_deletion
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +35,12 @@ def create_item(db: Session, entry: ItemCreate, created_by: int) -> Item:
     """
     logger.info(f"Creating item '{entry.name}'")
     new_item = Item(
-        name=entry.name, default_unit=entry.default_unit, created_by=created_by
+        name=entry.name, item_code=entry.item_code, created_by=created_by
     )
     db.add(new_item)
     db.commit()
     db.refresh(new_item)
+    item_index.upsert_item(new_item)
     logger.debug(f"Created item id={new_item.id}")
     return new_item
 
@@ -63,27 +67,33 @@ def get_item(db: Session, item_id: int) -> Optional[Item]:
     return item_data
 
 
-def get_all_items(db: Session, skip: int = 0, limit: int = 100) -> List[Item]:
+def get_all_items(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve all catalog items with pagination.
+    Retrieve a page of catalog items, newest first.
 
     Args:
         db (Session): Database session.
-        skip (int): Records to skip.
+        cursor (Optional[str]): Cursor of the previous page.
         limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all items.
 
     Returns:
-        List[Item]: List of items.
+        Page: Items (as ItemRead with default_unit) and the next cursor.
     """
-    logger.debug(f"Fetching items skip={skip}, limit={limit}")
-    items = db.query(Item).offset(skip).limit(limit).all()
+    logger.debug(f"Fetching items cursor={cursor}, limit={limit}")
+    page = paginate(db.query(Item), (Item.created_at, Item.id), cursor, limit, count)
     uoms = {u.id: u.code for u in db.query(UOM).all()}
     result = []
-    for item in items:
+    for item in page.items:
         item_data = ItemRead.from_orm(item)
         item_data.default_unit = uoms.get(item.default_uom_id)
         result.append(item_data)
-    return result
+    return page._replace(items=result)
 
 
 def get_items_with_available_batches(db: Session) -> List[Item]:
@@ -134,6 +144,7 @@ def update_item(
     item.updated_by = updated_by
     db.commit()
     db.refresh(item)
+    item_index.upsert_item(item)
     uom = db.query(UOM).filter(UOM.id == item.default_uom_id).first()
     item_data = ItemRead.from_orm(item)
     item_data.default_unit = uom.code if uom else None
@@ -157,6 +168,8 @@ def delete_item(db: Session, item_id: int) -> bool:
         logger.error(f"Item not found id={item_id}")
         return False
     db.delete(item)
+    record_deletion(db, Item, item_id)
     db.commit()
+    item_index.remove_item(item_id)
     logger.debug(f"Item id={item_id} deleted")
     return True
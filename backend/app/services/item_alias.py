@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from app.db.models.item_alias import ItemAlias
+from app.db.pagination import CountMode, Page, paginate
 from app.db.schemas.item_alias import ItemAliasCreate, ItemAliasUpdate
+from app.services.item_index import AliasEntry, item_index
+
+MAX_SUGGESTIONS = 10
 
 
 def create_alias(db: Session, data: ItemAliasCreate, created_by: str) -> ItemAlias:
@@ -9,16 +13,70 @@ def create_alias(db: Session, data: ItemAliasCreate, created_by: str) -> ItemAli
     db.add(alias)
     db.commit()
     db.refresh(alias)
+    item_index.add_alias(alias)
     return alias
 
 
-def get_all_aliases(db: Session) -> List[ItemAlias]:
-    return db.query(ItemAlias).all()
+def list_distinct_aliases(db: Session) -> List[ItemAlias]:
+    return db.query(ItemAlias).distinct(ItemAlias.alias_name).all()
 
 
-def get_alias_by_code_or_name(db: Session, code: str, name: str) -> Optional[ItemAlias]:
-    return (
-        db.query(ItemAlias)
-        .filter((ItemAlias.alias_code == code) | (ItemAlias.alias_name.ilike(name)))
-        .first()
+def get_all_aliases(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
+    return paginate(
+        db.query(ItemAlias), (ItemAlias.created_at, ItemAlias.id), cursor, limit, count
     )
+
+
+def get_alias_by_code_or_name(
+    db: Session, code: str, name: str
+) -> Optional[AliasEntry]:
+    return item_index.ensure_loaded(db).lookup(code, name)
+
+
+def resolve_invoice_items(
+    db: Session, lines: Sequence[Tuple[str, str, str]], suggest: bool = True
+) -> Tuple[List[Optional[int]], List[Dict]]:
+    """
+    Map invoice lines to master items using the in-memory item index.
+
+    Lines are matched on alias code or normalized alias name. Unmapped lines
+    get trigram-ranked suggestions; repeated lines share one lookup.
+
+    Args:
+        db (Session): Database session, used only to load the index.
+        lines (Sequence[Tuple[str, str, str]]): (item_code, item_name, uom) per line.
+        suggest (bool): Rank suggested items for unmapped lines; back-fills
+            that show them to nobody skip it.
+
+    Returns:
+        Tuple[List[Optional[int]], List[Dict]]: Master item id per line (None when
+        unmapped), and one entry with suggested items per unmapped line.
+    """
+    index = item_index.ensure_loaded(db)
+    item_ids: List[Optional[int]] = []
+    unmapped: List[Dict] = []
+    suggestions: Dict[Tuple[str, str], List[Dict]] = {}
+    for code, name, uom in lines:
+        alias = index.lookup(code, name)
+        if alias:
+            item_ids.append(alias.master_item_id)
+            continue
+        item_ids.append(None)
+        if (code, name) not in suggestions:
+            suggestions[(code, name)] = (
+                index.suggest(code, name, MAX_SUGGESTIONS) if suggest else []
+            )
+        unmapped.append(
+            {
+                "item_code": code,
+                "item_name": name,
+                "uom": uom,
+                "suggested_items": suggestions[(code, name)],
+            }
+        )
+    return item_ids, unmapped
@@ -4,16 +4,18 @@ Handles CRUD operations on unit/item conversion mappings.
 """
 
 import logging
-from typing import List, Optional
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import AppException
 from app.db.models.item_conversion_map import ItemConversionMap
+from app.db.pagination import CountMode, Page, paginate
 from app.db.schemas.item_conversion_map import (
     ItemConversionCreate,
     ItemConversionUpdate,
 )
+from app.services.conversion_graph import conversion_graph
 
 logger = logging.getLogger(__name__)
 
@@ -23,30 +25,19 @@ def get_conversion_factor(
 ) -> float:
     """
     Returns the conversion factor to convert from 'from_unit' to 'to_unit' for a given item.
-    If from_unit == to_unit, returns 1.0.
+    If from_unit == to_unit, returns 1.0. Multi-hop conversions (KG -> EA -> BOX)
+    and reverse mappings are resolved from the in-memory conversion graph;
+    on a miss the item's conversions are reloaded before giving up.
     Raises AppException if no conversion is found.
     """
-    if from_unit == to_unit:
-        return 1.0
-
-    conv = (
-        db.query(ItemConversionMap)
-        .filter_by(item_id=item_id, source_unit=from_unit, target_unit=to_unit)
-        .first()
-    )
-    if conv:
-        return conv.conversion_factor
-
-    conv_rev = (
-        db.query(ItemConversionMap)
-        .filter_by(item_id=item_id, source_unit=to_unit, target_unit=from_unit)
-        .first()
-    )
-    if conv_rev and conv_rev.conversion_factor != 0:
-        logger.warning(
-            f"Using reverse conversion for item_id={item_id} from {to_unit} to {from_unit}"
-        )
-        return 1.0 / conv_rev.conversion_factor
+    graph = conversion_graph.ensure_loaded(db)
+    factor = graph.factor(item_id, from_unit, to_unit)
+    if factor is None:
+        # possibly created by another worker since this one loaded the item
+        graph.refresh_item(db, item_id)
+        factor = graph.factor(item_id, from_unit, to_unit)
+    if factor is not None:
+        return factor
 
     raise AppException(
         f"No conversion factor found for item_id={item_id} from '{from_unit}' to '{to_unit}'"
@@ -74,22 +65,37 @@ def create_conversion(
     db.add(conv)
     db.commit()
     db.refresh(conv)
+    conversion_graph.refresh_item(db, conv.item_id)
     logger.debug(f"Created conversion id={conv.id}")
     return conv
 
 
-def get_all_conversions(db: Session) -> List[ItemConversionMap]:
+def get_all_conversions(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve all conversion mappings.
+    Retrieve a page of conversion mappings, newest first.
 
     Args:
         db (Session): Database session.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all mappings.
 
     Returns:
-        List[ItemConversionMap]: All mappings.
+        Page: Mappings and the next cursor.
     """
-    logger.debug("Fetching all conversion mappings")
-    return db.query(ItemConversionMap).all()
+    logger.debug(f"Fetching conversion mappings cursor={cursor}, limit={limit}")
+    return paginate(
+        db.query(ItemConversionMap),
+        (ItemConversionMap.created_at, ItemConversionMap.id),
+        cursor,
+        limit,
+        count,
+    )
 
 
 def get_conversion(db: Session, conv_id: int) -> Optional[ItemConversionMap]:
@@ -127,11 +133,15 @@ def update_conversion(
     if not conv:
         logger.error(f"Conversion not found id={conv_id}")
         return None
+    previous_item_id = conv.item_id
     for field, val in data.dict(exclude_unset=True).items():
         setattr(conv, field, val)
     conv.updated_by = updated_by
     db.commit()
     db.refresh(conv)
+    conversion_graph.refresh_item(db, conv.item_id)
+    if previous_item_id != conv.item_id:
+        conversion_graph.refresh_item(db, previous_item_id)
     logger.debug(f"Conversion id={conv_id} updated")
     return conv
 
@@ -152,7 +162,9 @@ def delete_conversion(db: Session, conv_id: int) -> bool:
     if not conv:
         logger.error(f"Conversion not found id={conv_id}")
         return False
+    item_id = conv.item_id
     db.delete(conv)
     db.commit()
+    conversion_graph.refresh_item(db, item_id)
     logger.debug(f"Conversion id={conv_id} deleted")
     return True
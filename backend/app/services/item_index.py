@@ -0,0 +1,267 @@
+"""
+In-process index of master items and their aliases.
+Answers exact code lookups, normalized-name lookups and trigram-ranked
+suggestions for invoice lines without touching the database. The index is
+built on first use, updated in place when aliases or items change in this
+process, and reloaded after ITEM_INDEX_TTL_SECONDS to pick up writes made
+by other workers.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.item import Item
+from app.db.models.item_alias import ItemAlias
+from app.db.models.uom import UOM
+
+logger = logging.getLogger(__name__)
+
+# minimum suggestion score, as pg_trgm's default similarity threshold
+MIN_SIMILARITY = 0.3
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+class AliasEntry(NamedTuple):
+    id: int
+    master_item_id: int
+    alias_code: Optional[str]
+    alias_name: Optional[str]
+
+
+class ItemEntry(NamedTuple):
+    id: int
+    name: str
+    item_code: Optional[str]
+    default_uom_id: Optional[int]
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """
+    Case- and punctuation-insensitive form of an item name, so that
+    "APPLE PINK LADY NZ (KG )" and "apple pink lady nz (kg)" compare equal.
+    """
+    return " ".join(_NON_ALNUM.sub(" ", (name or "").lower()).split())
+
+
+def trigrams(name: str) -> Set[str]:
+    """
+    Trigrams of a normalized name, padded per word the way pg_trgm does.
+    """
+    grams = set()
+    for word in name.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(query: Set[str], candidate: Set[str]) -> float:
+    """
+    Mean of trigram Jaccard similarity and how much of the candidate is
+    contained in the query, so extra invoice noise ("IMP USA (KG)") does
+    not sink an otherwise matching master name.
+    """
+    shared = len(query & candidate)
+    return (shared / len(query | candidate) + shared / len(candidate)) / 2
+
+
+class ItemIndex:
+    """
+    Items, aliases and UOM codes held in memory with lookup tables.
+
+    All public methods are thread-safe; sync routes run in a thread pool.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._items: Dict[int, ItemEntry] = {}
+        self._aliases: Dict[int, AliasEntry] = {}
+        self._uoms: Dict[int, str] = {}
+        self._by_code: Dict[str, AliasEntry] = {}
+        self._by_name: Dict[str, AliasEntry] = {}
+        # trigram -> item ids whose name or alias names contain it
+        self._grams: Dict[str, Set[int]] = defaultdict(set)
+        # item id -> trigram set of its name and of each alias name
+        self._item_grams: Dict[int, List[Set[str]]] = defaultdict(list)
+
+    def ensure_loaded(self, db: Session) -> "ItemIndex":
+        """
+        Load the index if it is empty, stale or invalidated.
+        """
+        with self._lock:
+            ttl = settings.ITEM_INDEX_TTL_SECONDS
+            if self._loaded_at is None or (
+                ttl > 0 and time.monotonic() - self._loaded_at > ttl
+            ):
+                self._load(db)
+        return self
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def _load(self, db: Session) -> None:
+        start = time.perf_counter()
+        self._items = {
+            row.id: ItemEntry(row.id, row.name, row.item_code, row.default_uom_id)
+            for row in db.query(
+                Item.id, Item.name, Item.item_code, Item.default_uom_id
+            )
+        }
+        self._aliases = {
+            row.id: AliasEntry(
+                row.id, row.master_item_id, row.alias_code, row.alias_name
+            )
+            for row in db.query(
+                ItemAlias.id,
+                ItemAlias.master_item_id,
+                ItemAlias.alias_code,
+                ItemAlias.alias_name,
+            )
+        }
+        self._uoms = {row.id: row.code for row in db.query(UOM.id, UOM.code)}
+        self._reindex()
+        self._loaded_at = time.monotonic()
+        logger.info(
+            f"Loaded item index: {len(self._items)} items, {len(self._aliases)} "
+            f"aliases in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+
+    def _reindex(self) -> None:
+        self._by_code = {}
+        self._by_name = {}
+        self._grams = defaultdict(set)
+        self._item_grams = defaultdict(list)
+        # lowest id first, so the oldest alias wins as in the SQL lookup
+        for alias in sorted(self._aliases.values()):
+            self._index_alias(alias)
+        for item in self._items.values():
+            self._index_name(item.id, item.name)
+
+    def _index_alias(self, alias: AliasEntry) -> None:
+        if alias.alias_code:
+            self._by_code.setdefault(alias.alias_code, alias)
+        if alias.alias_name:
+            self._by_name.setdefault(normalize_name(alias.alias_name), alias)
+            self._index_name(alias.master_item_id, alias.alias_name)
+
+    def _index_name(self, item_id: int, name: Optional[str]) -> None:
+        grams = trigrams(normalize_name(name))
+        if not grams:
+            return
+        self._item_grams[item_id].append(grams)
+        for gram in grams:
+            self._grams[gram].add(item_id)
+
+    def add_alias(self, alias: ItemAlias) -> None:
+        """
+        Index a newly created alias.
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            entry = AliasEntry(
+                alias.id, alias.master_item_id, alias.alias_code, alias.alias_name
+            )
+            self._aliases[entry.id] = entry
+            # new ids are the highest, so existing lookups keep precedence
+            self._index_alias(entry)
+
+    def upsert_item(self, item: Item) -> None:
+        """
+        Index a created or updated item, replacing any previous name.
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            previous = self._items.get(item.id)
+            entry = ItemEntry(item.id, item.name, item.item_code, item.default_uom_id)
+            self._items[item.id] = entry
+            if previous is None:
+                self._index_name(item.id, item.name)
+            elif previous.name != item.name:
+                self._reindex()
+
+    def remove_item(self, item_id: int) -> None:
+        """
+        Drop a deleted item and its aliases.
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._items.pop(item_id, None)
+            self._aliases = {
+                k: a for k, a in self._aliases.items() if a.master_item_id != item_id
+            }
+            self._reindex()
+
+    def lookup(self, code: Optional[str], name: Optional[str]) -> Optional[AliasEntry]:
+        """
+        Alias matching the code or the normalized name; the oldest wins.
+        """
+        with self._lock:
+            matches = [
+                a
+                for a in (
+                    self._by_code.get(code) if code else None,
+                    self._by_name.get(normalize_name(name)) if name else None,
+                )
+                if a
+            ]
+        return min(matches) if matches else None
+
+    def suggest(
+        self, code: Optional[str], name: Optional[str], limit: int = 10
+    ) -> List[Dict]:
+        """
+        Items ranked by trigram similarity to their name or alias names.
+
+        Items whose code contains `code` rank first.
+
+        Args:
+            code (Optional[str]): Invoice item code.
+            name (Optional[str]): Invoice item name.
+            limit (int): Max suggestions.
+
+        Returns:
+            List[Dict]: {id, name, item_code, uom} per suggested item.
+        """
+        query = trigrams(normalize_name(name))
+        code_l = code.lower() if code else None
+        with self._lock:
+            candidates: Set[int] = set()
+            for gram in query:
+                candidates.update(self._grams.get(gram, ()))
+            scores: Dict[int, float] = {}
+            for item_id in candidates:
+                best = max(
+                    similarity(query, grams) for grams in self._item_grams[item_id]
+                )
+                if best >= MIN_SIMILARITY:
+                    scores[item_id] = best
+            if code_l:
+                for item in self._items.values():
+                    if item.item_code and code_l in item.item_code.lower():
+                        scores[item.id] = 1.0 + scores.get(item.id, 0.0)
+
+            ranked = sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+            return [
+                {
+                    "id": item.id,
+                    "name": item.name,
+                    "item_code": item.item_code,
+                    "uom": self._uoms.get(item.default_uom_id),
+                }
+                for item in (self._items[i] for i in ranked if i in self._items)
+            ]
+
+
+item_index = ItemIndex()
@@ -0,0 +1,57 @@
+"""
+Relationship loading declared per read schema.
+Each read schema lists the relationships its serialization touches,
+including through properties such as `Batch.item_name`, as loader
+options. Services returning rows for a schema add
+`.options(*loaders_for(SchemaRead))`, so a list endpoint issues the same
+number of statements for 1 row or 500 instead of one lazy load per row.
+"""
+
+from typing import Dict, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.db.models.batch import Batch
+from app.db.models.dispatch_entry import DispatchEntry
+from app.db.models.order import Order
+from app.db.models.rejection_entry import RejectionEntry
+from app.db.models.stock_entry import StockEntry
+from app.db.schemas.batch import BatchRead
+from app.db.schemas.dispatch_entry import DispatchEntryRead
+from app.db.schemas.order import OrderRead
+from app.db.schemas.rejection_entry import RejectionEntryRead
+from app.db.schemas.stock_entry import StockEntryRead
+
+# read schema -> loader options for every relationship it serializes.
+# selectinload keeps the paged query (and its count) free of joins; each
+# relationship costs one extra IN query per page.
+RESPONSE_LOADERS: Dict[Type[BaseModel], Tuple[LoaderOption, ...]] = {
+    # item_name
+    BatchRead: (selectinload(Batch.item),),
+    # batch: BatchRead
+    DispatchEntryRead: (selectinload(DispatchEntry.batch).selectinload(Batch.item),),
+    # item: ItemRead
+    OrderRead: (selectinload(Order.item),),
+    # batch: BatchRead
+    RejectionEntryRead: (
+        selectinload(RejectionEntry.batch).selectinload(Batch.item),
+    ),
+    # item: ItemRead
+    StockEntryRead: (selectinload(StockEntry.item),),
+}
+
+
+def loaders_for(schema: Type[BaseModel]) -> Tuple[LoaderOption, ...]:
+    """
+    Loader options for the rows serialized as `schema`.
+
+    Args:
+        schema (Type[BaseModel]): Read schema of the response.
+
+    Returns:
+        Tuple[LoaderOption, ...]: Options to pass to `.options()`; empty
+        for schemas that serialize no relationships.
+    """
+    return RESPONSE_LOADERS.get(schema, ())
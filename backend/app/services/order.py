@@ -11,7 +11,10 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import AppException
 from app.db.models.order import Order
 from app.db.models.invoice import Invoice
-from app.db.schemas.order import OrderCreate, OrderUpdate
+from app.db.pagination import CountMode, Page, paginate
+from app.db.schemas.order import OrderCreate, OrderRead, OrderUpdate
+from app.services.loaders import loaders_for
+from app.services.sync import record_deletion
 
 logger = logging.getLogger(__name__)
 
@@ -93,26 +96,34 @@ def get_order(db: Session, order_id: int) -> Optional[Order]:
 
 
 def get_orders(
-    db: Session, order_date: Optional[date] = None, mart_name: Optional[str] = None
-) -> List[Order]:
+    db: Session,
+    order_date: Optional[date] = None,
+    mart_name: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve orders with optional filters.
+    Retrieve a page of orders with optional filters, newest first.
 
     Args:
         db (Session): Database session.
         order_date (Optional[date]): Filter by date.
         mart_name (Optional[str]): Filter by mart.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all matching orders.
 
     Returns:
-        List[Order]: List of orders.
+        Page: Orders and the next cursor.
     """
-    logger.debug(f"Fetching orders date={order_date}, mart={mart_name}")
-    q = db.query(Order)
+    logger.debug(f"Fetching orders date={order_date}, mart={mart_name}, cursor={cursor}")
+    q = db.query(Order).options(*loaders_for(OrderRead))
     if order_date:
         q = q.filter(Order.order_date == order_date)
     if mart_name:
         q = q.filter(Order.mart_name == mart_name)
-    return q.order_by(Order.created_at.desc()).all()
+    return paginate(q, (Order.created_at, Order.id), cursor, limit, count)
 
 
 def update_order(
@@ -172,6 +183,7 @@ def delete_order(db: Session, order_id: int) -> bool:
         logger.error(f"Order not found id={order_id}")
         return False
     db.delete(ord_)
+    record_deletion(db, Order, order_id)
     db.commit()
     logger.debug(f"Order id={order_id} deleted")
     return True
@@ -0,0 +1,310 @@
+"""
+Service functions for the materialized P&L table.
+Recomputes pnl_daily rows per (mart_name, date) from invoice items
+(sales) and dispatches priced by their batch's stock entries (cost).
+Incremental refreshes only touch keys whose source rows changed since the
+last watermark; deletes and key changes refresh their keys directly.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import and_, delete, func, select, text, true, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.dispatch_entry import DispatchEntry
+from app.db.models.invoice_item import InvoiceItem
+from app.db.models.pnl_daily import PnlDaily
+from app.db.models.refresh_watermark import RefreshWatermark
+from app.db.models.stock_entry import StockEntry
+
+logger = logging.getLogger(__name__)
+
+PnlKey = Tuple[str, date]
+
+WATERMARK_NAME = "pnl_summary"
+# rescan this far behind the watermark so rows committed late (their
+# updated_at is set before commit) are not missed
+WATERMARK_OVERLAP = timedelta(minutes=5)
+# pg_advisory_xact_lock key serializing pnl_daily rewrites ("pnl" in ASCII)
+PNL_LOCK_KEY = 0x706E6C
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def _batch_price():
+    """
+    Quantity-weighted unit price of the dispatch's batch, so a batch with
+    several stock entries prices each dispatch once instead of once per
+    entry. Correlated per dispatch, so only the batches in range are read.
+    """
+    return (
+        select(
+            func.sum(StockEntry.price_per_unit * StockEntry.quantity)
+            / func.nullif(func.sum(StockEntry.quantity), 0)
+        )
+        .where(StockEntry.batch_id == DispatchEntry.batch_id)
+        .correlate(DispatchEntry)
+        .scalar_subquery()
+    )
+
+
+def _compute(
+    db: Session,
+    start: Optional[date],
+    end: Optional[date],
+    marts: Optional[Set[str]] = None,
+    keys: Optional[Set[PnlKey]] = None,
+) -> Dict[PnlKey, Tuple[float, float]]:
+    """
+    (sales, cost) per key within [start, end], optionally for some marts
+    or exact keys.
+    """
+    sales_q = select(
+        InvoiceItem.store_name,
+        func.date(InvoiceItem.invoice_date),
+        func.sum(InvoiceItem.total),
+    ).group_by(InvoiceItem.store_name, func.date(InvoiceItem.invoice_date))
+    if start:
+        sales_q = sales_q.where(InvoiceItem.invoice_date >= start)
+    if end:
+        sales_q = sales_q.where(InvoiceItem.invoice_date < end + timedelta(days=1))
+    if marts is not None:
+        sales_q = sales_q.where(InvoiceItem.store_name.in_(marts))
+
+    dispatch_filter = []
+    if start:
+        dispatch_filter.append(DispatchEntry.dispatch_date >= start)
+    if end:
+        dispatch_filter.append(DispatchEntry.dispatch_date <= end)
+    if marts is not None:
+        dispatch_filter.append(DispatchEntry.mart_name.in_(marts))
+    if keys is not None:
+        dispatch_filter.append(
+            tuple_(DispatchEntry.mart_name, DispatchEntry.dispatch_date).in_(keys)
+        )
+    costs = (
+        select(
+            DispatchEntry.mart_name,
+            DispatchEntry.dispatch_date,
+            (DispatchEntry.quantity * _batch_price()).label("cost"),
+        )
+        .where(*dispatch_filter)
+        .subquery()
+    )
+    cost_q = select(
+        costs.c.mart_name, costs.c.dispatch_date, func.sum(costs.c.cost)
+    ).group_by(costs.c.mart_name, costs.c.dispatch_date)
+
+    totals: Dict[PnlKey, list] = defaultdict(lambda: [0.0, 0.0])
+    for mart, day, sales in db.execute(sales_q):
+        totals[(mart, _as_date(day))][0] += sales or 0.0
+    for mart, day, cost in db.execute(cost_q):
+        totals[(mart, _as_date(day))][1] += cost or 0.0
+    return {key: (sales, cost) for key, (sales, cost) in totals.items()}
+
+
+def _lock(db: Session) -> None:
+    """
+    Serialize P&L refreshes until the transaction ends. Each one deletes
+    and re-inserts its rows, so two overlapping refreshes would insert
+    keys the other's delete never saw and fail on the unique key; the
+    first run would also race on inserting the watermark row. SQLite
+    allows one writer at a time anyway.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PNL_LOCK_KEY})
+
+
+def _replace(
+    db: Session, totals: Dict[PnlKey, Tuple[float, float]], stale
+) -> int:
+    """
+    Delete the rows matched by `stale` and insert `totals`; no commit.
+    """
+    db.execute(delete(PnlDaily).where(stale))
+    now = datetime.utcnow()
+    db.add_all(
+        PnlDaily(
+            mart_name=mart,
+            date=day,
+            total_sales=sales,
+            total_purchase=cost,
+            profit=sales - cost,
+            refreshed_at=now,
+        )
+        for (mart, day), (sales, cost) in totals.items()
+    )
+    db.flush()
+    return len(totals)
+
+
+def refresh_pnl_keys(db: Session, keys: Iterable[PnlKey], commit: bool = True) -> int:
+    """
+    Recompute specific (mart_name, date) rows, e.g. after a delete.
+
+    Args:
+        db (Session): Database session.
+        keys (Iterable[PnlKey]): Keys to recompute.
+        commit (bool): Commit when done.
+
+    Returns:
+        int: Rows written.
+    """
+    keys = {(mart, _as_date(day)) for mart, day in keys}
+    if not keys:
+        return 0
+    _lock(db)
+    days = [day for _, day in keys]
+    totals = _compute(db, min(days), max(days), {mart for mart, _ in keys}, keys)
+    totals = {key: value for key, value in totals.items() if key in keys}
+    written = _replace(db, totals, tuple_(PnlDaily.mart_name, PnlDaily.date).in_(keys))
+    if commit:
+        db.commit()
+    logger.debug(f"Refreshed {len(keys)} P&L keys")
+    return written
+
+
+def refresh_pnl_range(db: Session, start: Optional[date], end: Optional[date]) -> int:
+    """
+    Recompute every mart's rows between start and end (inclusive).
+
+    Args:
+        db (Session): Database session.
+        start (Optional[date]): First day, or None for unbounded.
+        end (Optional[date]): Last day, or None for unbounded.
+
+    Returns:
+        int: Rows written.
+    """
+    logger.info(f"Recomputing P&L from {start} to {end}")
+    _lock(db)
+    stale = and_(
+        PnlDaily.date >= start if start else true(),
+        PnlDaily.date <= end if end else true(),
+    )
+    written = _replace(db, _compute(db, start, end), stale)
+    db.commit()
+    return written
+
+
+def invoice_pnl_keys(db: Session, invoice_id: int) -> Set[PnlKey]:
+    """
+    Keys an invoice's items contribute to; gather before deleting it.
+    """
+    rows = db.execute(
+        select(InvoiceItem.store_name, InvoiceItem.invoice_date)
+        .where(InvoiceItem.invoice_id == invoice_id)
+        .distinct()
+    )
+    return {(mart, _as_date(day)) for mart, day in rows}
+
+
+def batch_pnl_keys(db: Session, batch_id: int) -> Set[PnlKey]:
+    """
+    Keys whose cost depends on a batch's stock entries.
+    """
+    rows = db.execute(
+        select(DispatchEntry.mart_name, DispatchEntry.dispatch_date)
+        .where(DispatchEntry.batch_id == batch_id)
+        .distinct()
+    )
+    return {(mart, _as_date(day)) for mart, day in rows}
+
+
+def _touched_keys(db: Session, since: datetime) -> Set[PnlKey]:
+    keys: Set[PnlKey] = set()
+    dispatch_key = select(DispatchEntry.mart_name, DispatchEntry.dispatch_date)
+    # separate statements so each can use its updated_at index
+    queries = (
+        select(InvoiceItem.store_name, InvoiceItem.invoice_date).where(
+            InvoiceItem.updated_at > since
+        ),
+        dispatch_key.where(DispatchEntry.updated_at > since),
+        dispatch_key.where(
+            DispatchEntry.batch_id.in_(
+                select(StockEntry.batch_id).where(StockEntry.updated_at > since)
+            )
+        ),
+    )
+    for query in queries:
+        for mart, day in db.execute(query.distinct()):
+            keys.add((mart, _as_date(day)))
+    return keys
+
+
+def refresh_pnl_summary(db: Session, full: bool = False) -> int:
+    """
+    Bring pnl_daily up to date with changes since the last watermark.
+
+    Holds the P&L lock for the duration, so concurrent refreshes run one
+    after another, the first one included. The first run (or full=True)
+    rebuilds everything.
+
+    Args:
+        db (Session): Database session.
+        full (bool): Recompute all rows instead of only touched keys.
+
+    Returns:
+        int: Rows written.
+    """
+    _lock(db)
+    now = datetime.utcnow()
+    mark = db.scalar(
+        select(RefreshWatermark).where(RefreshWatermark.name == WATERMARK_NAME)
+    )
+    if mark is None or full:
+        logger.info("Rebuilding P&L summary")
+        written = _replace(db, _compute(db, None, None), true())
+    else:
+        keys = _touched_keys(db, mark.watermark - WATERMARK_OVERLAP)
+        written = refresh_pnl_keys(db, keys, commit=False)
+        logger.info(f"Refreshed P&L summary: {len(keys)} keys touched")
+    if mark is None:
+        db.add(RefreshWatermark(name=WATERMARK_NAME, watermark=now))
+    else:
+        mark.watermark = now
+    db.commit()
+    return written
+
+
+def _try_lock(db: Session) -> bool:
+    """
+    Take the P&L lock if no other refresh holds it, without waiting.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return True
+    return db.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": PNL_LOCK_KEY})
+
+
+def refresh_pnl_summary_if_stale(db: Session) -> None:
+    """
+    Run an incremental refresh when the last one is older than
+    PNL_REFRESH_INTERVAL_SECONDS (0 disables refresh on read).
+
+    Called on reads, so it never waits for the P&L lock: while another
+    refresh runs, the reader gets the rows as they are.
+    """
+    interval = settings.PNL_REFRESH_INTERVAL_SECONDS
+    if interval <= 0:
+        return
+    last = db.scalar(
+        select(RefreshWatermark.watermark).where(
+            RefreshWatermark.name == WATERMARK_NAME
+        )
+    )
+    if last is None or datetime.utcnow() - last > timedelta(seconds=interval):
+        if not _try_lock(db):
+            logger.debug("P&L refresh already running, serving current rows")
+            return
+        # the lock is held until commit; refresh_pnl_summary takes it again
+        refresh_pnl_summary(db)
@@ -12,9 +12,11 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import AppException
 from app.db.models.rejection_entry import RejectionEntry
 from app.db.models.batch import Batch
-from app.db.schemas.rejection_entry import RejectionEntryCreate
+from app.db.pagination import CountMode, Page, paginate
+from app.db.schemas.rejection_entry import RejectionEntryCreate, RejectionEntryRead
 from app.services.item_conversion_map import get_conversion_factor
 from app.services.inventory_txn import create_inventory_txn
+from app.services.loaders import loaders_for
 from app.db.schemas.inventory_txn import InventoryTxnCreate
 
 logger = logging.getLogger(__name__)
@@ -93,18 +95,32 @@ def create_rejection_entry(
         raise AppException("Rejection entry creation failed", status_code=500)
 
 
-def get_all_rejections(db: Session) -> List[RejectionEntry]:
+def get_all_rejections(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve all rejection entries ordered by date desc.
+    Retrieve a page of rejection entries, newest first.
 
     Args:
         db (Session): Database session.
+        cursor (Optional[str]): Cursor of the previous page.
+        limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all rejections.
 
     Returns:
-        List[RejectionEntry]: List of rejections.
+        Page: Rejections and the next cursor.
     """
-    logger.debug("Fetching all rejection entries")
-    return db.query(RejectionEntry).order_by(RejectionEntry.rejection_date.desc()).all()
+    logger.debug(f"Fetching rejection entries cursor={cursor}, limit={limit}")
+    return paginate(
+        db.query(RejectionEntry).options(*loaders_for(RejectionEntryRead)),
+        (RejectionEntry.created_at, RejectionEntry.id),
+        cursor,
+        limit,
+        count,
+    )
 
 
 def get_rejections_by_date_and_items(
@@ -122,7 +138,11 @@ def get_rejections_by_date_and_items(
         List[RejectionEntry]: Filtered rejections.
     """
     logger.debug(f"Fetching rejections for date={rejection_date}, items={item_ids}")
-    q = db.query(RejectionEntry).filter(RejectionEntry.rejection_date == rejection_date)
+    q = (
+        db.query(RejectionEntry)
+        .options(*loaders_for(RejectionEntryRead))
+        .filter(RejectionEntry.rejection_date == rejection_date)
+    )
     if item_ids:
         q = q.filter(RejectionEntry.item_id.in_(item_ids))
     return q.order_by(RejectionEntry.created_at.desc()).all()
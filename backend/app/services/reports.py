@@ -1,17 +1,23 @@
 """
 Service functions for reporting.
-Handles inventory and P&L summary retrieval from materialized views.
+Handles inventory and P&L summary retrieval from summary tables.
 """
 
 import logging
+from datetime import date
 from typing import List, Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.db.models.views.inventory_summary import InventorySummary
-from app.db.models.views.pnl_summary import PnlSummary
+from app.core.exceptions import AppException
+from app.db.models.item import Item
+from app.db.models.pnl_daily import PnlDaily
+from app.db.models.stock_balance import StockBalance
+from app.db.models.uom import UOM
 from app.db.schemas.inventory_summary import InventorySummaryRead
 from app.db.schemas.pnl_summary import PnlSummaryRead
+from app.services.pnl_summary import refresh_pnl_range, refresh_pnl_summary_if_stale
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +27,8 @@ def get_inventory_report(
 ) -> List[InventorySummaryRead]:
     """
     Retrieve inventory summary report, optionally filtered by item.
+    Reads the incrementally maintained stock_balance table rather than
+    aggregating the whole inventory_txn ledger.
 
     Args:
         db (Session): Database session.
@@ -30,34 +38,65 @@ def get_inventory_report(
         List[InventorySummaryRead]: Inventory summary data.
     """
     logger.info(f"Fetching inventory report for item_id={item_id}")
-    q = db.query(InventorySummary)
+    q = (
+        db.query(
+            StockBalance.item_id,
+            Item.name,
+            UOM.code.label("unit"),
+            func.sum(StockBalance.quantity).label("current_stock"),
+        )
+        .join(Item, Item.id == StockBalance.item_id)
+        .outerjoin(UOM, UOM.id == Item.default_uom_id)
+        .group_by(StockBalance.item_id, Item.name, UOM.code)
+    )
     if item_id:
-        q = q.filter(InventorySummary.item_id == item_id)
+        q = q.filter(StockBalance.item_id == item_id)
     results = q.all()
     logger.debug(f"Retrieved {len(results)} inventory records")
     return [InventorySummaryRead.from_orm(r) for r in results]
 
 
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise AppException(f"Invalid date {value!r}, expected YYYY-MM-DD", status_code=400)
+
+
 def get_pnl_report(
-    db: Session, start: Optional[str], end: Optional[str]
+    db: Session, start: Optional[str], end: Optional[str], fresh: bool = False
 ) -> List[PnlSummaryRead]:
     """
-    Retrieve profit & loss summary report between dates.
+    Retrieve profit & loss summary per mart and day between dates.
+    Reads the materialized pnl_daily table, catching up on changes first
+    when the last refresh is older than PNL_REFRESH_INTERVAL_SECONDS and no
+    other refresh is running (the read never waits for one).
 
     Args:
         db (Session): Database session.
         start (Optional[str]): Start date YYYY-MM-DD.
         end (Optional[str]): End date YYYY-MM-DD.
+        fresh (bool): Recompute the requested range before reading.
 
     Returns:
         List[PnlSummaryRead]: P&L summary data.
+
+    Raises:
+        AppException: If a date is malformed.
     """
-    logger.info(f"Fetching P&L report from {start} to {end}")
-    q = db.query(PnlSummary)
-    if start:
-        q = q.filter(PnlSummary.date >= start)
-    if end:
-        q = q.filter(PnlSummary.date <= end)
-    results = q.all()
+    logger.info(f"Fetching P&L report from {start} to {end} (fresh={fresh})")
+    start_date, end_date = _parse_date(start), _parse_date(end)
+    if fresh:
+        refresh_pnl_range(db, start_date, end_date)
+    else:
+        refresh_pnl_summary_if_stale(db)
+    q = db.query(PnlDaily)
+    if start_date:
+        q = q.filter(PnlDaily.date >= start_date)
+    if end_date:
+        q = q.filter(PnlDaily.date <= end_date)
+    results = q.order_by(PnlDaily.mart_name, PnlDaily.date).all()
     logger.debug(f"Retrieved {len(results)} P&L records")
     return [PnlSummaryRead.from_orm(r) for r in results]
@@ -0,0 +1,188 @@
+"""
+Service functions for the stock_balance table.
+Keeps running stock per (item, batch, base unit) in step with the
+inventory_txn ledger, and rebuilds or verifies it from the ledger.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.instrumentation import INVENTORY_TXNS
+from app.db.models.inventory_txn import InventoryTxn
+from app.db.models.stock_balance import STOCK_BALANCE_KEY, StockBalance
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[int, Optional[int], str]
+
+# ON CONFLICT statements per dialect, built once
+_UPSERTS: Dict[str, object] = {}
+
+# same sign convention as the inventory_summary view
+SIGNED_QTY = case(
+    (InventoryTxn.txn_type == "IN", InventoryTxn.base_qty),
+    (InventoryTxn.txn_type == "OUT", -InventoryTxn.base_qty),
+    else_=0.0,
+)
+
+
+def signed_qty(txn_type: str, base_qty: float) -> float:
+    if txn_type == "IN":
+        return base_qty
+    if txn_type == "OUT":
+        return -base_qty
+    return 0.0
+
+
+def apply_stock_movements(db: Session, txns: Iterable[Dict]) -> None:
+    """
+    Add ledger movements to stock_balance without committing.
+
+    Call in the same transaction as the inventory_txn insert. Movements are
+    summed per key and upserted in one statement, so concurrent writers
+    serialize on the balance row rather than overwrite each other.
+
+    Args:
+        db (Session): Database session.
+        txns (Iterable[Dict]): Ledger rows with item_id, batch_id, base_unit,
+            txn_type and base_qty.
+    """
+    deltas: Dict[Key, float] = defaultdict(float)
+    # every ledger insert passes through here, so it is counted here
+    written: Dict[str, int] = defaultdict(int)
+    for t in txns:
+        key = (t["item_id"], t.get("batch_id"), t["base_unit"])
+        deltas[key] += signed_qty(t["txn_type"], t["base_qty"])
+        written[t["txn_type"]] += 1
+    if not deltas:
+        return
+    for txn_type, count in written.items():
+        INVENTORY_TXNS.labels(txn_type).inc(count)
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "item_id": item_id,
+            "batch_id": batch_id,
+            "base_unit": base_unit,
+            "quantity": delta,
+            "updated_at": now,
+        }
+        for (item_id, batch_id, base_unit), delta in deltas.items()
+    ]
+    db.execute(
+        _upsert_statement(db.get_bind().dialect.name),
+        # a single row skips the executemany path
+        rows if len(rows) > 1 else rows[0],
+    )
+
+
+def _upsert_statement(dialect: str):
+    if dialect not in _UPSERTS:
+        upsert = (postgresql if dialect == "postgresql" else sqlite).insert(StockBalance)
+        _UPSERTS[dialect] = upsert.on_conflict_do_update(
+            index_elements=list(STOCK_BALANCE_KEY),
+            set_={
+                "quantity": StockBalance.quantity + upsert.excluded.quantity,
+                "updated_at": upsert.excluded.updated_at,
+            },
+        )
+    return _UPSERTS[dialect]
+
+
+def _ledger_balances(db: Session) -> Dict[Key, float]:
+    rows = db.execute(
+        select(
+            InventoryTxn.item_id,
+            InventoryTxn.batch_id,
+            InventoryTxn.base_unit,
+            func.sum(SIGNED_QTY),
+        ).group_by(InventoryTxn.item_id, InventoryTxn.batch_id, InventoryTxn.base_unit)
+    )
+    return {(r[0], r[1], r[2]): r[3] or 0.0 for r in rows}
+
+
+def rebuild_stock_balance(db: Session) -> int:
+    """
+    Recompute stock_balance from the full ledger in one transaction.
+
+    On Postgres the table is locked against writers before the ledger is
+    read: a movement committed between the read and the delete would
+    otherwise be lost. Writers wait and apply their movements on top.
+
+    Args:
+        db (Session): Database session.
+
+    Returns:
+        int: Number of balance rows written.
+    """
+    logger.info("Rebuilding stock_balance from inventory_txn")
+    if db.get_bind().dialect.name == "postgresql":
+        # blocks the writers' upserts (ROW EXCLUSIVE) but not readers
+        db.execute(text("LOCK TABLE stock_balance IN EXCLUSIVE MODE"))
+    balances = _ledger_balances(db)
+    now = datetime.utcnow()
+    db.execute(delete(StockBalance))
+    if balances:
+        db.execute(
+            insert(StockBalance),
+            [
+                {
+                    "item_id": item_id,
+                    "batch_id": batch_id,
+                    "base_unit": base_unit,
+                    "quantity": quantity,
+                    "updated_at": now,
+                }
+                for (item_id, batch_id, base_unit), quantity in balances.items()
+            ],
+        )
+    db.commit()
+    logger.info(f"Rebuilt {len(balances)} stock_balance rows")
+    return len(balances)
+
+
+def verify_stock_balance(db: Session, tolerance: float = 1e-6) -> List[Dict]:
+    """
+    Compare stock_balance with the ledger.
+
+    Args:
+        db (Session): Database session.
+        tolerance (float): Allowed float difference per row.
+
+    Returns:
+        List[Dict]: One entry per drifting key with expected and actual stock.
+    """
+    expected = _ledger_balances(db)
+    actual = {
+        (r.item_id, r.batch_id, r.base_unit): r.quantity
+        for r in db.query(
+            StockBalance.item_id,
+            StockBalance.batch_id,
+            StockBalance.base_unit,
+            StockBalance.quantity,
+        )
+    }
+    drift = []
+    for key in sorted(expected.keys() | actual.keys(), key=str):
+        want, got = expected.get(key, 0.0), actual.get(key, 0.0)
+        if abs(want - got) > tolerance:
+            item_id, batch_id, base_unit = key
+            drift.append(
+                {
+                    "item_id": item_id,
+                    "batch_id": batch_id,
+                    "base_unit": base_unit,
+                    "ledger": want,
+                    "stock_balance": got,
+                }
+            )
+    if drift:
+        logger.warning(f"stock_balance drifted from the ledger on {len(drift)} keys")
+    return drift
@@ -4,23 +4,37 @@ Handles receiving and adjustment of stock entries and underlying batches.
 """
 
 import logging
+from collections import defaultdict
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import and_
+from sqlalchemy import and_, case, select, tuple_, update
 from sqlalchemy.orm import Session
 from app.db.models.uom import UOM
 from app.core.exceptions import AppException
+from app.db.bulk import bulk_insert
 from app.db.models.stock_entry import StockEntry
 from app.db.models.batch import Batch
 from app.db.models.item import Item
-from app.db.schemas.stock_entry import StockEntryCreate, StockEntryUpdate
-from app.services.inventory_txn import create_inventory_txn
+from app.db.pagination import CountMode, Page, paginate
+from app.db.schemas.stock_entry import (
+    StockEntryBulkResult,
+    StockEntryCreate,
+    StockEntryRead,
+    StockEntryUpdate,
+)
+from app.services.inventory_txn import create_inventory_txn, create_inventory_txns
 from app.db.schemas.inventory_txn import InventoryTxnCreate
 from app.services.item_conversion_map import get_conversion_factor
+from app.services.loaders import loaders_for
+from app.services.pnl_summary import batch_pnl_keys, refresh_pnl_keys
+from app.services.sync import record_deletion
 
 logger = logging.getLogger(__name__)
 
+# receipts accepted by one bulk request
+MAX_BULK_ENTRIES = 5000
+
 
 def create_stock_entry(
     db: Session, entry: StockEntryCreate, created_by: Optional[int] = None
@@ -117,6 +131,161 @@ def create_stock_entry(
     return stock
 
 
+def create_stock_entries_bulk(
+    db: Session, entries: List[StockEntryCreate], created_by: Optional[int] = None
+) -> List[StockEntryBulkResult]:
+    """
+    Receive many stock entries in one transaction.
+
+    Receipts are grouped into batches as in `create_stock_entry`: into the
+    batch of the same item received on the same date, or a new one. All
+    batches are looked up in one query; missing ones are inserted with one
+    multi-row INSERT and existing ones topped up with one UPDATE. Stock
+    entries and their inventory txns are then inserted set-wise and the
+    whole receipt is committed once. Receipts for unknown items or in a
+    unit that does not convert to their batch's unit are reported and
+    skipped; the others are still saved.
+
+    Args:
+        db (Session): Database session.
+        entries (List[StockEntryCreate]): Receipts, in request order.
+        created_by (Optional[int]): Creator ID.
+
+    Returns:
+        List[StockEntryBulkResult]: One result per receipt, in request order.
+
+    Raises:
+        AppException: If more than MAX_BULK_ENTRIES receipts are sent (400).
+    """
+    if len(entries) > MAX_BULK_ENTRIES:
+        msg = f"At most {MAX_BULK_ENTRIES} stock entries per request, got {len(entries)}"
+        logger.error(msg)
+        raise AppException(msg, status_code=400)
+    logger.info(f"Creating {len(entries)} stock entries in bulk")
+    results = [StockEntryBulkResult(index=i) for i in range(len(entries))]
+
+    try:
+        known_items = set(
+            db.scalars(select(Item.id).where(Item.id.in_({e.item_id for e in entries})))
+        )
+        pairs = {(e.item_id, e.received_date) for e in entries if e.item_id in known_items}
+        # (item_id, received date) -> (batch id, unit); the oldest batch wins
+        batches: Dict[Tuple[int, date], Tuple[int, str]] = {}
+        if pairs:
+            for batch_id, item_id, received_at, unit in db.execute(
+                select(Batch.id, Batch.item_id, Batch.received_at, Batch.unit)
+                .where(tuple_(Batch.item_id, Batch.received_at).in_(pairs))
+                .order_by(Batch.id)
+            ):
+                batches.setdefault((item_id, received_at), (batch_id, unit))
+
+        # pairs without a batch -> unit of their first receipt
+        new_batches: Dict[Tuple[int, date], str] = {}
+        accepted = []
+        for i, e in enumerate(entries):
+            if e.item_id not in known_items:
+                results[i].error = f"Item {e.item_id} not found"
+                continue
+            pair = (e.item_id, e.received_date)
+            unit = batches[pair][1] if pair in batches else new_batches.setdefault(pair, e.unit)
+            try:
+                factor = get_conversion_factor(db, e.item_id, e.unit, unit)
+            except AppException as exc:
+                results[i].error = exc.message
+                continue
+            accepted.append((i, e, pair, factor))
+        if not accepted:
+            return results
+
+        added: Dict[Tuple[int, date], float] = defaultdict(float)
+        for _, e, pair, _ in accepted:
+            added[pair] += e.quantity
+        now = datetime.utcnow()
+
+        topped_up = {batches[p][0]: qty for p, qty in added.items() if p in batches}
+        if topped_up:
+            db.execute(
+                update(Batch)
+                .where(Batch.id.in_(topped_up))
+                .values(
+                    quantity=Batch.quantity + case(topped_up, value=Batch.id),
+                    updated_by=created_by,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        if new_batches:
+            new_ids = bulk_insert(
+                db,
+                Batch,
+                [
+                    {
+                        "item_id": item_id,
+                        "quantity": added[(item_id, received_at)],
+                        "unit": unit,
+                        "received_at": received_at,
+                        "created_by": created_by,
+                        "updated_by": created_by,
+                    }
+                    for (item_id, received_at), unit in new_batches.items()
+                ],
+                returning=True,
+                match_on=("item_id", "received_at"),
+            )
+            batches.update(
+                (pair, (batch_id, unit))
+                for (pair, unit), batch_id in zip(new_batches.items(), new_ids)
+            )
+
+        stock_ids = bulk_insert(
+            db,
+            StockEntry,
+            [
+                {
+                    **e.dict(),
+                    "batch_id": batches[pair][0],
+                    "created_by": created_by,
+                    "updated_by": created_by,
+                }
+                for _, e, pair, _ in accepted
+            ],
+            returning=True,
+            match_on=(*StockEntryCreate.model_fields, "batch_id"),
+        )
+
+        ledger = [
+            {
+                "item_id": e.item_id,
+                "batch_id": batches[pair][0],
+                "txn_type": "IN",
+                "raw_qty": e.quantity,
+                "raw_unit": e.unit,
+                "base_qty": e.quantity * factor,
+                "base_unit": batches[pair][1],
+                "ref_type": "stock_entry",
+                "ref_id": stock_id,
+                "remarks": "Stock received",
+                "created_at": now,
+            }
+            for (_, e, pair, factor), stock_id in zip(accepted, stock_ids)
+        ]
+        create_inventory_txns(db, ledger)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    for (i, _, pair, _), stock_id in zip(accepted, stock_ids):
+        results[i].stock_entry_id = stock_id
+        results[i].batch_id = batches[pair][0]
+        results[i].new_batch = pair in new_batches
+    logger.info(
+        f"Created {len(accepted)} stock entries ({len(new_batches)} new batches), "
+        f"rejected {len(entries) - len(accepted)}"
+    )
+    return results
+
+
 def get_stock_entry(db: Session, stock_entry_id: int) -> Optional[StockEntry]:
     """
     Retrieve a stock entry by ID.
@@ -133,25 +302,30 @@ def get_stock_entry(db: Session, stock_entry_id: int) -> Optional[StockEntry]:
 
 
 def get_all_stock_entries(
-    db: Session, date: Optional[date] = None, skip: int = 0, limit: int = 100
-) -> List[StockEntry]:
+    db: Session,
+    date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve stock entries with optional date filter.
+    Retrieve a page of stock entries with optional date filter, newest first.
 
     Args:
         db (Session): Database session.
         date (Optional[date]): Filter by date received.
-        skip (int): Records to skip.
+        cursor (Optional[str]): Cursor of the previous page.
         limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all matching entries.
 
     Returns:
-        List[StockEntry]: List of entries.
+        Page: Stock entries and the next cursor.
     """
-    logger.debug(f"Fetching stock entries date={date}, skip={skip}, limit={limit}")
-    q = db.query(StockEntry)
+    logger.debug(f"Fetching stock entries date={date}, cursor={cursor}, limit={limit}")
+    q = db.query(StockEntry).options(*loaders_for(StockEntryRead))
     if date:
         q = q.filter(StockEntry.received_date == date)
-    return q.offset(skip).limit(limit).all()
+    return paginate(q, (StockEntry.created_at, StockEntry.id), cursor, limit, count)
 
 
 def update_stock_entry(
@@ -251,7 +425,10 @@ def delete_stock_entry(db: Session, stock_entry_id: int) -> bool:
         batch.updated_at = datetime.utcnow()
         batch.updated_by = entry.updated_by
     db.delete(entry)
+    record_deletion(db, StockEntry, stock_entry_id)
     db.commit()
+    # dispatches of the batch lose part of their price basis
+    refresh_pnl_keys(db, batch_pnl_keys(db, entry.batch_id))
     logger.debug(f"Stock entry id={stock_entry_id} deleted")
 
     try:
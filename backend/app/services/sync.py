@@ -0,0 +1,195 @@
+"""
+Service functions for the mobile delta sync.
+Serves rows of the core tables created, updated or deleted since a
+server-issued token. Rows are read in (updated_at, id) order and deletions
+come from sync_tombstone, which the delete services write to.
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.db.models.batch import Batch
+from app.db.models.dispatch_entry import DispatchEntry
+from app.db.models.item import Item
+from app.db.models.order import Order
+from app.db.models.stock_entry import StockEntry
+from app.db.models.sync_tombstone import SyncTombstone
+from app.db.schemas.batch import BatchRead
+from app.db.schemas.dispatch_entry import DispatchEntryRead
+from app.db.schemas.item import ItemRead
+from app.db.schemas.order import OrderRead
+from app.db.schemas.stock_entry import StockEntryRead
+from app.services.loaders import loaders_for
+
+logger = logging.getLogger(__name__)
+
+Position = Tuple[datetime, int]
+
+# response key -> (model, loader options for the nested read schemas)
+SYNCED_TABLES = {
+    "items": (Item, [selectinload(Item.default_uom)]),
+    "batches": (Batch, loaders_for(BatchRead)),
+    "orders": (Order, loaders_for(OrderRead)),
+    "dispatch_entries": (DispatchEntry, loaders_for(DispatchEntryRead)),
+    "stock_entries": (StockEntry, loaders_for(StockEntryRead)),
+}
+TABLE_KEYS = {model.__tablename__: key for key, (model, _) in SYNCED_TABLES.items()}
+DELETED = "deleted"
+
+# once caught up, the next sync rescans this far back so rows committed
+# late (updated_at is set before commit) are not missed; clients upsert
+# by id, so re-sent rows are harmless
+SYNC_OVERLAP = timedelta(minutes=5)
+
+
+def encode_token(positions: Dict[str, Position]) -> str:
+    raw = json.dumps({key: [ts.isoformat(), row_id] for key, (ts, row_id) in positions.items()})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_token(token: str) -> Dict[str, Position]:
+    """
+    Decode a token produced by `encode_token`.
+
+    Raises:
+        AppException: If the token is malformed (400) or older than the
+            tombstone retention, so deletions may have been missed (410).
+    """
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        positions = {
+            key: (datetime.fromisoformat(ts), int(row_id))
+            for key, (ts, row_id) in raw.items()
+        }
+    except (ValueError, TypeError, AttributeError):
+        logger.error(f"Invalid sync token {token!r}")
+        raise AppException("Invalid sync token", status_code=400)
+    deleted = positions.get(DELETED)
+    retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    if deleted is None or deleted[0] < datetime.utcnow() - retention:
+        logger.warning("Expired sync token; client must resync from scratch")
+        raise AppException("Sync token expired; sync without a token", status_code=410)
+    return positions
+
+
+def record_deletion(db: Session, model, record_id: int) -> None:
+    """
+    Write a tombstone for a deleted row; commit with the delete itself.
+    """
+    db.add(SyncTombstone(table_name=model.__tablename__, record_id=record_id))
+
+
+def _read_rows(db: Session, key: str, after: Optional[Position], limit: int):
+    model, options = SYNCED_TABLES[key]
+    stmt = select(model).options(*options)
+    if after:
+        stmt = stmt.where(tuple_(model.updated_at, model.id) > tuple_(*after))
+    stmt = stmt.order_by(model.updated_at, model.id).limit(limit + 1)
+    return db.scalars(stmt).all()
+
+
+def _read_tombstones(db: Session, after: Optional[Position], limit: int):
+    stmt = select(SyncTombstone).where(SyncTombstone.table_name.in_(TABLE_KEYS))
+    if after:
+        stmt = stmt.where(
+            tuple_(SyncTombstone.deleted_at, SyncTombstone.id) > tuple_(*after)
+        )
+    stmt = stmt.order_by(SyncTombstone.deleted_at, SyncTombstone.id).limit(limit + 1)
+    return db.scalars(stmt).all()
+
+
+def get_changes(db: Session, since: Optional[str] = None, limit: int = 500) -> Dict:
+    """
+    Collect the rows changed since a sync token.
+
+    Without a token every row is returned (as created) across as many calls
+    as `has_more` asks for. Clients should apply created/updated rows before
+    deletions and keep the returned token for the next sync.
+
+    Args:
+        db (Session): Database session.
+        since (Optional[str]): Token from the previous sync, or None.
+        limit (int): Max rows per table (and tombstones) per call.
+
+    Returns:
+        Dict: token, has_more and per-table created/updated/deleted.
+
+    Raises:
+        AppException: If the token is invalid (400) or expired (410).
+    """
+    positions = decode_token(since) if since else {}
+    caught_up = (datetime.utcnow() - SYNC_OVERLAP, 0)
+    result = {"has_more": False}
+    next_positions: Dict[str, Position] = {}
+
+    for key in SYNCED_TABLES:
+        after = positions.get(key)
+        rows = _read_rows(db, key, after, limit)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_positions[key] = (rows[-1].updated_at, rows[-1].id)
+            result["has_more"] = True
+        else:
+            next_positions[key] = caught_up
+        changes = {"created": [], "updated": [], "deleted": []}
+        for row in rows:
+            is_new = after is None or row.created_at is None or row.created_at > after[0]
+            changes["created" if is_new else "updated"].append(
+                _item_read(row) if key == "items" else row
+            )
+        result[key] = changes
+
+    after = positions.get(DELETED)
+    tombstones = _read_tombstones(db, after, limit) if since else []
+    if len(tombstones) > limit:
+        tombstones = tombstones[:limit]
+        next_positions[DELETED] = (tombstones[-1].deleted_at, tombstones[-1].id)
+        result["has_more"] = True
+    else:
+        next_positions[DELETED] = caught_up
+    for tombstone in tombstones:
+        result[TABLE_KEYS[tombstone.table_name]]["deleted"].append(tombstone.record_id)
+
+    result["token"] = encode_token(next_positions)
+    logger.debug(
+        f"Sync since={since is not None}: "
+        + ", ".join(
+            f"{key}={len(result[key]['created']) + len(result[key]['updated'])}"
+            for key in SYNCED_TABLES
+        )
+        + f", deleted={len(tombstones)}"
+    )
+    return result
+
+
+def _item_read(item: Item) -> ItemRead:
+    item_data = ItemRead.from_orm(item)
+    item_data.default_unit = item.default_uom.code if item.default_uom else None
+    return item_data
+
+
+def prune_tombstones(db: Session) -> int:
+    """
+    Delete tombstones past SYNC_TOMBSTONE_RETENTION_DAYS.
+
+    Args:
+        db (Session): Database session.
+
+    Returns:
+        int: Tombstones deleted.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    deleted = db.execute(
+        delete(SyncTombstone).where(SyncTombstone.deleted_at < cutoff)
+    ).rowcount
+    db.commit()
+    logger.info(f"Pruned {deleted} sync tombstones older than {cutoff}")
+    return deleted
@@ -1,6 +1,10 @@
+from typing import Optional
+
 from sqlalchemy.orm import Session
 from app.db.models.uom import UOM
+from app.db.pagination import CountMode, Page, paginate
 from app.db.schemas.uom import UOMCreate, UOMRead
+from app.services.item_index import item_index
 
 
 def create_uom(db: Session, data: UOMCreate) -> UOM:
@@ -8,8 +12,14 @@ def create_uom(db: Session, data: UOMCreate) -> UOM:
     db.add(u)
     db.commit()
     db.refresh(u)
+    item_index.invalidate()
     return u
 
 
-def list_uoms(db: Session) -> list[UOM]:
-    return db.query(UOM).all()
+def list_uoms(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
+    return paginate(db.query(UOM), (UOM.created_at, UOM.id), cursor, limit, count)
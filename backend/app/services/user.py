@@ -5,12 +5,13 @@ Handles retrieval, update, and deletion of user records.
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import AppException
 from app.db.models.user import User
+from app.db.pagination import CountMode, Page, paginate
 from app.db.schemas.user import UserUpdate
 
 logger = logging.getLogger(__name__)
@@ -31,20 +32,26 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 
-def get_all_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
+def get_all_users(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    count: Optional[CountMode] = None,
+) -> Page:
     """
-    Retrieve all users with pagination.
+    Retrieve a page of users, newest first.
 
     Args:
         db (Session): Database session.
-        skip (int): Records to skip.
+        cursor (Optional[str]): Cursor of the previous page.
         limit (int): Max records to return.
+        count (Optional[CountMode]): Also count all users.
 
     Returns:
-        List[User]: List of users.
+        Page: Users and the next cursor.
     """
-    logger.debug(f"Fetching users skip={skip}, limit={limit}")
-    return db.query(User).offset(skip).limit(limit).all()
+    logger.debug(f"Fetching users cursor={cursor}, limit={limit}")
+    return paginate(db.query(User), (User.created_at, User.id), cursor, limit, count)
 
 
 def update_user(
@@ -0,0 +1,96 @@
+"""
+Parsed invoice PDF shared by format detection and the vendor parsers.
+The file is opened once and page text/tables are extracted lazily and cached,
+so detection and extraction never parse the same page twice. Iterating the
+pages releases each one once extracted, so a pass over a long invoice holds
+one parsed page at a time.
+"""
+
+import logging
+from typing import Dict, Iterator, List, Optional
+
+import pdfplumber
+
+from app.core.exceptions import AppException
+
+logger = logging.getLogger(__name__)
+
+
+class InvoiceDocument:
+    """
+    A pdfplumber document opened once per upload.
+
+    Use as a context manager; the underlying file is closed on exit.
+    """
+
+    def __init__(self, input_file: str):
+        self.input_file = input_file
+        try:
+            self._pdf = pdfplumber.open(input_file)
+        except Exception as e:
+            logger.exception(f"Failed to open PDF {input_file}")
+            raise AppException(f"Error reading PDF: {e}", status_code=500)
+        self._text: Dict[int, str] = {}
+        self._tables: Dict[int, Optional[List[List[Optional[str]]]]] = {}
+
+    def __enter__(self) -> "InvoiceDocument":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pdf.close()
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf.pages)
+
+    def page_text(self, index: int) -> str:
+        """
+        Text of a page (0-based), extracted on first access.
+        """
+        if index not in self._text:
+            self._text[index] = self._pdf.pages[index].extract_text() or ""
+        return self._text[index]
+
+    def page_table(self, index: int) -> Optional[List[List[Optional[str]]]]:
+        """
+        Largest table of a page (0-based), extracted on first access.
+        """
+        if index not in self._tables:
+            self._tables[index] = self._pdf.pages[index].extract_table()
+        return self._tables[index]
+
+    def release_page(self, index: int) -> None:
+        """
+        Drop the parsed objects pdfplumber caches on a page (characters,
+        lines, layout and text map), which otherwise stay alive for the
+        whole document. Extracted text and tables are plain data and kept.
+        """
+        self._pdf.pages[index].close()
+
+    def iter_text(self) -> Iterator[str]:
+        """
+        Text of every page in order, each page released once extracted.
+        """
+        for index in range(self.page_count):
+            if index in self._text:
+                text = self._text.pop(index)
+            else:
+                text = self._pdf.pages[index].extract_text() or ""
+            self.release_page(index)
+            yield text
+
+    def iter_tables(self) -> Iterator[Optional[List[List[Optional[str]]]]]:
+        """
+        Largest table of every page in order, each page released once
+        extracted.
+        """
+        for index in range(self.page_count):
+            if index in self._tables:
+                table = self._tables.pop(index)
+            else:
+                table = self._pdf.pages[index].extract_table()
+            self.release_page(index)
+            yield table
@@ -0,0 +1,174 @@
+"""
+Content-addressed cache of parsed invoice tables.
+Entries are Parquet files keyed by the PDF's SHA-256 and the parser version,
+so re-uploading a file skips pdfplumber entirely. The directory is kept under
+a size limit by evicting least recently used entries.
+"""
+
+import logging
+import os
+import tempfile
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".parquet"
+
+
+def _enabled() -> bool:
+    return settings.INVOICE_PARSE_CACHE_MAX_MB > 0
+
+
+def _entry_path(file_hash: str) -> str:
+    # imported here: the parser module pulls in pandas and pdfplumber
+    from app.utils.invoice_parser import PARSER_VERSION
+
+    return os.path.join(
+        settings.INVOICE_PARSE_CACHE_DIR, f"{file_hash}-v{PARSER_VERSION}{_SUFFIX}"
+    )
+
+
+def _entries() -> List[Tuple[float, int, str]]:
+    """
+    (mtime, size, path) of every cache entry; other workers may delete
+    entries concurrently, so vanished files are skipped.
+    """
+    entries = []
+    try:
+        with os.scandir(settings.INVOICE_PARSE_CACHE_DIR) as it:
+            for e in it:
+                if not e.name.endswith(_SUFFIX):
+                    continue
+                try:
+                    st = e.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def load_parse_result(
+    file_hash: str,
+) -> Optional[Tuple["pd.DataFrame", datetime, str]]:
+    """
+    Return the cached (table, invoice_date, mart_name) for a file, if any.
+
+    Args:
+        file_hash (str): SHA-256 of the PDF bytes.
+
+    Returns:
+        Optional[Tuple[pd.DataFrame, datetime, str]]: Cached parse result or None.
+    """
+    if not _enabled():
+        return None
+    import pyarrow.parquet as pq
+
+    path = _entry_path(file_hash)
+    try:
+        table = pq.read_table(path)
+        os.utime(path)  # mark as recently used
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.exception(f"Discarding unreadable parse cache entry {path}")
+        _remove(path)
+        return None
+
+    meta = table.schema.metadata or {}
+    invoice_date = datetime.fromisoformat(meta[b"invoice_date"].decode())
+    mart_name = meta[b"mart_name"].decode()
+    logger.debug(f"Parse cache hit for {file_hash}")
+    return table.to_pandas(), invoice_date, mart_name
+
+
+def store_parse_result(
+    file_hash: str, df: "pd.DataFrame", invoice_date: datetime, mart_name: str
+) -> None:
+    """
+    Cache a parse result, then evict old entries if over the size limit.
+
+    Args:
+        file_hash (str): SHA-256 of the PDF bytes.
+        df (pd.DataFrame): Cleaned invoice table.
+        invoice_date (datetime): Invoice date.
+        mart_name (str): Store name.
+    """
+    if not _enabled():
+        return
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tmp_path = None
+    try:
+        table = pa.Table.from_pandas(df)
+        meta = dict(table.schema.metadata or {})
+        meta[b"invoice_date"] = invoice_date.isoformat().encode()
+        meta[b"mart_name"] = mart_name.encode()
+        table = table.replace_schema_metadata(meta)
+
+        os.makedirs(settings.INVOICE_PARSE_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=settings.INVOICE_PARSE_CACHE_DIR)
+        os.close(fd)
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, _entry_path(file_hash))
+        logger.debug(f"Cached parse result for {file_hash}")
+    except Exception:
+        # the cache is an optimisation; never fail an upload because of it
+        logger.exception("Failed to cache parse result")
+        if tmp_path:
+            _remove(tmp_path)
+        return
+    _evict()
+
+
+def _evict() -> None:
+    limit = settings.INVOICE_PARSE_CACHE_MAX_MB * 1024 * 1024
+    entries = _entries()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        _remove(path)
+        total -= size
+        logger.debug(f"Evicted parse cache entry {path}")
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def get_parse_cache_stats() -> Dict[str, int]:
+    """
+    Number of cached entries and their total size in bytes.
+    """
+    entries = _entries()
+    return {
+        "entries": len(entries),
+        "size_bytes": sum(size for _, size, _ in entries),
+        "max_bytes": settings.INVOICE_PARSE_CACHE_MAX_MB * 1024 * 1024,
+    }
+
+
+def purge_parse_cache() -> int:
+    """
+    Delete every cached entry.
+
+    Returns:
+        int: Number of entries removed.
+    """
+    entries = _entries()
+    for _, _, path in entries:
+        _remove(path)
+    logger.info(f"Purged {len(entries)} parse cache entries")
+    return len(entries)
@@ -0,0 +1,114 @@
+"""
+Bounded process pool for invoice PDF parsing.
+Runs the pdfplumber/pandas pipeline outside the event loop so uploads
+do not block other requests served by the same worker.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+from app.core.instrumentation import collect_parse_stages, record_parse_stages
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: Optional[ProcessPoolExecutor] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Lazily create the parse pool. Returns None when pooling is disabled.
+    """
+    global _executor
+    if settings.INVOICE_PARSE_WORKERS <= 0:
+        return None
+    if _executor is None:
+        logger.info(
+            f"Starting invoice parse pool with {settings.INVOICE_PARSE_WORKERS} worker(s)"
+        )
+        # spawn avoids forking a multi-threaded server process
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.INVOICE_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _get_slots() -> asyncio.Semaphore:
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(max(1, settings.INVOICE_PARSE_QUEUE_DEPTH))
+    return _slots
+
+
+def _run_timed(fn: Callable[..., T], *args: Any) -> Tuple[T, List[Tuple[str, float]]]:
+    """
+    `fn(*args)` returning its parse stage timings too; runs in the worker,
+    whose own metrics are never scraped.
+    """
+    with collect_parse_stages() as timings:
+        result = fn(*args)
+    return result, timings
+
+
+def _process_pdf(input_file: str):
+    # the parser pulls in pandas and pdfplumber; import it on first parse
+    from app.utils.invoice_parser import process_pdf
+
+    return process_pdf(input_file)
+
+
+async def run_in_parse_pool(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run `fn(*args)` in the pool, waiting for a free queue slot first.
+    `fn` must be a module-level function so the workers can import it.
+
+    Returns:
+        T: Whatever `fn` returns.
+
+    Raises:
+        Exception: Propagated from `fn` running in the worker.
+    """
+    loop = asyncio.get_running_loop()
+    async with _get_slots():
+        logger.debug(f"Submitting {fn.__name__} to parse pool")
+        result, timings = await loop.run_in_executor(_get_executor(), _run_timed, fn, *args)
+    record_parse_stages(timings)
+    return result
+
+
+async def parse_invoice_pdf(input_file: str) -> Tuple["pd.DataFrame", datetime, str]:
+    """
+    Parse an invoice PDF in the pool, waiting for a free queue slot first.
+
+    Args:
+        input_file (str): Path to the saved PDF.
+
+    Returns:
+        Tuple[pd.DataFrame, datetime, str]: Same result as `process_pdf`.
+
+    Raises:
+        AppException: Propagated from the parser running in the worker.
+    """
+    return await run_in_parse_pool(_process_pdf, input_file)
+
+
+def shutdown_parse_pool() -> None:
+    """
+    Stop the parse pool workers. Called on application shutdown.
+    """
+    global _executor
+    if _executor is not None:
+        logger.info("Shutting down invoice parse pool")
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
@@ -6,18 +6,20 @@ Handles extraction, normalization, and cleaning of invoice tables.
 import logging
 import re
 from datetime import datetime
-from typing import Tuple
+from typing import Iterator, Tuple
 
 import pandas as pd
-import pdfplumber
 
 from app.core.exceptions import AppException
+from app.core.instrumentation import parse_stage
+from app.utils.invoice_document import InvoiceDocument
 from app.utils.invoice_parser_reliance import (
     clean_and_rename,
     extract_raw_table,
     find_store_and_date,
     normalize_rows,
     process_pdf_reliance,
+    stream_pdf_reliance,
 )
 from app.utils.invoice_parser_blinkit import (
     process_pdf_blinkit,
@@ -25,13 +27,16 @@ from app.utils.invoice_parser_blinkit import (
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parser output changes so cached parse results are not reused.
+PARSER_VERSION = "2"
 
-def detect_invoice_format(input_file: str) -> str:
+
+def detect_invoice_format(doc: InvoiceDocument) -> str:
     """
     Detects the invoice format based on the content of the first page.
 
     Args:
-        input_file (str): Path to the PDF file.
+        doc (InvoiceDocument): Opened invoice PDF.
 
     Returns:
         str: Invoice format identifier (e.g., "seller_a", "seller_b").
@@ -39,16 +44,15 @@ def detect_invoice_format(input_file: str) -> str:
     Raises:
         AppException: If the invoice format is unknown or cannot be determined.
     """
-    logger.info(f"Detecting invoice format for {input_file}")
-    with pdfplumber.open(input_file) as pdf:
-        first_page_text = pdf.pages[0].extract_text()
-        if "Zomato" in first_page_text:
-            logger.info("Detected format: Seller A")
-            return "Zomato"
-        elif "Reliance" in first_page_text:
-            logger.info("Detected format: Seller B")
-            return "Reliance"
-        # Add more rules as needed
+    logger.info(f"Detecting invoice format for {doc.input_file}")
+    first_page_text = doc.page_text(0)
+    if "Zomato" in first_page_text:
+        logger.info("Detected format: Seller A")
+        return "Zomato"
+    elif "Reliance" in first_page_text:
+        logger.info("Detected format: Seller B")
+        return "Reliance"
+    # Add more rules as needed
     logger.error("Unknown invoice format")
     raise AppException("Unknown invoice format", status_code=400)
 
@@ -56,12 +60,34 @@ def detect_invoice_format(input_file: str) -> str:
 def process_pdf(input_file: str) -> Tuple[pd.DataFrame, datetime, str]:
     """
     Full pipeline: extract, normalize, clean, and return invoice table.
+
+    The PDF is opened once and shared between detection and extraction.
     """
     logger.info(f"✅✅Processing PDF: {input_file}")
-    fmt = detect_invoice_format(input_file)
-    if fmt == "Reliance":
-        return process_pdf_reliance(input_file)
-    elif fmt == "Zomato":
-        return process_pdf_blinkit(input_file)
-    else:
-        raise AppException("Unsupported invoice format", status_code=400)
+    with InvoiceDocument(input_file) as doc:
+        with parse_stage("detect"):
+            fmt = detect_invoice_format(doc)
+        if fmt == "Reliance":
+            return process_pdf_reliance(doc)
+        elif fmt == "Zomato":
+            return process_pdf_blinkit(doc)
+        else:
+            raise AppException("Unsupported invoice format", status_code=400)
+
+
+def stream_pdf(input_file: str) -> Iterator[Tuple[pd.DataFrame, datetime, str]]:
+    """
+    Page-by-page variant of `process_pdf` for invoices too long to hold as
+    one table: yields (page_items, invoice_date, store) per page. Formats
+    without a streaming parser yield their whole table once.
+    """
+    logger.info(f"Streaming PDF: {input_file}")
+    with InvoiceDocument(input_file) as doc:
+        with parse_stage("detect"):
+            fmt = detect_invoice_format(doc)
+        if fmt == "Reliance":
+            yield from stream_pdf_reliance(doc)
+        elif fmt == "Zomato":
+            yield process_pdf_blinkit(doc)
+        else:
+            raise AppException("Unsupported invoice format", status_code=400)
@@ -3,29 +3,26 @@ from datetime import datetime
 from typing import Tuple
 import re
 import pandas as pd
-import pdfplumber
 
 from app.core.exceptions import AppException
+from app.core.instrumentation import parse_stage
+from app.utils.invoice_document import InvoiceDocument
 
 logger = logging.getLogger(__name__)
 
 
-def extract_raw_text_lines(input_file: str) -> list:
+def extract_raw_text_lines(doc: InvoiceDocument) -> list:
     """
     Extracts all text lines from all pages of the PDF.
     """
-    logger.info(f"Extracting raw text from {input_file}")
+    logger.info(f"Extracting raw text from {doc.input_file}")
     lines = []
     try:
-        with pdfplumber.open(input_file) as pdf:
-            for page_number, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text()
-                if text:
-                    page_lines = text.split("\n")
-                    lines.extend(page_lines)
-                    logger.debug(
-                        f"Page {page_number}: extracted {len(page_lines)} lines"
-                    )
+        for page_number, text in enumerate(doc.iter_text(), start=1):
+            if text:
+                page_lines = text.split("\n")
+                lines.extend(page_lines)
+                logger.debug(f"Page {page_number}: extracted {len(page_lines)} lines")
     except Exception as e:
         logger.exception("Failed to extract raw text")
         raise AppException(f"Error reading PDF: {e}", status_code=500)
@@ -91,13 +88,15 @@ def clean_and_rename(
     raise NotImplementedError("Blinkit cleaning/renaming not implemented.")
 
 
-def process_pdf_blinkit(input_file: str) -> Tuple[pd.DataFrame, datetime, str]:
-    logger.info(f"Processing Blinkit PDF: {input_file}")
-    lines = extract_raw_text_lines(input_file)
-
-    # Now, pass these lines to your new parsing functions:
-    store, invoice_date = find_store_and_date_from_lines(lines)
-    rows = normalize_rows_from_lines(lines)
-    clean_df = clean_and_rename(rows, store, invoice_date)
+def process_pdf_blinkit(doc: InvoiceDocument) -> Tuple[pd.DataFrame, datetime, str]:
+    logger.info(f"Processing Blinkit PDF: {doc.input_file}")
+    with parse_stage("extract"):
+        lines = extract_raw_text_lines(doc)
+        # Now, pass these lines to your new parsing functions:
+        store, invoice_date = find_store_and_date_from_lines(lines)
+    with parse_stage("normalize"):
+        rows = normalize_rows_from_lines(lines)
+    with parse_stage("clean"):
+        clean_df = clean_and_rename(rows, store, invoice_date)
     logger.info(f"Processed Blinkit PDF for store {store} on {invoice_date.date()}")
     return clean_df, invoice_date, store
@@ -1,38 +1,43 @@
 import logging
 import re
 from datetime import datetime
-from typing import Tuple
+from typing import Iterator, Tuple
 
 import pandas as pd
-import pdfplumber
 
 from app.core.exceptions import AppException
+from app.core.instrumentation import parse_stage
+from app.utils.invoice_document import InvoiceDocument
 
 logger = logging.getLogger(__name__)
 
+# item table columns left after dropping Sr.No, MRP, Disc and Tax
+ITEM_COLUMNS = ["HSN_CODE", "ITEM_CODE", "Item", "Quantity", "UOM", "Price", "Total"]
+NUMERIC_COLUMNS = ("Quantity", "Price", "Total")
+# batch date and code printed under the description
+_ITEM_DATE_SUFFIX = re.compile(r"\n\d{2}\.\d{2}\.\d{4}\n\w{4}$")
 
-def extract_raw_table(input_file: str) -> pd.DataFrame:
+
+def extract_raw_table(doc: InvoiceDocument) -> pd.DataFrame:
     """
     Extracts all table rows from every page of a PDF.
 
     Args:
-        input_file (str): Path to the PDF file.
+        doc (InvoiceDocument): Opened invoice PDF.
 
     Returns:
         pd.DataFrame: Raw rows as a DataFrame.
 
     Raises:
-        AppException: If the PDF cannot be opened or parsed.
+        AppException: If the PDF cannot be parsed.
     """
-    logger.info(f"Extracting raw table from {input_file}")
+    logger.info(f"Extracting raw table from {doc.input_file}")
     rows = []
     try:
-        with pdfplumber.open(input_file) as pdf:
-            for page_number, page in enumerate(pdf.pages, start=1):
-                tbl = page.extract_table()
-                if tbl:
-                    rows.extend(tbl)
-                    logger.debug(f"Page {page_number}: extracted {len(tbl)} rows")
+        for page_number, tbl in enumerate(doc.iter_tables(), start=1):
+            if tbl:
+                rows.extend(tbl)
+                logger.debug(f"Page {page_number}: extracted {len(tbl)} rows")
     except Exception as e:
         logger.exception("Failed to extract raw table")
         raise AppException(f"Error reading PDF: {e}", status_code=500)
@@ -53,16 +58,13 @@ def find_store_and_date(df: pd.DataFrame) -> Tuple[str, datetime]:
         AppException: If store or date cannot be found or parsed.
     """
     logger.info("Finding store name and invoice date")
-    # find store
-    for idx, row in df.iterrows():
-        if "Site Name" in row.values:
-            col = row[row == "Site Name"].index[0]
-            store = df.iat[idx + 1, col].strip().replace(" ", "_")
-            logger.debug(f"Found store: {store}")
-            break
-    else:
+    # first "Site Name" cell in row-major order; the store is the cell below
+    rows, cols = (df.to_numpy() == "Site Name").nonzero()
+    if not len(rows):
         logger.error("Site Name not found in PDF")
         raise AppException("Could not locate 'Site Name' in invoice", status_code=500)
+    store = df.iat[rows[0] + 1, cols[0]].strip().replace(" ", "_")
+    logger.debug(f"Found store: {store}")
 
     # find date
     try:
@@ -83,17 +85,20 @@ def normalize_rows(df: pd.DataFrame) -> pd.DataFrame:
     Removes any trailing summary/total rows if needed.
     """
     logger.info("Normalizing rows")
-    # Start from row 4 (index 3)
-    working = df.iloc[8:].copy()  # drop top metadataAdd commentMore actions
-    # retain header row once
-    first = working[0].tolist().index("Sr.No")
-    header = working.iloc[first : first + 1]
-    body = working[working[0] != "Sr.No"]
-    working = pd.concat([header, body]).reset_index(drop=True)
+    working = df.iloc[8:]  # drop top metadata
+    # retain the first header row, ahead of everything else
+    is_header = working[0].eq("Sr.No").to_numpy()
+    if not is_header.any():
+        logger.error("Item table header not found in PDF")
+        raise AppException("Could not locate 'Sr.No' header in invoice", status_code=500)
+    first = is_header.argmax()
+    working = pd.concat(
+        [working.iloc[first : first + 1], working[~is_header]], ignore_index=True
+    )
     # drop trailing grand total
-    if "Grand Total of Qty" in working[0].values:
-        end = working[working[0] == "Grand Total of Qty"].index[0]
-        working = working.iloc[:end]
+    is_total = working[0].eq("Grand Total of Qty").to_numpy()
+    if is_total.any():
+        working = working.iloc[: is_total.argmax()]
     logger.debug(f"Normalized to {len(working)} rows")
     return working
 
@@ -113,52 +118,114 @@ def clean_and_rename(
         pd.DataFrame: Cleaned DataFrame with proper types.
     """
     logger.info("Cleaning and renaming DataFrame")
-    df["StoreName"] = store
-    df["Date"] = invoice_date
+    # the first row is the header kept by normalize_rows
+    return clean_item_rows(df.iloc[1:], store, invoice_date)
 
+
+def clean_item_rows(
+    rows: pd.DataFrame, store: str, invoice_date: datetime
+) -> pd.DataFrame:
+    """
+    Cleans, types, and renames raw item rows that carry no header row.
+    Shared by the whole-table and page-by-page pipelines.
+
+    Args:
+        rows (pd.DataFrame): Raw item rows.
+        store (str): Store name.
+        invoice_date (datetime): Invoice date.
+
+    Returns:
+        pd.DataFrame: Cleaned DataFrame with proper types.
+    """
     # drop unwanted columns
-    df = df.drop(columns=[0, 6, 8, 9], errors="ignore")
-    # remove header row
-    df = df.iloc[1:].copy()
-    df.columns = [
-        "HSN_CODE",
-        "ITEM_CODE",
-        "Item",
-        "Quantity",
-        "UOM",
-        "Price",
-        "Total",
-        "Date",
-        "StoreName",
-    ]
-
-    # string cleaning
-    for col in ("Total", "Quantity", "Price"):
-        df[col] = df[col].str.replace(",", "", regex=False)
-    df["Item"] = (
-        df["Item"]
-        .str.replace(r"\n\d{2}\.\d{2}\.\d{4}\n\w{4}$", "", regex=True)
-        .str.strip("._/\n")
-    )
-    df["HSN_CODE"] = df["HSN_CODE"].str.replace("\n", "", regex=False)
-    df["ITEM_CODE"] = df["ITEM_CODE"].str.split("\n").str[0]
+    raw = rows.drop(columns=[0, 6, 8, 9], errors="ignore")
+    raw.columns = ITEM_COLUMNS
+
+    # string cleaning, one column-wide operation each
+    columns = {
+        "HSN_CODE": raw["HSN_CODE"].str.replace("\n", "", regex=False),
+        # text before the first line break
+        "ITEM_CODE": raw["ITEM_CODE"].str.replace(r"\n[\s\S]*", "", regex=True),
+        "Item": raw["Item"].str.replace(_ITEM_DATE_SUFFIX, "", regex=True).str.strip("._/\n"),
+        "UOM": raw["UOM"],
+    }
 
     # type conversion
-    try:
-        df = df.astype({"Quantity": "float", "Price": "float", "Total": "float"})
-    except Exception as e:
-        logger.exception("Failed to cast numeric columns")
-        raise AppException(f"Type conversion error: {e}", status_code=500)
-
-    df = df.round({"Quantity": 2, "Price": 2, "Total": 2})
+    for col in NUMERIC_COLUMNS:
+        try:
+            values = raw[col].str.replace(",", "", regex=False).astype("float")
+        except Exception as e:
+            logger.exception(f"Failed to cast numeric column {col}")
+            raise AppException(f"Type conversion error in {col}: {e}", status_code=500)
+        columns[col] = values.round(2)
+
+    df = pd.DataFrame(columns, columns=ITEM_COLUMNS)
+    df["Date"] = invoice_date
+    df["StoreName"] = store
     logger.debug("Clean and rename complete")
     return df
 
 
-def process_pdf_reliance(input_file: str):
-    raw = extract_raw_table(input_file)
-    store, invoice_date = find_store_and_date(raw)
-    rows = normalize_rows(raw)
-    clean_df = clean_and_rename(rows, store, invoice_date)
+def stream_pdf_reliance(
+    doc: InvoiceDocument,
+) -> Iterator[Tuple[pd.DataFrame, datetime, str]]:
+    """
+    Page-by-page variant of `process_pdf_reliance` for long invoices.
+    Yields each page's cleaned item rows as soon as the page is extracted,
+    so memory is bounded by a page rather than the whole invoice. Store and
+    date are read from the first page, which carries the metadata block.
+
+    Args:
+        doc (InvoiceDocument): Opened invoice PDF.
+
+    Yields:
+        Tuple[pd.DataFrame, datetime, str]: (page_items, invoice_date, store)
+        for every page with item rows.
+
+    Raises:
+        AppException: If the PDF cannot be parsed or the first page lacks
+            the store, date or item table header.
+    """
+    logger.info(f"Streaming item rows from {doc.input_file}")
+    store = invoice_date = None
+    header_seen = False
+    for page_number, page in enumerate(_iter_raw_pages(doc), start=1):
+        if store is None:
+            store, invoice_date = find_store_and_date(page)
+            page = page.iloc[8:]  # drop top metadata
+        is_total = page[0].eq("Grand Total of Qty").to_numpy()
+        if is_total.any():
+            page = page.iloc[: is_total.argmax()]
+        is_header = page[0].eq("Sr.No").to_numpy()
+        header_seen = header_seen or is_header.any()
+        if not header_seen:
+            logger.error("Item table header not found in PDF")
+            raise AppException("Could not locate 'Sr.No' header in invoice", status_code=500)
+        items = page[~is_header]
+        if len(items):
+            logger.debug(f"Page {page_number}: {len(items)} item rows")
+            yield clean_item_rows(items, store, invoice_date), invoice_date, store
+        if is_total.any():
+            break
+
+
+def _iter_raw_pages(doc: InvoiceDocument) -> Iterator[pd.DataFrame]:
+    try:
+        for tbl in doc.iter_tables():
+            if tbl:
+                yield pd.DataFrame(tbl)
+    except Exception as e:
+        logger.exception("Failed to extract raw table")
+        raise AppException(f"Error reading PDF: {e}", status_code=500)
+
+
+def process_pdf_reliance(doc: InvoiceDocument):
+    with parse_stage("extract"):
+        raw = extract_raw_table(doc)
+        store, invoice_date = find_store_and_date(raw)
+    with parse_stage("normalize"):
+        rows = normalize_rows(raw)
+    with parse_stage("clean"):
+        clean_df = clean_and_rename(rows, store, invoice_date)
     logger.info(f"Processed Reliance PDF for store {store} on {invoice_date.date()}")
     return clean_df, invoice_date, store
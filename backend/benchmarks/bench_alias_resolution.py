@@ -0,0 +1,140 @@
+"""
+Benchmark: queries issued to map invoice lines to master items.
+
+The "per row" path reproduces the old loop in `persist_parsed_invoice`:
+Item and UOM lookups, an alias lookup, and for unmapped lines an ilike
+suggestion query plus a full UOM scan. The "bulk" path is
+`resolve_invoice_items`, measured with a cold item index (first upload
+after start-up) and a warm one. All run against an in-memory SQLite
+database seeded with the repo's UOM, item and alias seeds.
+
+Run from backend/:
+    python -m benchmarks.bench_alias_resolution --lines 200 --unmapped 0.2
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from sqlalchemy import create_engine, event, func, or_
+from sqlalchemy.orm import sessionmaker
+
+import app.db.models  # noqa: F401  (registers every table)
+from app.db.models.base_class import Base
+from app.db.models.item import Item
+from app.db.models.item_alias import ItemAlias
+from app.db.models.uom import UOM
+from app.db.seed.alias_seed import seed_aliases
+from app.db.seed.item_seed import seed_items
+from app.db.seed.uom_seed import seed_uoms
+from app.services.item_alias import resolve_invoice_items
+from app.services.item_index import item_index
+from benchmarks.synthetic_invoices import PRODUCTS
+
+
+def build_lines(count: int, unmapped_share: float, seed: int = 0):
+    rng = random.Random(seed)
+    lines = []
+    for n in range(count):
+        if rng.random() < unmapped_share:
+            lines.append((f"59990{n:04d}", f"UNLISTED APPLE {n % 13} (KG)", "KG"))
+        else:
+            lines.append(rng.choice(PRODUCTS))
+    return lines
+
+
+def resolve_per_row(db, lines):
+    item_ids, unmapped = [], []
+    for code, name, uom in lines:
+        db.query(Item).filter(func.lower(Item.name) == name.lower()).first()
+        db.query(UOM).filter(func.lower(UOM.code) == uom.lower()).first()
+        alias = (
+            db.query(ItemAlias)
+            .filter((ItemAlias.alias_code == code) | (ItemAlias.alias_name.ilike(name)))
+            .first()
+        )
+        item_ids.append(alias.master_item_id if alias else None)
+        if alias is None:
+            suggestions = (
+                db.query(Item)
+                .filter(
+                    or_(Item.name.ilike(f"%{name}%"), Item.item_code.ilike(f"%{code}%"))
+                )
+                .limit(10)
+                .all()
+            )
+            uoms = {u.id: u.code for u in db.query(UOM).all()}
+            unmapped.append(
+                {
+                    "item_code": code,
+                    "item_name": name,
+                    "uom": uom,
+                    "suggested_items": [
+                        {
+                            "id": s.id,
+                            "name": s.name,
+                            "item_code": s.item_code,
+                            "uom": uoms.get(s.default_uom_id),
+                        }
+                        for s in suggestions
+                    ],
+                }
+            )
+    return item_ids, unmapped
+
+
+def measure(engine, session_factory, fn, lines):
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    db = session_factory()
+    try:
+        start = time.perf_counter()
+        result = fn(db, lines)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", count)
+    return result, statements, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--unmapped", type=float, default=0.2)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    with session_factory() as db:
+        seed_uoms(db)
+        seed_items(db)
+        seed_aliases(db)
+
+    lines = build_lines(args.lines, args.unmapped)
+    before, before_q, before_t = measure(engine, session_factory, resolve_per_row, lines)
+    item_index.invalidate()
+    cold, cold_q, cold_t = measure(engine, session_factory, resolve_invoice_items, lines)
+    warm, warm_q, warm_t = measure(engine, session_factory, resolve_invoice_items, lines)
+    assert before[0] == cold[0] == warm[0], "bulk resolver disagrees with per-row lookup"
+
+    unmapped = sum(1 for item_id in warm[0] if item_id is None)
+    print(f"{args.lines} lines, {unmapped} unmapped")
+    print(f"  per row    : {before_q:6d} queries  {before_t * 1000:8.1f} ms")
+    print(f"  bulk, cold : {cold_q:6d} queries  {cold_t * 1000:8.1f} ms")
+    print(f"  bulk, warm : {warm_q:6d} queries  {warm_t * 1000:8.1f} ms")
+    example = next((u for u in warm[1] if u["suggested_items"]), None)
+    if example:
+        names = ", ".join(s["name"].strip() for s in example["suggested_items"][:3])
+        print(f"  e.g. {example['item_name']!r} -> {names}")
+
+
+if __name__ == "__main__":
+    main()
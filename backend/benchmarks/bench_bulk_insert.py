@@ -0,0 +1,213 @@
+"""
+Benchmark: ORM inserts vs `app.db.bulk.bulk_insert` for back-fill volumes.
+
+Writes `--rows` invoice line items the way invoice ingest used to
+(`bulk_save_objects`) and with `bulk_insert` (COPY on PostgreSQL,
+executemany elsewhere), with and without returning ids. Inventory
+ledger rows are written once through `create_inventory_txn` per row
+(add, balance upsert, commit, refresh; capped at `--per-row-limit` rows)
+and once through `create_inventory_txns` with a single commit. A goods
+receipt of up to MAX_BULK_ENTRIES entries, each opening a batch, goes
+through `create_stock_entries_bulk` (batches and stock entries are
+COPYed too; batch quantities arrive as floats for an integer column).
+Prints rows per second for each and checks the ledger totals agree.
+
+Run from backend/ (SQLite file by default; a Postgres URL must point to
+a scratch database, its tables are created and emptied):
+    python -m benchmarks.bench_bulk_insert --rows 20000
+    python -m benchmarks.bench_bulk_insert --database-url postgresql://...
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+import app.db.models  # noqa: F401  (registers every table)
+from app.db.bulk import bulk_insert
+from app.db.models.base_class import Base
+from app.db.models.batch import Batch
+from app.db.models.inventory_txn import InventoryTxn
+from app.db.models.invoice import Invoice
+from app.db.models.invoice_item import InvoiceItem
+from app.db.models.item import Item
+from app.db.models.stock_balance import StockBalance
+from app.db.models.stock_entry import StockEntry
+from app.db.schemas.inventory_txn import InventoryTxnCreate
+from app.db.schemas.stock_entry import StockEntryCreate
+from app.services.inventory_txn import create_inventory_txn, create_inventory_txns
+from app.services.stock_entry import MAX_BULK_ENTRIES, create_stock_entries_bulk
+
+
+def setup(session_factory):
+    with session_factory() as db:
+        for model in (StockBalance, InventoryTxn, StockEntry, InvoiceItem, Invoice, Batch):
+            db.query(model).delete()
+        item = db.scalar(select(Item).where(Item.item_code == "BULKBENCH"))
+        if item is None:
+            item = Item(name="BULK BENCH ITEM", item_code="BULKBENCH")
+            db.add(item)
+            db.flush()
+        batch = Batch(item_id=item.id, quantity=0, unit="KG")
+        invoice = Invoice(
+            invoice_date=datetime(2024, 4, 1),
+            mart_name="BENCH MART",
+            total_amount=0,
+            file_path="bench.pdf",
+            file_hash=f"bench-{time.time_ns()}",
+        )
+        db.add_all([batch, invoice])
+        db.commit()
+        return item.id, batch.id, invoice.id
+
+
+def invoice_rows(invoice_id: int, item_id: int, count: int):
+    return [
+        {
+            "invoice_id": invoice_id,
+            "item_id": item_id,
+            "hsn_code": "07099990",
+            "item_code": f"{n:09d}",
+            "item_name": f"FRESH PRODUCE LINE {n}",
+            "quantity": 1.5,
+            "uom": "KG",
+            "price": 42.5,
+            "total": 63.75,
+            "invoice_date": datetime(2024, 4, 1),
+            "store_name": "BENCH MART",
+            "created_by": "bench",
+            "updated_by": "bench",
+        }
+        for n in range(count)
+    ]
+
+
+def ledger_rows(item_id: int, batch_id: int, count: int):
+    return [
+        {
+            "item_id": item_id,
+            "batch_id": batch_id,
+            "txn_type": "IN",
+            "raw_qty": 2.0,
+            "raw_unit": "KG",
+            "base_qty": 2.0,
+            "base_unit": "KG",
+            "ref_type": "backfill",
+            "ref_id": n,
+            "remarks": "Back-fill",
+        }
+        for n in range(count)
+    ]
+
+
+def receipt_entries(item_id: int, count: int):
+    # a receipt date per entry, so each one opens a batch
+    return [
+        StockEntryCreate(
+            item_id=item_id,
+            received_date=date(2000, 1, 1) + timedelta(days=n),
+            price_per_unit=42.5,
+            total_cost=85.0,
+            source="bench",
+            quantity=2,
+            unit="KG",
+        )
+        for n in range(count)
+    ]
+
+
+def receive(db, entries) -> None:
+    errors = [r.error for r in create_stock_entries_bulk(db, entries, created_by=1) if r.error]
+    if errors:
+        sys.exit(f"bulk receipt rejected {len(errors)} entries: {errors[0]}")
+
+
+def timed(session_factory, write, count: int) -> float:
+    with session_factory() as db:
+        start = time.perf_counter()
+        write(db)
+        db.commit()
+        return count / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--per-row-limit", type=int, default=1000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    url = args.database_url
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bulk.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    item_id, batch_id, invoice_id = setup(session_factory)
+    rows = invoice_rows(invoice_id, item_id, args.rows)
+    ledger = ledger_rows(item_id, batch_id, args.rows)
+    per_row = ledger[: args.per_row_limit]
+    receipts = receipt_entries(item_id, min(args.rows, MAX_BULK_ENTRIES))
+
+    def ledger_per_row(db):
+        for row in per_row:
+            create_inventory_txn(db, InventoryTxnCreate(**row))
+
+    cases = [
+        (
+            "invoice_item",
+            "bulk_save_objects",
+            len(rows),
+            lambda db: db.bulk_save_objects([InvoiceItem(**row) for row in rows]),
+        ),
+        ("invoice_item", "bulk_insert", len(rows), lambda db: bulk_insert(db, InvoiceItem, rows)),
+        (
+            "invoice_item",
+            "bulk_insert + ids",
+            len(rows),
+            lambda db: bulk_insert(db, InvoiceItem, rows, returning=True),
+        ),
+        ("inventory_txn", "per-row commit", len(per_row), ledger_per_row),
+        (
+            "inventory_txn",
+            "create_inventory_txns",
+            len(ledger),
+            lambda db: create_inventory_txns(db, ledger),
+        ),
+        (
+            "stock receipt",
+            "create_stock_entries_bulk",
+            len(receipts),
+            lambda db: receive(db, receipts),
+        ),
+    ]
+    print(f"{args.rows} rows per bulk case ({engine.dialect.name})")
+    for table, label, count, write in cases:
+        rate = timed(session_factory, write, count)
+        print(f"  {table:14s} {label:25s} {count:7d} rows {rate:10.0f} rows/s")
+
+    with session_factory() as db:
+        ledger_qty = db.scalar(select(func.sum(InventoryTxn.base_qty)))
+        balance = db.scalar(select(func.sum(StockBalance.quantity)))
+        items = db.scalar(select(func.count(InvoiceItem.id)))
+        received = db.scalar(select(func.sum(Batch.quantity)))
+    consistent = (
+        ledger_qty == balance == 2.0 * (len(per_row) + len(ledger) + len(receipts))
+        and items == 3 * len(rows)
+        and received == 2 * len(receipts)
+    )
+    print(f"  ledger {ledger_qty}, stock_balance {balance}, invoice items {items}, "
+          f"received {received}  consistent={consistent}")
+    engine.dispose()
+    return 0 if consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Benchmark: single-open invoice parsing vs. opening the PDF twice.
+
+The "two opens" path reproduces the old pipeline: format detection opens
+the file to read page 1, then table extraction opens and parses it again.
+
+Run from backend/:
+    python -m benchmarks.bench_pdf_parsing --invoices 10 --lines 400
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+
+import pandas as pd
+import pdfplumber
+
+from app.utils.invoice_parser import process_pdf
+from app.utils.invoice_parser_reliance import (
+    clean_and_rename,
+    find_store_and_date,
+    normalize_rows,
+)
+from benchmarks.synthetic_invoices import write_corpus
+
+
+def parse_two_opens(path: str):
+    with pdfplumber.open(path) as pdf:
+        assert "Reliance" in pdf.pages[0].extract_text()
+    rows = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            tbl = page.extract_table()
+            if tbl:
+                rows.extend(tbl)
+    raw = pd.DataFrame(rows)
+    store, invoice_date = find_store_and_date(raw)
+    return clean_and_rename(normalize_rows(raw), store, invoice_date)
+
+
+def parse_single_open(path: str):
+    df, _, _ = process_pdf(path)
+    return df
+
+
+def timed(fn, paths, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            fn(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--invoices", type=int, default=10)
+    parser.add_argument("--lines", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(tmp, count=args.invoices, line_items=args.lines)
+        assert parse_two_opens(paths[0]).equals(parse_single_open(paths[0]))
+
+        before = timed(parse_two_opens, paths, args.repeat)
+        after = timed(parse_single_open, paths, args.repeat)
+
+    print(f"{args.invoices} invoices x {args.lines} lines (best of {args.repeat})")
+    print(f"  two opens   : {before:8.3f}s  {before / args.invoices * 1000:8.1f} ms/invoice")
+    print(f"  single open : {after:8.3f}s  {after / args.invoices * 1000:8.1f} ms/invoice")
+    print(f"  saved       : {(1 - after / before) * 100:7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Benchmark: Reliance table cleaning, row loops vs column operations.
+
+Builds the raw table `extract_raw_table` would return for a synthetic
+invoice of `--lines` line items (descriptions and article codes carry the
+extra lines real PDFs have) and times each stage of the old pipeline
+against the current one: the store search (`iterrows` with the store
+block at the top and, as a worst case, in the last rows), `normalize_rows`,
+`clean_and_rename` and the row-to-InvoiceItem mapping (`to_dict` records
+vs column lists). Checks both produce the same items.
+
+Run from backend/:
+    python -m benchmarks.bench_reliance_cleaning
+    python -m benchmarks.bench_reliance_cleaning --lines 20000 --repeat 10
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import date
+
+import pandas as pd
+
+from app.services.invoice import _item_rows
+from app.utils.invoice_parser_reliance import (
+    clean_and_rename,
+    find_store_and_date,
+    normalize_rows,
+)
+from benchmarks.synthetic_invoices import build_invoice_rows
+
+STORE = "RELIANCE FRESH KORAMANGALA"
+
+
+def find_store_iterrows(df: pd.DataFrame) -> str:
+    for idx, row in df.iterrows():
+        if "Site Name" in row.values:
+            col = row[row == "Site Name"].index[0]
+            return df.iat[idx + 1, col].strip().replace(" ", "_")
+    raise LookupError("Site Name")
+
+
+def normalize_rows_before(df: pd.DataFrame) -> pd.DataFrame:
+    working = df.iloc[8:].copy()
+    first = working[0].tolist().index("Sr.No")
+    header = working.iloc[first : first + 1]
+    body = working[working[0] != "Sr.No"]
+    working = pd.concat([header, body]).reset_index(drop=True)
+    if "Grand Total of Qty" in working[0].values:
+        end = working[working[0] == "Grand Total of Qty"].index[0]
+        working = working.iloc[:end]
+    return working
+
+
+def clean_and_rename_before(df: pd.DataFrame, store: str, invoice_date) -> pd.DataFrame:
+    df["StoreName"] = store
+    df["Date"] = invoice_date
+    df = df.drop(columns=[0, 6, 8, 9], errors="ignore")
+    df = df.iloc[1:].copy()
+    df.columns = [
+        "HSN_CODE", "ITEM_CODE", "Item", "Quantity", "UOM", "Price", "Total", "Date", "StoreName"
+    ]
+    for col in ("Total", "Quantity", "Price"):
+        df[col] = df[col].str.replace(",", "", regex=False)
+    df["Item"] = (
+        df["Item"]
+        .str.replace(r"\n\d{2}\.\d{2}\.\d{4}\n\w{4}$", "", regex=True)
+        .str.strip("._/\n")
+    )
+    df["HSN_CODE"] = df["HSN_CODE"].str.replace("\n", "", regex=False)
+    df["ITEM_CODE"] = df["ITEM_CODE"].str.split("\n").str[0]
+    df = df.astype({"Quantity": "float", "Price": "float", "Total": "float"})
+    return df.round({"Quantity": 2, "Price": 2, "Total": 2})
+
+
+def item_rows_records(df: pd.DataFrame, item_ids, invoice_date, store: str):
+    return [
+        {
+            "invoice_id": 1,
+            "item_id": item_id,
+            "hsn_code": row["HSN_CODE"],
+            "item_code": row["ITEM_CODE"],
+            "item_name": row["Item"],
+            "quantity": row["Quantity"],
+            "uom": row["UOM"],
+            "price": row["Price"],
+            "total": row["Total"],
+            "invoice_date": invoice_date,
+            "store_name": store,
+            "created_by": "bench",
+            "updated_by": "bench",
+        }
+        for item_id, row in zip(item_ids, df.to_dict("records"))
+    ]
+
+
+def raw_table(lines: int, store_at_end: bool = False) -> pd.DataFrame:
+    """
+    The raw rows of a synthetic invoice, with multi-line cells like the
+    ones pdfplumber returns for real invoices.
+    """
+    pages = build_invoice_rows(lines, date(2025, 6, 6), STORE)
+    rows = [row for page in pages for row in page]
+    for n, row in enumerate(rows):
+        if row[0].isdigit() and n % 2:
+            row[2] = f"{row[2]}\n{n % 10000:04d}"
+            row[3] = f"{row[3]}\n06.06.2025\nB{n % 1000:03d}"
+    if store_at_end:
+        # the same table with the store block printed under it
+        rows += [rows.pop(3), rows.pop(3)]
+    return pd.DataFrame(rows)
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    raw = raw_table(args.lines)
+    raw_footer = raw_table(args.lines, store_at_end=True)
+    store, invoice_date = find_store_and_date(raw)
+    rows = normalize_rows(raw)
+    clean = clean_and_rename(rows, store, invoice_date)
+    item_ids = list(range(len(clean)))
+
+    before = clean_and_rename_before(normalize_rows_before(raw), store, invoice_date)
+    same = (
+        find_store_iterrows(raw_footer) == find_store_and_date(raw_footer)[0] == store
+        and len(clean) == args.lines
+        and clean.drop(columns=["Date", "StoreName"]).equals(
+            before.drop(columns=["Date", "StoreName"])
+        )
+        and item_rows_records(clean, item_ids, invoice_date, store)
+        == _item_rows(1, item_ids, clean, invoice_date, store, "bench")
+    )
+
+    stages = [
+        (
+            "store search (top)",
+            lambda: find_store_iterrows(raw),
+            lambda: find_store_and_date(raw),
+        ),
+        (
+            "store search (end)",
+            lambda: find_store_iterrows(raw_footer),
+            lambda: find_store_and_date(raw_footer),
+        ),
+        ("normalize_rows", lambda: normalize_rows_before(raw), lambda: normalize_rows(raw)),
+        (
+            "clean_and_rename",
+            lambda: clean_and_rename_before(rows.copy(), store, invoice_date),
+            lambda: clean_and_rename(rows, store, invoice_date),
+        ),
+        (
+            "InvoiceItem rows",
+            lambda: item_rows_records(clean, item_ids, invoice_date, store),
+            lambda: _item_rows(1, item_ids, clean, invoice_date, store, "bench"),
+        ),
+    ]
+    print(f"{args.lines} line items, {len(raw)} raw rows (best of {args.repeat}, ms)")
+    print(f"  {'stage':20s} {'before':>9s} {'after':>9s} {'speed-up':>9s}")
+    totals = [0.0, 0.0]
+    for label, old, new in stages:
+        times = [best_of(args.repeat, old), best_of(args.repeat, new)]
+        if label != "store search (end)":
+            totals = [t + s for t, s in zip(totals, times)]
+        print(
+            f"  {label:20s} {times[0] * 1000:9.2f} {times[1] * 1000:9.2f} "
+            f"{times[0] / times[1]:8.1f}x"
+        )
+    print(
+        f"  {'total (store at top)':20s} {totals[0] * 1000:9.2f} {totals[1] * 1000:9.2f} "
+        f"{totals[0] / totals[1]:8.1f}x"
+    )
+    print(f"  same output: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Benchmark: deploy-time migrate/seed steps and API worker cold start.
+
+Times each step of `app.commands.migrate` in-process, with the number
+of SQL statements it ran: the upgrade to head, the first seed run, a run
+with unchanged seed data (skipped by fingerprint) and a forced run where
+every seed row already exists. It then times the whole command as a
+deploy runs it, and how long uvicorn takes from launch to its first
+response with `--workers` workers, which no longer includes migrating
+or seeding.
+
+Run from backend/ against a scratch Postgres database (it is migrated
+and seeded):
+    python -m benchmarks.bench_startup --database-url postgresql://...
+    python -m benchmarks.bench_startup --database-url ... --workers 4 --repeat 5
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def wait_until_up(base_url: str, proc: subprocess.Popen) -> None:
+    while True:
+        if proc.poll() is not None:
+            sys.exit("uvicorn exited during start-up")
+        try:
+            httpx.get(base_url + "/docs", timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.02)
+
+
+def worker_start_seconds(env: dict, workers: int, port: int) -> float:
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_up(f"http://127.0.0.1:{port}", proc)
+        return time.perf_counter() - start
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    # settings are read at import time
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("JWT_SECRET_KEY", "bench")
+    env = dict(os.environ)
+
+    from sqlalchemy import event
+
+    from app.commands.migrate import upgrade_schema
+    from app.db.seed.seed_all import seed_all
+    from app.db.session import SessionLocal, engine
+
+    statements = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    def seed(force: bool):
+        db = SessionLocal()
+        try:
+            return seed_all(db, created_by="bench", force=force)
+        finally:
+            db.close()
+
+    steps = [
+        ("upgrade to head", upgrade_schema),
+        ("seed", lambda: seed(False)),
+        ("seed, unchanged", lambda: seed(False)),
+        ("seed, forced", lambda: seed(True)),
+    ]
+    # keep the seed logs out of the table
+    logging.disable(logging.CRITICAL)
+    print("migrate steps, in-process:")
+    for label, step in steps:
+        statements = 0
+        start = time.perf_counter()
+        result = step()
+        elapsed = time.perf_counter() - start
+        # alembic's env.py runs on an engine of its own, not counted
+        counted = f"{statements:5d} statements" if step is not upgrade_schema else ""
+        note = f"  inserted {result}" if isinstance(result, dict) else ""
+        print(f"  {label:16s} {elapsed * 1000:8.1f} ms {counted}{note}")
+
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "app.commands.migrate"],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    print(f"python -m app.commands.migrate: {time.perf_counter() - start:.2f} s")
+
+    runs = [worker_start_seconds(env, args.workers, args.port) for _ in range(args.repeat)]
+    print(
+        f"uvicorn --workers {args.workers} to first response: "
+        f"median {statistics.median(runs):.2f} s, max {max(runs):.2f} s "
+        f"({args.repeat} runs)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
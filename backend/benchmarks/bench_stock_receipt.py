@@ -0,0 +1,156 @@
+"""
+Benchmark: receiving a goods receipt one stock entry at a time vs in bulk.
+
+Builds a receipt of `--rows` stock entries over `--items` items and a few
+receipt dates, part of them landing in batches that already exist, and
+saves it once through `create_stock_entry` per row and once through
+`create_stock_entries_bulk`. For each it prints the wall time, the SQL
+statements and commits issued, and checks that batches, stock entries,
+the inventory ledger and stock_balance come out the same.
+
+Run from backend/ (SQLite file by default; pass a scratch Postgres URL,
+its stock tables are emptied):
+    python -m benchmarks.bench_stock_receipt --rows 1000
+    python -m benchmarks.bench_stock_receipt --database-url postgresql://...
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+import app.db.models  # noqa: F401  (registers every table)
+from app.db.models.base_class import Base
+from app.db.models.batch import Batch
+from app.db.models.dispatch_entry import DispatchEntry
+from app.db.models.inventory_txn import InventoryTxn
+from app.db.models.item import Item
+from app.db.models.rejection_entry import RejectionEntry
+from app.db.models.stock_balance import StockBalance
+from app.db.models.stock_entry import StockEntry
+from app.db.schemas.stock_entry import StockEntryCreate
+from app.services.stock_entry import create_stock_entries_bulk, create_stock_entry
+
+DAYS = 3
+
+
+def setup(session_factory, items: int):
+    """
+    Empty the stock tables and create `items` items, each with one batch
+    received on the first receipt date.
+    """
+    with session_factory() as db:
+        for model in (
+            StockBalance, InventoryTxn, StockEntry, DispatchEntry, RejectionEntry, Batch
+        ):
+            db.query(model).delete()
+        db.query(Item).filter(Item.item_code.like("RCPT%")).delete(
+            synchronize_session=False
+        )
+        rows = [Item(name=f"RECEIPT ITEM {i}", item_code=f"RCPT{i}") for i in range(items)]
+        db.add_all(rows)
+        db.flush()
+        db.add_all(
+            Batch(item_id=item.id, quantity=0, unit="KG", received_at=date(2024, 4, 1))
+            for item in rows
+        )
+        db.commit()
+        return [item.id for item in rows]
+
+
+def receipt(item_ids, rows: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        StockEntryCreate(
+            item_id=rng.choice(item_ids),
+            received_date=date(2024, 4, 1) + timedelta(days=rng.randrange(DAYS)),
+            price_per_unit=round(rng.uniform(10, 200), 2),
+            total_cost=0.0,
+            source="bench",
+            quantity=rng.randint(1, 50),
+            unit="KG",
+        )
+        for _ in range(rows)
+    ]
+
+
+def totals(session_factory):
+    with session_factory() as db:
+        return {
+            "batches": db.scalar(select(func.count(Batch.id))),
+            "batch qty": db.scalar(select(func.sum(Batch.quantity))),
+            "entries": db.scalar(select(func.count(StockEntry.id))),
+            "ledger qty": db.scalar(select(func.sum(InventoryTxn.base_qty))),
+            "balance qty": db.scalar(select(func.sum(StockBalance.quantity))),
+        }
+
+
+def single(db, entries):
+    for entry in entries:
+        create_stock_entry(db, entry, created_by=1)
+
+
+def bulk(db, entries):
+    results = create_stock_entries_bulk(db, entries, created_by=1)
+    errors = [r for r in results if r.error]
+    if errors:
+        sys.exit(f"bulk receipt rejected {len(errors)} rows: {errors[0].error}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=150)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    url = args.database_url
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'receipt.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    counts = {"statements": 0, "commits": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statement(*_):
+        counts["statements"] += 1
+
+    @event.listens_for(engine, "commit")
+    def count_commit(*_):
+        counts["commits"] += 1
+
+    print(f"{args.rows} receipts over {args.items} items ({engine.dialect.name})")
+    outcome = {}
+    for label, fn in (("single", single), ("bulk", bulk)):
+        entries = receipt(setup(session_factory, args.items), args.rows)
+        with session_factory() as db:
+            counts.update(statements=0, commits=0)
+            start = time.perf_counter()
+            fn(db, entries)
+            elapsed = time.perf_counter() - start
+            stats = dict(counts)
+        outcome[label] = totals(session_factory)
+        print(
+            f"  {label:6}: {elapsed * 1000:9.1f} ms  {args.rows / elapsed:9.0f} rows/s  "
+            f"{stats['statements']:6d} statements  {stats['commits']:5d} commits"
+        )
+
+    # batch ids differ between the runs, the totals must not
+    consistent = outcome["single"] == outcome["bulk"]
+    print(f"  totals: {outcome['bulk']}  consistent={consistent}")
+    engine.dispose()
+    return 0 if consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Benchmark: peak memory of whole-table vs page-by-page invoice parsing.
+
+Writes one synthetic Reliance invoice of `--pages` pages and saves it
+three ways, each in a fresh subprocess so peak RSS is its own:
+  pages kept      every page stays parsed until the table is built (the
+                  old extraction), then `persist_parsed_invoice`
+  whole table     `process_pdf`, pages released as they are read, then
+                  `persist_parsed_invoice`
+  streamed        `persist_streamed_invoice`: one page and one chunk of
+                  rows at a time
+Prints peak RSS above the interpreter's baseline, wall time and the rows
+saved; fails when the runs save different rows or the streamed run peaks
+above the old extraction. Releasing pages is most of the saving; the
+streamed run also stops the table and its rows growing with page count,
+which shows on invoices of a hundred pages and more.
+
+Run from backend/ (SQLite file by default; a Postgres URL must point to
+a scratch database, its tables are created):
+    python -m benchmarks.bench_streaming_extraction --pages 100
+    python -m benchmarks.bench_streaming_extraction --database-url postgresql://...
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+import app.db.models  # noqa: F401  (registers every table)
+from app.db.models.base_class import Base
+from app.db.models.invoice import Invoice
+from app.db.models.invoice_item import InvoiceItem
+from benchmarks.synthetic_invoices import ROWS_PER_PAGE, write_invoice_pdf
+
+MODES = ("pages kept", "whole table", "streamed")
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def parse_pages_kept(path: str):
+    import pandas as pd
+
+    from app.utils.invoice_document import InvoiceDocument
+    from app.utils.invoice_parser_reliance import (
+        clean_and_rename,
+        find_store_and_date,
+        normalize_rows,
+    )
+
+    with InvoiceDocument(path) as doc:
+        # page_table keeps every page parsed, as extraction used to
+        rows = [row for n in range(doc.page_count) for row in doc.page_table(n) or []]
+        raw = pd.DataFrame(rows)
+        store, invoice_date = find_store_and_date(raw)
+        return clean_and_rename(normalize_rows(raw), store, invoice_date), invoice_date, store
+
+
+def run_mode(mode: str, path: str, url: str) -> dict:
+    """
+    Save the invoice once; runs in the subprocess.
+    """
+    from app.services.invoice import persist_parsed_invoice, persist_streamed_invoice
+    from app.utils.invoice_parser import process_pdf
+
+    session_factory = sessionmaker(bind=create_engine(url), autoflush=False)
+    file_hash = f"{mode}-{time.time_ns()}"
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    with session_factory() as db:
+        if mode == "streamed":
+            result = persist_streamed_invoice(db, path, "bench.pdf", file_hash, "bench")
+        else:
+            parse = parse_pages_kept if mode == "pages kept" else process_pdf
+            df, invoice_date, store = parse(path)
+            result = persist_parsed_invoice(
+                db, df, invoice_date, store, "bench.pdf", path, file_hash, "bench"
+            )
+    elapsed = time.perf_counter() - start
+    return {
+        "invoice_id": result["invoice_id"],
+        "rss_mb": peak_rss_mb() - baseline,
+        "seconds": elapsed,
+    }
+
+
+def saved_rows(session_factory, invoice_id: int):
+    with session_factory() as db:
+        total = db.scalar(select(Invoice.total_amount).where(Invoice.id == invoice_id))
+        rows = db.execute(
+            select(
+                InvoiceItem.item_code,
+                InvoiceItem.item_name,
+                InvoiceItem.quantity,
+                InvoiceItem.price,
+                InvoiceItem.total,
+            )
+            .where(InvoiceItem.invoice_id == invoice_id)
+            .order_by(InvoiceItem.id)
+        ).all()
+        count = db.scalar(
+            select(func.count(InvoiceItem.id)).where(InvoiceItem.invoice_id == invoice_id)
+        )
+    return round(total, 2), count, [tuple(r) for r in rows]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url")
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "PDF", "URL"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    if args.child:
+        print(json.dumps(run_mode(*args.child)))
+        return 0
+
+    tmp = tempfile.mkdtemp()
+    url = args.database_url or f"sqlite:///{os.path.join(tmp, 'stream.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    # the metadata block and the grand total take a few rows of the first and last page
+    path = write_invoice_pdf(os.path.join(tmp, "long.pdf"), line_items=ROWS_PER_PAGE * args.pages)
+    print(
+        f"{args.pages}-page invoice, {os.path.getsize(path) / 1024 / 1024:.1f} MB "
+        f"({engine.dialect.name})"
+    )
+
+    print(f"  {'mode':12s} {'peak MB':>9s} {'seconds':>8s}  rows")
+    outcome, peaks = {}, {}
+    for mode in MODES:
+        child = subprocess.run(
+            [sys.executable, "-W", "ignore", "-m", __spec__.name, "--child", mode, path, url],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "DATABASE_URL": url},
+        )
+        run = json.loads(child.stdout.strip().splitlines()[-1])
+        outcome[mode] = saved_rows(session_factory, run["invoice_id"])
+        peaks[mode] = run["rss_mb"]
+        print(f"  {mode:12s} {run['rss_mb']:9.1f} {run['seconds']:8.1f}  {outcome[mode][1]}")
+
+    same = outcome["streamed"] == outcome["whole table"] == outcome["pages kept"]
+    bounded = peaks["streamed"] < peaks["pages kept"]
+    print(f"  same rows: {same}  streamed peak below pages kept: {bounded}")
+    engine.dispose()
+    return 0 if same and bounded else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""
+N+1 report: repeated statement shapes per route, for every API route.
+
+Runs the app in-process with N+1 detection on (N_PLUS_ONE_THRESHOLD),
+seeds it through its own POST routes (`--rows` of each resource, so a
+per-row lazy load repeats `--rows` times), then calls every GET route
+and one PUT and DELETE per resource. Prints, per route, the most SQL
+statements and the most repeats of one statement shape seen in a
+single request, and exits 1 when a route repeats a shape more than
+`--threshold` times (so CI can run it). Routes the script does not know
+how to call are listed as not exercised.
+
+Uses a fresh SQLite file by default; a Postgres URL must point to a
+scratch database migrated with `alembic upgrade head`. Run from backend/:
+    python -m benchmarks.check_n_plus_one
+    python -m benchmarks.check_n_plus_one --threshold 3 --rows 20 --verbose
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import httpx
+
+TODAY = date(2025, 6, 6)
+MART = "RELIANCE FRESH KORAMANGALA"
+SKIPPED_PATHS = {"/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc"}
+
+
+class Client:
+    """
+    Sends requests with the login token and records unexpected statuses.
+    """
+
+    def __init__(self, http: httpx.AsyncClient):
+        self.http = http
+        self.headers = {}
+        self.failed = []
+
+    async def __call__(self, method: str, path: str, expect=(200, 201, 204), **kwargs):
+        r = await self.http.request(method, path, headers=self.headers, **kwargs)
+        if r.status_code not in expect:
+            self.failed.append(f"{method} {path} -> {r.status_code} {r.text[:120]}")
+        if r.status_code == 204 or "json" not in r.headers.get("content-type", ""):
+            return None
+        return r.json()
+
+
+async def exercise(app, rows: int, pdf_dir: str) -> Client:
+    from sqlalchemy import text
+
+    from app.db.session import engine
+    from benchmarks.synthetic_invoices import write_invoice_pdf
+
+    # 500s are reported as failed requests instead of raised
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://check", timeout=300
+    ) as http:
+        call = Client(http)
+        day = str(TODAY)
+
+        # users and auth
+        creds = {"username": "checker", "password": "secret"}
+        await call("POST", "/v1/register", json={**creds, "full_name": "Checker"})
+        token = await call("POST", "/v1/login", json=creds)
+        call.headers["Authorization"] = f"Bearer {token['access_token']}"
+        for n in range(rows):
+            await call(
+                "POST",
+                "/v1/register",
+                json={"username": f"user{n}", "full_name": f"User {n}", "password": "x"},
+            )
+        users = await call("GET", "/v1/users/")
+        me = next(u for u in users if u["username"] == "checker")
+        admin = {"full_name": "Checker", "is_admin": True, "is_active": True}
+        await call("PUT", f"/v1/users/{me['id']}", json=admin)
+
+        # master data
+        for code in ("KG", "EA", "BOX"):
+            await call("POST", "/v1/uom/", json={"code": code, "description": code})
+        items = []
+        for n in range(rows):
+            items.append(
+                await call(
+                    "POST", "/v1/item/", json={"name": f"ITEM {n}", "item_code": f"C{n}"}
+                )
+            )
+            await call(
+                "POST",
+                "/v1/item-alias/",
+                json={
+                    "alias_code": f"59{n:07d}",
+                    "alias_name": f"ALIAS {n}",
+                    "master_item_id": items[-1]["id"],
+                },
+            )
+            await call(
+                "POST",
+                "/v1/conversions/",
+                json={
+                    "item_id": items[-1]["id"],
+                    "source_unit": "BOX",
+                    "target_unit": "KG",
+                    "conversion_factor": 10,
+                },
+            )
+        item_ids = [i["id"] for i in items]
+        # the item API has no default unit field; seeded items all have one
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "UPDATE item SET default_uom_id = "
+                    "(SELECT id FROM uom WHERE code = 'KG')"
+                )
+            )
+
+        # stock, orders, dispatches, rejections
+        stock = []
+        for item_id in item_ids:
+            stock.append(
+                await call(
+                    "POST",
+                    "/v1/stock-entry/",
+                    json={
+                        "item_id": item_id,
+                        "received_date": day,
+                        "price_per_unit": 20,
+                        "total_cost": 2000,
+                        "quantity": 100,
+                        "unit": "KG",
+                    },
+                )
+            )
+            await call(
+                "POST",
+                "/v1/batch/",
+                json={"received_at": day, "unit": "KG", "quantity": 50, "item_id": item_id},
+            )
+        receipt = [
+            {
+                "item_id": item_id,
+                "received_date": day,
+                "price_per_unit": 21,
+                "total_cost": 210,
+                "quantity": 10,
+                "unit": unit,
+            }
+            # the last item does not exist and must be reported
+            for item_id in (*item_ids, max(item_ids) + 1)
+            for unit in ("KG", "BOX")
+        ]
+        received = await call("POST", "/v1/stock-entry/bulk", json=receipt)
+        rejected = [r["index"] for r in received or [] if r["error"]]
+        if rejected != [len(receipt) - 2, len(receipt) - 1]:
+            call.failed.append(
+                f"POST /v1/stock-entry/bulk rejected rows {rejected}, "
+                "expected the two of the unknown item"
+            )
+        batches = await call("GET", "/v1/batch/", params={"limit": 500})
+        batch_of = {}
+        for b in batches:
+            batch_of.setdefault(b["item_id"], b["id"])
+        orders, dispatches = [], []
+        for n, item_id in enumerate(item_ids):
+            orders.append(
+                await call(
+                    "POST",
+                    "/v1/orders/",
+                    json={
+                        "item_id": item_id,
+                        "unit": "KG",
+                        "mart_name": MART,
+                        "order_date": day,
+                        "quantity_ordered": 10,
+                    },
+                )
+            )
+            dispatches.append(
+                await call(
+                    "POST",
+                    "/v1/dispatch-entries/",
+                    json={
+                        "item_id": item_id,
+                        "batch_id": batch_of[item_id],
+                        "mart_name": MART,
+                        "dispatch_date": day,
+                        "quantity": 2,
+                        "unit": "KG",
+                    },
+                )
+            )
+            await call(
+                "POST",
+                "/v1/dispatch-entries/from-order",
+                json={
+                    "item_id": item_id,
+                    "mart_name": MART,
+                    "dispatch_date": str(TODAY + timedelta(days=1)),
+                    "unit": "KG",
+                    "batches": [{"batch_id": batch_of[item_id], "quantity": 1}],
+                },
+            )
+            await call(
+                "POST",
+                "/v1/rejection-entries/",
+                json={
+                    "batch_id": batch_of[item_id],
+                    "quantity": 1,
+                    "reason": "damaged",
+                    "rejection_date": day,
+                    "rejected_by": "checker",
+                },
+            )
+
+        # invoices
+        files = []
+        for seed in range(2):
+            path = os.path.join(pdf_dir, f"invoice{seed}.pdf")
+            write_invoice_pdf(path, line_items=rows, invoice_date=TODAY, seed=seed)
+            files.append(("files", (f"invoice{seed}.pdf", open(path, "rb").read())))
+        uploaded = await call("POST", "/v1/invoices/upload", files=files)
+        invoice_ids = [u["invoice_id"] for u in uploaded if u.get("success")]
+        invoice_items = await call("GET", f"/v1/invoice-items/{invoice_ids[0]}")
+
+        # every GET route
+        path_ids = {
+            "item_id": item_ids[0],
+            "batch_id": batch_of[item_ids[0]],
+            "stock_entry_id": stock[0]["id"],
+            "id": dispatches[0]["id"],
+            "user_id": me["id"],
+            "invoice_id": invoice_ids[0],
+            "order_id": orders[0]["id"],
+            "conv_id": (await call("GET", "/v1/conversions/"))[0]["id"],
+        }
+        query = {
+            "/v1/inventory-txn/": {"item_id": item_ids[0]},
+            "/v1/rejection-entries/list": {"rejection_date": day},
+            "/v1/invoice-items/distinct-items": {"mart_name": MART},
+            "/v1/reports/pnl": {"start": day, "end": day, "fresh": "true"},
+        }
+        for route in app.routes:
+            if "GET" not in getattr(route, "methods", ()) or route.path in SKIPPED_PATHS:
+                continue
+            await call(
+                "GET", route.path.format(**path_ids), params=query.get(route.path, {})
+            )
+
+        # updates
+        await call("PUT", f"/v1/item/{item_ids[0]}", json={"name": "ITEM 0 RENAMED"})
+        await call("PUT", f"/v1/batch/{batch_of[item_ids[0]]}", json={"quantity": 60})
+        await call("PUT", f"/v1/stock-entry/{stock[0]['id']}", json={"price_per_unit": 21})
+        await call("PUT", f"/v1/orders/{orders[0]['id']}", json={"quantity_ordered": 12})
+        await call(
+            "PUT",
+            f"/v1/dispatch-entries/{dispatches[0]['id']}",
+            json={"quantity": 3, "unit": "KG"},
+        )
+        await call(
+            "PUT",
+            f"/v1/conversions/{path_ids['conv_id']}",
+            json={"conversion_factor": 12, "source_unit": "BOX", "target_unit": "KG"},
+        )
+        await call(
+            "PUT",
+            f"/v1/invoices/{invoice_ids[0]}",
+            json={"is_verified": True, "remarks": "checked"},
+        )
+        await call(
+            "PUT", f"/v1/invoice-items/{invoice_items[0]['id']}", json={"quantity": 2}
+        )
+
+        # deletes, on rows nothing else needs
+        last = len(item_ids) - 1
+        await call("DELETE", f"/v1/dispatch-entries/{dispatches[last]['id']}")
+        await call("DELETE", f"/v1/orders/{orders[last]['id']}")
+        await call("DELETE", f"/v1/stock-entry/{stock[last]['id']}")
+        # POST /batch tops up the item's batch created today, so use a new item
+        spare_item = await call(
+            "POST", "/v1/item/", json={"name": "SPARE BATCH", "item_code": "SPB"}
+        )
+        spare = await call(
+            "POST",
+            "/v1/batch/",
+            json={"received_at": day, "unit": "KG", "quantity": 1, "item_id": spare_item["id"]},
+        )
+        await call("DELETE", f"/v1/batch/{spare['id']}")
+        await call("DELETE", f"/v1/conversions/{path_ids['conv_id']}")
+        await call("DELETE", f"/v1/invoice-items/{invoice_items[-1]['id']}")
+        await call("DELETE", f"/v1/invoices/{invoice_ids[-1]}")
+        await call("DELETE", "/v1/invoices/parse-cache")
+        spare = await call("POST", "/v1/item/", json={"name": "SPARE", "item_code": "SP"})
+        await call("DELETE", f"/v1/item/{spare['id']}")
+        other = next(u for u in users if u["username"] != "checker")
+        await call("DELETE", f"/v1/users/{other['id']}")
+    return call
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", help="default: a fresh SQLite file")
+    parser.add_argument("--threshold", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--verbose", action="store_true", help="print repeated shapes")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="n_plus_one_")
+    url = args.database_url or f"sqlite:///{os.path.join(workdir, 'check.db')}"
+    # settings are read at import time
+    os.environ.update(
+        DATABASE_URL=url,
+        N_PLUS_ONE_THRESHOLD=str(args.threshold),
+        N_PLUS_ONE_RAISE="false",
+        INVOICE_PARSE_WORKERS="0",
+        INVOICE_PARSE_CACHE_DIR=os.path.join(workdir, "parse_cache"),
+    )
+    os.environ.setdefault("JWT_SECRET_KEY", "check")
+
+    import logging
+
+    from fastapi import FastAPI
+
+    import app.db.models  # noqa: F401  (registers every table)
+    from app.api import router as api_router
+    from app.api.metrics import router as metrics_router
+    from app.core.config import settings
+    from app.core.exceptions import register_exception_handlers
+    from app.core.instrumentation import MetricsMiddleware, repeated_statement_report
+    from app.db.models.base_class import Base
+    from app.db.session import async_engine, engine
+
+    logging.disable(logging.CRITICAL)
+    settings.INVOICE_UPLOAD_DIR = os.path.join(workdir, "invoices")
+    if engine.dialect.name == "sqlite":
+        Base.metadata.create_all(engine)
+
+    # the real app without its startup migrations and seeding
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(api_router)
+    app.include_router(metrics_router)
+
+    async def run() -> Client:
+        try:
+            return await exercise(app, args.rows, workdir)
+        finally:
+            await async_engine.dispose()
+
+    client = asyncio.run(run())
+
+    report = {(r["method"], r["route"]): r for r in repeated_statement_report()}
+    offenders = 0
+    print(f"{'route':58} {'max stmts':>9} {'repeats':>7}")
+    for route in app.routes:
+        if route.path in SKIPPED_PATHS:
+            continue
+        for method in sorted(route.methods):
+            entry = report.get((method, route.path))
+            label = f"{method} {route.path}"
+            if entry is None:
+                print(f"  {label:56}   not exercised")
+                continue
+            flag = entry["max_repeats"] > args.threshold
+            offenders += flag
+            print(
+                f"{'!' if flag else ' '} {label:56} {entry['max_statements']:9d} "
+                f"{entry['max_repeats']:7d}"
+            )
+            if flag and args.verbose:
+                print(f"      {entry['shape'][:300]}")
+    for failure in client.failed:
+        print(f"request failed: {failure}")
+    print(
+        f"{offenders} routes repeat a statement more than {args.threshold} times"
+        if offenders
+        else f"no route repeats a statement more than {args.threshold} times"
+    )
+    return 1 if offenders or client.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
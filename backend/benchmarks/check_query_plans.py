@@ -0,0 +1,286 @@
+"""
+Regression check: service queries must not sequential-scan large tables.
+
+Seeds a Postgres database with about `--rows` rows spread over the hot
+tables (most batches depleted and most orders completed, as in a running
+warehouse), then calls the keyed and filtered service functions inside a
+transaction that is rolled back at the end. Every SELECT, UPDATE and
+DELETE they issue is re-run under EXPLAIN; a Seq Scan on a table with at
+least `--min-rows` rows fails the check. Unfiltered list endpoints and
+full rebuilds read whole tables by design and are not exercised.
+
+Needs a scratch database migrated with `alembic upgrade head`. Seeding
+TRUNCATES every table in it. Run from backend/:
+    python -m benchmarks.check_query_plans --database-url postgresql://.../scratch
+    python -m benchmarks.check_query_plans --database-url ... --no-seed
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import Session
+
+import app.db.models  # noqa: F401  (registers every table)
+from app.db.schemas.dispatch_entry import DispatchEntryCreate
+from app.db.schemas.order import OrderCreate
+from app.db.schemas.stock_entry import StockEntryCreate
+from app.db.schemas.batch import BatchCreate
+from app.services import (
+    batch,
+    dispatch_entry,
+    inventory_txn,
+    invoice,
+    invoice_item,
+    order,
+    rejection_entry,
+    reports,
+    stock_entry,
+    sync,
+)
+from app.services.conversion_graph import conversion_graph
+from app.services.item_index import item_index
+from app.services.pnl_summary import refresh_pnl_summary
+
+BASE_DATE = date(2023, 1, 1)
+DAYS = 730
+MARTS = 50
+
+# share of --rows per table
+SHARES = {
+    "invoice_item": 0.40,
+    "inventory_txn": 0.25,
+    "dispatch_entry": 0.10,
+    "batch": 0.05,
+    "stockentry": 0.05,
+    "order": 0.05,
+    "invoice": 0.02,
+    "rejection_entries": 0.02,
+    "item": 0.002,
+}
+
+SEED_SQL = [
+    "INSERT INTO uom (code, created_at, updated_at) VALUES ('KG', :old, :old), ('G', :old, :old)",
+    """INSERT INTO item (name, item_code, default_uom_id, created_at, updated_at)
+       SELECT 'ITEM ' || g, 'C' || g, 1, :old, :old FROM generate_series(1, :item) g""",
+    """INSERT INTO item_conversion_map (item_id, source_unit, target_unit, conversion_factor, created_at, updated_at)
+       SELECT g, 'KG', 'G', 1000, :old, :old FROM generate_series(1, :item) g""",
+    """INSERT INTO batch (item_id, quantity, unit, received_at, created_at, updated_at)
+       SELECT g % :item + 1, CASE WHEN g % 20 = 0 THEN 50 ELSE 0 END, 'KG',
+              :base + g % :days, :base + g % :days, :old
+       FROM generate_series(1, :batch) g""",
+    """INSERT INTO stockentry (item_id, batch_id, received_date, price_per_unit, total_cost,
+                               quantity, unit, created_at, updated_at)
+       SELECT b % :item + 1, b, :base + b % :days, 10 + g % 7, 100 * (10 + g % 7), 100, 'KG', :old, :old
+       FROM (SELECT g, g % :batch + 1 AS b FROM generate_series(1, :stockentry) g) s""",
+    """INSERT INTO "order" (item_id, mart_name, order_date, quantity_ordered, quantity_dispatched,
+                            status, unit, created_at, updated_at)
+       SELECT g % :item + 1, 'MART ' || g % :marts, :base + g % :days,
+              100, 0, CASE WHEN g % 20 = 0 THEN 'Pending' ELSE 'Completed' END, 'KG', :old, :old
+       FROM generate_series(1, :order) g
+       ON CONFLICT DO NOTHING""",
+    """INSERT INTO dispatch_entry (batch_id, item_id, dispatch_date, mart_name, quantity, unit,
+                                  created_at, updated_at)
+       SELECT b, b % :item + 1, :base + g % :days, 'MART ' || g % :marts, 1 + g % 5, 'KG', :old, :old
+       FROM (SELECT g, g % :batch + 1 AS b FROM generate_series(1, :dispatch_entry) g) s
+       ON CONFLICT DO NOTHING""",
+    """INSERT INTO invoice (mart_name, invoice_date, file_path, file_hash, is_verified, created_at, updated_at)
+       SELECT 'MART ' || g % :marts, :base + g % :days, 'invoices/' || g || '.pdf', md5(g::text),
+              false, :old, :old
+       FROM generate_series(1, :invoice) g""",
+    """INSERT INTO invoice_item (invoice_id, item_id, item_name, quantity, uom, price, total,
+                                invoice_date, store_name, created_at, updated_at)
+       SELECT v, g % :item + 1, 'ITEM ' || (g % :item + 1), 2, 'KG', 15, 30,
+              :base + v % :days, 'MART ' || v % :marts, :old, :old
+       FROM (SELECT g, g % :invoice + 1 AS v FROM generate_series(1, :invoice_item) g) s""",
+    """INSERT INTO inventory_txn (item_id, batch_id, txn_type, raw_qty, raw_unit, base_qty, base_unit,
+                                 ref_type, created_at)
+       SELECT b % :item + 1, b, CASE WHEN g % 3 = 0 THEN 'IN' ELSE 'OUT' END, 1, 'KG', 1, 'KG',
+              'stock_entry', :base + g % :days
+       FROM (SELECT g, g % :batch + 1 AS b FROM generate_series(1, :inventory_txn) g) s""",
+    """INSERT INTO rejection_entries (item_id, batch_id, quantity, rejection_date, unit, created_at, updated_at)
+       SELECT b % :item + 1, b, 1, :base + g % :days, 'KG', :old, :old
+       FROM (SELECT g, g % :batch + 1 AS b FROM generate_series(1, :rejection_entries) g) s""",
+    """INSERT INTO stock_balance (item_id, batch_id, base_unit, quantity, updated_at)
+       SELECT item_id, batch_id, base_unit,
+              SUM(CASE WHEN txn_type = 'IN' THEN base_qty ELSE -base_qty END), :old
+       FROM inventory_txn GROUP BY item_id, batch_id, base_unit""",
+]
+
+
+def seed(engine, rows: int) -> None:
+    counts = {table: max(int(rows * share), 100) for table, share in SHARES.items()}
+    params = {**counts, "base": BASE_DATE, "days": DAYS, "marts": MARTS}
+    tables = [t for t in inspect(engine).get_table_names() if t != "alembic_version"]
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "TRUNCATE " + ", ".join(f'"{t}"' for t in tables) + " RESTART IDENTITY CASCADE"
+        )
+        # older than the P&L watermark the seed ends with
+        params["old"] = conn.scalar(
+            text("SELECT (now() AT TIME ZONE 'utc') - interval '1 day'")
+        )
+        for sql in SEED_SQL:
+            conn.execute(text(sql), params)
+    with Session(engine) as db:
+        refresh_pnl_summary(db, full=True)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM ANALYZE")
+    total = sum(counts.values())
+    print(f"Seeded {total} rows in {time.perf_counter() - start:.1f}s")
+
+
+def sample(conn) -> dict:
+    """
+    Keys for the checked calls, picked from the seeded data.
+    """
+    item_id, batch_id = conn.execute(
+        text("SELECT item_id, id FROM batch WHERE quantity > 0 ORDER BY id LIMIT 1")
+    ).one()
+    return {
+        "item_id": item_id,
+        "batch_id": batch_id,
+        "mart": "MART 7",
+        "day": BASE_DATE + timedelta(days=100),
+        "new_day": BASE_DATE + timedelta(days=DAYS + 30),
+        "now": datetime.utcnow(),
+        "invoice_id": conn.scalar(text("SELECT max(id) / 2 FROM invoice")),
+        "invoice_item_id": conn.scalar(text("SELECT max(id) / 2 FROM invoice_item")),
+        "dispatch_id": conn.scalar(text("SELECT max(id) / 2 FROM dispatch_entry")),
+        "stock_entry_id": conn.scalar(text("SELECT max(id) / 2 FROM stockentry")),
+    }
+
+
+def checks(k: dict):
+    """
+    (label, call) pairs; writes run before the reads that depend on them.
+    """
+    day, mart = k["day"], k["mart"]
+    return [
+        ("batch.create_batch", lambda db: batch.create_batch(
+            db, BatchCreate(item_id=k["item_id"], quantity=5, unit="KG", received_at=day))),
+        ("batch.get_batches_by_item_with_quantity",
+         lambda db: batch.get_batches_by_item_with_quantity(db, k["item_id"])),
+        ("stock_entry.create_stock_entry", lambda db: stock_entry.create_stock_entry(
+            db, StockEntryCreate(item_id=k["item_id"], received_date=day, price_per_unit=12,
+                                 total_cost=120, quantity=10, unit="KG"))),
+        ("stock_entry.get_all_stock_entries",
+         lambda db: stock_entry.get_all_stock_entries(db, date=day)),
+        ("batch.get_all_batches (second page)", lambda db: batch.get_all_batches(
+            db, cursor=batch.get_all_batches(db, limit=50).next_cursor, limit=50)),
+        ("order.create_order", lambda db: order.create_order(
+            db, OrderCreate(item_id=k["item_id"], unit="KG", mart_name=mart,
+                            order_date=k["new_day"], quantity_ordered=10))),
+        ("order.get_orders", lambda db: order.get_orders(db, order_date=day, mart_name=mart)),
+        ("dispatch_entry.create_dispatch_entry", lambda db: dispatch_entry.create_dispatch_entry(
+            db, DispatchEntryCreate(batch_id=k["batch_id"], item_id=k["item_id"], mart_name=mart,
+                                    dispatch_date=k["new_day"], quantity=1, unit="KG"))),
+        ("dispatch_entry.get_all_dispatch_entries",
+         lambda db: dispatch_entry.get_all_dispatch_entries(db, dispatch_date=day, mart_name=mart)),
+        ("dispatch_entry.get_all_dispatch_entries (second page)",
+         lambda db: dispatch_entry.get_all_dispatch_entries(
+             db, cursor=dispatch_entry.get_all_dispatch_entries(db, limit=50).next_cursor, limit=50)),
+        ("dispatch_entry.delete_dispatch_entry",
+         lambda db: dispatch_entry.delete_dispatch_entry(db, k["dispatch_id"])),
+        ("inventory_txn.get_inventory_txns",
+         lambda db: inventory_txn.get_inventory_txns(db, k["item_id"])),
+        ("invoice.get_all_invoices", lambda db: invoice.get_all_invoices(db, mart_name=mart)),
+        ("invoice_item.get_items_by_invoice",
+         lambda db: invoice_item.get_items_by_invoice(db, k["invoice_id"])),
+        ("invoice_item.get_distinct_items_for_mart",
+         lambda db: invoice_item.get_distinct_items_for_mart(db, mart)),
+        ("invoice_item.delete_invoice_item",
+         lambda db: invoice_item.delete_invoice_item(db, k["invoice_item_id"])),
+        ("invoice.delete_invoice", lambda db: invoice.delete_invoice(db, k["invoice_id"])),
+        ("stock_entry.delete_stock_entry",
+         lambda db: stock_entry.delete_stock_entry(db, k["stock_entry_id"])),
+        ("rejection_entry.get_rejections_by_date_and_items",
+         lambda db: rejection_entry.get_rejections_by_date_and_items(db, day, [k["item_id"]])),
+        ("reports.get_inventory_report", lambda db: reports.get_inventory_report(db, k["item_id"])),
+        ("reports.get_pnl_report (fresh)",
+         lambda db: reports.get_pnl_report(db, str(day), str(day + timedelta(days=6)), fresh=True)),
+        ("pnl_summary.refresh_pnl_summary", refresh_pnl_summary),
+        ("sync.get_changes (last hour)", lambda db: sync.get_changes(db, since=sync.encode_token(
+            dict.fromkeys([*sync.SYNCED_TABLES, sync.DELETED], (k["now"] - timedelta(hours=1), 0))))),
+    ]
+
+
+def seq_scans(plan: dict):
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", ()):
+        yield from seq_scans(child)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--min-rows", type=int, default=10_000)
+    parser.add_argument("--no-seed", action="store_true")
+    parser.add_argument("--verbose", action="store_true", help="print offending statements")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name != "postgresql":
+        parser.error("EXPLAIN checks need a Postgres database")
+    if not args.no_seed:
+        seed(engine, args.rows)
+
+    captured = []
+    capturing = False
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if capturing and verb in ("SELECT", "UPDATE", "DELETE", "WITH"):
+            captured.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    failures = 0
+    with engine.connect() as conn:
+        sizes = dict(conn.execute(text(
+            "SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r'"
+        )).all())
+        keys = sample(conn)
+        conn.rollback()
+        outer = conn.begin()
+        db = Session(bind=conn, join_transaction_mode="create_savepoint", autoflush=False)
+        # in-memory lookups load whole (small) tables once; warm them up
+        item_index.ensure_loaded(db)
+        conversion_graph.ensure_loaded(db)
+        for label, call in checks(keys):
+            captured.clear()
+            capturing = True
+            try:
+                call(db)
+            finally:
+                capturing = False
+            scanned = set()
+            for statement, parameters in captured:
+                plan = conn.exec_driver_sql(
+                    "EXPLAIN (FORMAT JSON) " + statement, parameters
+                ).scalar()
+                large = {
+                    t for t in seq_scans(plan[0]["Plan"]) if sizes.get(t, 0) >= args.min_rows
+                }
+                if large and args.verbose:
+                    print(f"{statement}\n  {parameters}")
+                scanned |= large
+            status = "FAIL" if scanned else "ok"
+            failures += bool(scanned)
+            detail = f"  seq scan on {', '.join(sorted(scanned))}" if scanned else ""
+            print(f"  {status:4} {label:54} {len(captured):3d} statements{detail}")
+        db.close()
+        outer.rollback()
+    engine.dispose()
+    print("no sequential scans on large tables" if not failures else f"{failures} calls scanned large tables")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
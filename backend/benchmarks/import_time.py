@@ -0,0 +1,105 @@
+"""
+Benchmark: import time of the API app and the commands.
+
+Imports each module in a fresh interpreter with `python -X importtime`,
+which is what a uvicorn worker or a `python -m app.commands...` run pays
+before doing any work, and prints the cumulative import time with the
+slowest packages it pulled in. pandas, pdfplumber, pyarrow and numpy
+are only needed to parse invoices and are imported on first use; the
+run fails if any of them is loaded at import time.
+
+Run from backend/:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module app.main --top 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULES = (
+    "app.main",
+    "app.commands.migrate",
+    "app.commands.pnl_summary",
+    "app.commands.stock_balance",
+    "app.commands.sync_tombstones",
+)
+# loaded by the invoice parser only
+DEFERRED = ("pandas", "pdfplumber", "pyarrow", "numpy")
+
+
+def import_profile(module: str, env: dict) -> Tuple[float, Dict[str, float]]:
+    """
+    Import `module` in a new interpreter.
+
+    Returns:
+        Tuple[float, Dict[str, float]]: Cumulative seconds for `module`
+        and for every module it imported, by module name.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.exit(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    cumulative: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time: <self us> | <cumulative us> | <indented name>"
+        _, cum, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cum) / 1e6
+    return cumulative[module], cumulative
+
+
+def top_level(cumulative: Dict[str, float], module: str, count: int) -> List[Tuple[str, float]]:
+    packages: Dict[str, float] = {}
+    for name, seconds in cumulative.items():
+        root = name.split(".")[0]
+        if name == module or root == "app":
+            continue
+        packages[root] = max(packages.get(root, 0.0), seconds)
+    return sorted(packages.items(), key=lambda p: -p[1])[:count]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", action="append", help="module to import (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite:///./import_time.db")
+    env.setdefault("JWT_SECRET_KEY", "bench")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (os.getcwd(), env.get("PYTHONPATH"))))
+
+    failed = []
+    for module in args.module or DEFAULT_MODULES:
+        runs = [import_profile(module, env) for _ in range(args.repeat)]
+        totals = [total for total, _ in runs]
+        cumulative = runs[-1][1]
+        print(
+            f"{module}: median {statistics.median(totals) * 1000:.0f} ms, "
+            f"min {min(totals) * 1000:.0f} ms ({args.repeat} runs)"
+        )
+        for name, seconds in top_level(cumulative, module, args.top):
+            print(f"    {name:28s} {seconds * 1000:8.1f} ms")
+        loaded = [name for name in DEFERRED if name in cumulative]
+        if loaded:
+            print(f"    imported at start-up: {', '.join(loaded)}")
+            failed.append(module)
+
+    if failed:
+        print(f"\nheavy dependencies imported by: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Load test: async read routes against their old sync versions.
+
+Serves the API with uvicorn (one worker) plus "sync" twins of a few read
+routes that call the same services through `get_db` in the threadpool,
+as every read route did before the AsyncSession port. Many concurrent
+clients then hit each route for a fixed time and the script reports
+throughput and p50/p99 latency.
+
+Run from backend/ against a seeded Postgres database:
+    python -m benchmarks.load_async_routes --database-url postgresql://...
+    python -m benchmarks.load_async_routes --database-url ... --clients 200 --duration 15
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+import httpx
+
+
+def create_app():
+    """
+    The API plus sync twins, served by uvicorn in a subprocess. Imports
+    happen here so the parent process needs no DATABASE_URL; there are no
+    startup migrations or seeding.
+    """
+    from fastapi import Depends, FastAPI, Query
+    from sqlalchemy.orm import Session
+
+    from app.api import router as api_router
+    from app.db.schemas.batch import BatchRead
+    from app.db.schemas.pnl_summary import PnlSummaryRead
+    from app.db.session import get_db
+    from app.services.batch import get_all_batches
+    from app.services.reports import get_pnl_report
+
+    app = FastAPI()
+    app.include_router(api_router)
+
+    @app.get("/sync/batch/", response_model=List[BatchRead])
+    def sync_batches(limit: int = 100, db: Session = Depends(get_db)):
+        return get_all_batches(db, limit=limit).items
+
+    @app.get("/sync/reports/pnl", response_model=List[PnlSummaryRead])
+    def sync_pnl(
+        start: Optional[str] = Query(None),
+        end: Optional[str] = Query(None),
+        db: Session = Depends(get_db),
+    ):
+        return get_pnl_report(db, start, end)
+
+    return app
+
+
+# (label, async path, sync twin path)
+ROUTES = [
+    ("batch list", "/v1/batch/?limit=100", "/sync/batch/?limit=100"),
+    (
+        "pnl report",
+        "/v1/reports/pnl?start=2024-01-01&end=2024-03-31",
+        "/sync/reports/pnl?start=2024-01-01&end=2024-03-31",
+    ),
+]
+
+
+async def hammer(base_url: str, path: str, clients: int, duration: float):
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as c:
+
+        async def client() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    r = await c.get(path)
+                    ok = r.status_code == 200
+                except httpx.TimeoutException:
+                    ok = False
+                errors += not ok
+                latencies.append(time.perf_counter() - start)
+
+        # warm the connection pools
+        await asyncio.gather(*(c.get(path) for _ in range(min(clients, 20))))
+        deadline = time.perf_counter() + duration
+        began = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        elapsed = time.perf_counter() - began
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / elapsed, statistics.median(latencies), p99, errors
+
+
+def wait_until_up(base_url: str, proc: subprocess.Popen) -> None:
+    for _ in range(100):
+        if proc.poll() is not None:
+            sys.exit("uvicorn exited during start-up")
+        try:
+            httpx.get(base_url + "/docs", timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    sys.exit("uvicorn did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    env = dict(os.environ, DATABASE_URL=args.database_url)
+    env.setdefault("JWT_SECRET_KEY", "bench")
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "benchmarks.load_async_routes:create_app",
+            "--factory", "--port", str(args.port), "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        wait_until_up(base_url, proc)
+        print(f"{args.clients} clients, {args.duration:.0f} s per run")
+        for label, async_path, sync_path in ROUTES:
+            for mode, path in (("sync", sync_path), ("async", async_path)):
+                rps, p50, p99, errors = asyncio.run(
+                    hammer(base_url, path, args.clients, args.duration)
+                )
+                print(
+                    f"  {label:11s} {mode:5s}: {rps:7.1f} req/s  "
+                    f"p50 {p50 * 1000:7.1f} ms  p99 {p99 * 1000:7.1f} ms"
+                    + (f"  {errors} errors" if errors else "")
+                )
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == "__main__":
+    main()
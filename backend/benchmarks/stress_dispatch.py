@@ -0,0 +1,194 @@
+"""
+Stress test: concurrent single-batch dispatches against one batch.
+
+Worker threads, each with its own session, dispatch small quantities from
+the same batch to the same mart (on distinct dates) until the batch runs
+dry. The "legacy" path reproduces the old read-check-decrement flow with
+three commits per dispatch; "atomic" is `create_dispatch_entry`. After
+each run the script checks that stock never went negative and that the
+batch, the dispatch rows, the order, the inventory ledger and
+stock_balance agree.
+
+Run from backend/ (SQLite file by default; pass a Postgres URL for row locks):
+    python -m benchmarks.stress_dispatch --workers 8 --stock 400
+    python -m benchmarks.stress_dispatch --database-url postgresql://...
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+import app.db.models  # noqa: F401  (registers every table)
+from app.core.exceptions import AppException
+from app.db.models.base_class import Base
+from app.db.models.batch import Batch
+from app.db.models.dispatch_entry import DispatchEntry
+from app.db.models.inventory_txn import InventoryTxn
+from app.db.models.item import Item
+from app.db.models.order import Order
+from app.db.models.stock_balance import StockBalance
+from app.db.schemas.dispatch_entry import DispatchEntryCreate
+from app.services.dispatch_entry import create_dispatch_entry
+
+MART = "STRESS MART"
+
+
+def legacy_dispatch(db, entry: DispatchEntryCreate) -> None:
+    batch = db.get(Batch, entry.batch_id)
+    if batch.quantity < entry.quantity:
+        raise AppException("Not enough stock", status_code=400)
+    dispatch = DispatchEntry(
+        batch_id=entry.batch_id,
+        item_id=entry.item_id,
+        mart_name=entry.mart_name,
+        dispatch_date=entry.dispatch_date,
+        quantity=entry.quantity,
+        unit=entry.unit,
+    )
+    db.add(dispatch)
+    batch.quantity -= entry.quantity
+    order = db.scalar(
+        select(Order).where(
+            Order.item_id == entry.item_id,
+            Order.mart_name == entry.mart_name,
+            Order.status != "Completed",
+        )
+    )
+    if order:
+        order.quantity_dispatched = (order.quantity_dispatched or 0) + entry.quantity
+        db.commit()
+    db.flush()
+    db.commit()
+    db.add(
+        InventoryTxn(
+            item_id=entry.item_id,
+            batch_id=entry.batch_id,
+            txn_type="OUT",
+            raw_qty=entry.quantity,
+            raw_unit=entry.unit,
+            base_qty=entry.quantity,
+            base_unit=entry.unit,
+            ref_type="dispatch_entry",
+            ref_id=dispatch.id,
+        )
+    )
+    db.commit()
+
+
+def setup(session_factory, stock: int):
+    with session_factory() as db:
+        for model in (StockBalance, InventoryTxn, DispatchEntry, Order, Batch, Item):
+            db.query(model).delete()
+        item = Item(name="STRESS ITEM", item_code="STRESS")
+        db.add(item)
+        db.flush()
+        batch = Batch(item_id=item.id, quantity=stock, unit="KG")
+        order = Order(
+            item_id=item.id,
+            mart_name=MART,
+            order_date=date.today(),
+            quantity_ordered=stock * 10,
+            quantity_dispatched=0,
+            status="Pending",
+            unit="KG",
+        )
+        db.add_all([batch, order])
+        db.commit()
+        return item.id, batch.id
+
+
+def run(session_factory, fn, workers: int, stock: int, quantity: int):
+    item_id, batch_id = setup(session_factory, stock)
+    counter = iter(range(10**9))
+    lock = threading.Lock()
+    stats = {"ok": 0, "rejected": 0, "errors": 0}
+
+    def worker():
+        with session_factory() as db:
+            misses = 0
+            while misses < 3:
+                with lock:
+                    day = next(counter)
+                entry = DispatchEntryCreate(
+                    batch_id=batch_id,
+                    item_id=item_id,
+                    mart_name=MART,
+                    dispatch_date=date(2020, 1, 1) + timedelta(days=day),
+                    quantity=quantity,
+                    unit="KG",
+                )
+                try:
+                    fn(db, entry)
+                    outcome = "ok"
+                except AppException:
+                    outcome, misses = "rejected", misses + 1
+                except Exception:
+                    outcome, misses = "errors", misses + 1
+                    db.rollback()
+                with lock:
+                    stats[outcome] += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    with session_factory() as db:
+        remaining = db.get(Batch, batch_id).quantity
+        dispatched = db.scalar(select(func.coalesce(func.sum(DispatchEntry.quantity), 0)))
+        ledger = db.scalar(select(func.coalesce(func.sum(InventoryTxn.raw_qty), 0)))
+        ordered = db.scalar(select(Order.quantity_dispatched))
+        balance = db.scalar(select(func.coalesce(func.sum(StockBalance.quantity), 0)))
+    return {
+        **stats,
+        "elapsed": elapsed,
+        "remaining": remaining,
+        "dispatched": dispatched,
+        "oversold": max(0, dispatched - stock),
+        "consistent": remaining >= 0
+        and stock - remaining == dispatched == ledger == ordered == -balance,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--stock", type=int, default=400)
+    parser.add_argument("--quantity", type=int, default=1)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    tmp = None
+    url = args.database_url
+    if not url:
+        tmp = tempfile.mkdtemp()
+        url = f"sqlite:///{os.path.join(tmp, 'stress.db')}"
+    connect_args = {"timeout": 30, "check_same_thread": False} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args, pool_size=args.workers + 2)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    print(f"{args.workers} workers, stock {args.stock}, {args.quantity} per dispatch ({engine.dialect.name})")
+    for label, fn in (("legacy", legacy_dispatch), ("atomic", create_dispatch_entry)):
+        r = run(session_factory, fn, args.workers, args.stock, args.quantity)
+        print(
+            f"  {label:7}: {r['ok']:5d} ok  {r['rejected']:4d} rejected  {r['errors']:4d} errors  "
+            f"{r['ok'] / r['elapsed']:8.1f} dispatch/s  remaining {r['remaining']}  "
+            f"oversold {r['oversold']}  consistent={r['consistent']}"
+        )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Synthetic Reliance-style invoice PDFs for benchmarks.
+Writes ruled tables directly as PDF drawing operators, so no PDF
+authoring library is needed. The layout matches what
+`app.utils.invoice_parser_reliance` expects.
+"""
+
+import os
+import random
+from datetime import date
+from typing import List, Optional
+
+PAGE_WIDTH = 842
+PAGE_HEIGHT = 595
+ROW_HEIGHT = 12
+MARGIN = 20
+COL_WIDTHS = [70, 50, 45, 150, 45, 30, 45, 55, 55, 55, 70]
+ROWS_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // ROW_HEIGHT
+HEADER = [
+    "Sr.No",
+    "HSN Code",
+    "Article",
+    "Description",
+    "Qty",
+    "UOM",
+    "MRP",
+    "Rate",
+    "Disc",
+    "Tax",
+    "Amount",
+]
+PRODUCTS = [
+    ("590000001", "APPLE FUJI IMP USA (KG)", "KG"),
+    ("590000003", "APPLE GRANNY SMITH USA (KG)", "KG"),
+    ("590000842", "APPLE PINK LADY NZ (KG )", "KG"),
+    ("590003579", "AVACADO", "EA"),
+    ("590004229", "BABY CORN PEELED 200 GM", "EA"),
+    ("590000012", "BANANA ROBUSTA (KG)", "KG"),
+    ("590000215", "DRAGON FRUIT (WHITE FLESH)", "EA"),
+    ("590000077", "KIWI IMP (EA)", "EA"),
+    ("590000101", "ORANGE IMP (KG)", "KG"),
+    ("590000160", "POMEGRANATE (KG)", "KG"),
+]
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _row_ops(y: float, cells: List[str]) -> List[str]:
+    ops = []
+    x = MARGIN
+    for width, text in zip(COL_WIDTHS, cells):
+        ops.append(f"{x} {y} {width} {ROW_HEIGHT} re S")
+        if text:
+            ops.append(f"BT /F1 6 Tf {x + 2} {y + 3} Td ({_escape(text)}) Tj ET")
+        x += width
+    return ops
+
+
+def _item_row(sr_no: int, rng: random.Random) -> List[str]:
+    code, name, uom = rng.choice(PRODUCTS)
+    qty = round(rng.uniform(1, 250), 2)
+    rate = round(rng.uniform(20, 400), 2)
+    return [
+        str(sr_no),
+        "08081000",
+        code,
+        name,
+        f"{qty:,.2f}",
+        uom,
+        "0.00",
+        f"{rate:,.2f}",
+        "0.00",
+        "0.00",
+        f"{qty * rate:,.2f}",
+    ]
+
+
+def build_invoice_rows(
+    line_items: int, invoice_date: date, store: str, seed: int = 0
+) -> List[List[List[str]]]:
+    """
+    Lay out the invoice as a list of pages, each a list of table rows.
+    """
+    rng = random.Random(seed)
+    blank = [""] * len(HEADER)
+    meta = [list(blank) for _ in range(8)]
+    meta[0][0] = "Reliance Retail Limited"
+    meta[0][2] = f"Dt. {invoice_date:%d.%m.%Y}"
+    meta[3][3] = "Site Name"
+    meta[4][3] = store
+
+    pages = [meta + [list(HEADER)]]
+    for sr_no in range(1, line_items + 1):
+        if len(pages[-1]) >= ROWS_PER_PAGE:
+            pages.append([list(HEADER)])
+        pages[-1].append(_item_row(sr_no, rng))
+    if len(pages[-1]) >= ROWS_PER_PAGE:
+        pages.append([list(HEADER)])
+    pages[-1].append(["Grand Total of Qty"] + [""] * (len(HEADER) - 1))
+    return pages
+
+
+def write_invoice_pdf(
+    path: str,
+    line_items: int = 200,
+    invoice_date: Optional[date] = None,
+    store: str = "RELIANCE FRESH KORAMANGALA",
+    seed: int = 0,
+) -> str:
+    """
+    Write a synthetic multi-page Reliance invoice to `path`.
+    """
+    pages = build_invoice_rows(line_items, invoice_date or date(2025, 6, 6), store, seed)
+    streams = []
+    for rows in pages:
+        ops = ["0.5 w"]
+        for index, cells in enumerate(rows):
+            y = PAGE_HEIGHT - MARGIN - (index + 1) * ROW_HEIGHT
+            ops.extend(_row_ops(y, cells))
+        streams.append("\n".join(ops).encode("latin-1"))
+
+    # object 1: catalog, 2: pages, 3: font, then (page, content) pairs
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for stream in streams:
+        page_id = len(objects) + 1
+        kids.append(f"{page_id} 0 R")
+        objects.append(
+            (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                f"/CropBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+            ).encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    ).encode()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(out)
+    return path
+
+
+def write_corpus(
+    directory: str, count: int = 10, line_items: int = 200, seed: int = 0
+) -> List[str]:
+    """
+    Write `count` distinct synthetic invoices into `directory`.
+    """
+    return [
+        write_invoice_pdf(
+            os.path.join(directory, f"invoice_{n:04d}.pdf"),
+            line_items=line_items,
+            store=f"RELIANCE FRESH STORE {n % 7}",
+            seed=seed + n,
+        )
+        for n in range(count)
+    ]
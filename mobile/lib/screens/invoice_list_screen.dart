@@ -22,11 +22,10 @@ class _InvoiceListScreenState extends State<InvoiceListScreen> {
   List<String> _pickedPaths = [];
   List<Map<String, dynamic>> _uploadResults = [];
   bool _showUploadSection = false;
-  int _page = 1;
+  String? _cursor;
   int _pageSize = 20;
   bool _hasMore = true;
   bool _isLoadingMore = false;
-  int _totalInvoices = 0; // Added state variable for total invoices
 
   @override
   void initState() {
@@ -50,7 +49,7 @@ class _InvoiceListScreenState extends State<InvoiceListScreen> {
       setState(() {
         _loading = true;
         _error = null;
-        _page = 1;
+        _cursor = null;
         _hasMore = true;
         _invoices.clear();
       });
@@ -60,7 +59,7 @@ class _InvoiceListScreenState extends State<InvoiceListScreen> {
         date: _filterDate,
         martName: _filterMart,
         search: _search.isNotEmpty ? _search : null,
-        page: _page,
+        cursor: _cursor,
         pageSize: _pageSize,
       );
       final list = List<Map<String, dynamic>>.from(result['results']);
@@ -70,9 +69,8 @@ class _InvoiceListScreenState extends State<InvoiceListScreen> {
         } else {
           _invoices = list;
         }
-        _totalInvoices = result['total'] ?? 0; // Store total invoices
-        _hasMore = _invoices.length < _totalInvoices;
-        if (_hasMore) _page++;
+        _cursor = result['next_cursor'];
+        _hasMore = _cursor != null;
       });
     } catch (e) {
       setState(() => _error = e.toString());
@@ -539,7 +537,6 @@ class _InvoiceListScreenState extends State<InvoiceListScreen> {
                     style: const TextStyle(color: Colors.red),
                   ),
                 ),
-              // Text('Total: $_totalInvoices invoices'), // Show total invoices
 
               // Invoice List
               SizedBox(
@@ -6,13 +6,13 @@ class DispatchService {
   static Future<List<dynamic>> fetchDispatches({
     String? dispatchDate,
     String? martName,
-    int skip = 0,
+    String? cursor,
     int limit = 100,
   }) async {
     final params = {
       if (dispatchDate != null) 'dispatch_date': dispatchDate,
       if (martName != null) 'mart_name': martName,
-      'skip': skip,
+      if (cursor != null) 'cursor': cursor,
       'limit': limit,
     };
     final resp = await DioClient.instance.get(
@@ -10,11 +10,11 @@ class InvoiceService {
     DateTime? date,
     String? martName,
     String? search,
-    int page = 1,
+    String? cursor,
     int pageSize = 20,
   }) async {
     final params = <String, dynamic>{
-      'page': page,
+      if (cursor != null) 'cursor': cursor,
       'page_size': pageSize,
     };
     if (date != null) {
@@ -30,8 +30,7 @@ class InvoiceService {
     if (resp.statusCode == 200) {
       final data = resp.data;
       return {
-        'total': data['total'],
-        'page': data['page'],
+        'next_cursor': data['next_cursor'],
         'page_size': data['page_size'],
         'results': List<Map<String, dynamic>>.from(data['results']),
       };
@@ -8,17 +8,24 @@ class OrderService {
     String? martName,
   }) async {
     final dateStr = date.toIso8601String().split('T').first;
-    final params = {'order_date': dateStr};
+    final params = <String, dynamic>{'order_date': dateStr, 'limit': 500};
     if (martName != null) params['mart_name'] = martName;
 
-    final resp = await DioClient.instance.get(
-      '/orders/',
-      queryParameters: params,
-    );
-    if (resp.statusCode != 200) {
-      throw Exception('Failed to fetch orders');
+    // the list is paged; follow X-Next-Cursor until the last page
+    final orders = <Map<String, dynamic>>[];
+    while (true) {
+      final resp = await DioClient.instance.get(
+        '/orders/',
+        queryParameters: params,
+      );
+      if (resp.statusCode != 200) {
+        throw Exception('Failed to fetch orders');
+      }
+      orders.addAll(List<Map<String, dynamic>>.from(resp.data));
+      final cursor = resp.headers.value('x-next-cursor');
+      if (cursor == null) return orders;
+      params['cursor'] = cursor;
     }
-    return List<Map<String, dynamic>>.from(resp.data);
   }
 
   /// Fetch distinct mart names for dropdown
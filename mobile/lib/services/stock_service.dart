@@ -55,7 +55,7 @@ class StockService {
     try {
       final resp = await DioClient.instance.get(
         '/stock-entry/',
-        queryParameters: {'date': date, 'skip': 0, 'limit': 100},
+        queryParameters: {'date': date, 'limit': 500},
       );
       return resp.data as List<dynamic>;
     } on DioError catch (e) {
@@ -0,0 +1,58 @@
+import 'package:dio/dio.dart';
+import '../core/dio_client.dart';
+
+class SyncService {
+  static const tables = [
+    'items',
+    'batches',
+    'orders',
+    'dispatch_entries',
+    'stock_entries',
+  ];
+
+  /// Rows by table and id, kept up to date by [sync]
+  static final Map<String, Map<int, Map<String, dynamic>>> cache = {
+    for (final t in tables) t: <int, Map<String, dynamic>>{},
+  };
+  static String? _token;
+
+  /// Pull changes since the last sync (everything the first time) into
+  /// [cache]. Returns the number of rows created, updated or deleted.
+  static Future<int> sync() async {
+    var changed = 0;
+    while (true) {
+      final resp = await DioClient.instance.get(
+        '/sync',
+        queryParameters: {if (_token != null) 'since': _token},
+        options: Options(
+          validateStatus: (s) => s != null && (s < 300 || s == 410),
+        ),
+      );
+      if (resp.statusCode == 410) {
+        // token expired: start over with a full sync
+        _token = null;
+        for (final rows in cache.values) {
+          rows.clear();
+        }
+        continue;
+      }
+      final data = resp.data as Map<String, dynamic>;
+      for (final t in tables) {
+        final changes = data[t] as Map<String, dynamic>;
+        for (final key in ['created', 'updated']) {
+          for (final row in List<Map<String, dynamic>>.from(changes[key])) {
+            cache[t]![row['id'] as int] = row;
+            changed++;
+          }
+        }
+        // deletions after upserts: a row may be updated, then deleted
+        for (final id in List<int>.from(changes['deleted'])) {
+          cache[t]!.remove(id);
+          changed++;
+        }
+      }
+      _token = data['token'] as String;
+      if (data['has_more'] != true) return changed;
+    }
+  }
+}